@@ -20,16 +20,27 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 try:
+    from app.services.artifact_registry import find_latest_artifact
     from app.services.authorization import authorize_action, build_auth_audit_event
     from app.services.audit_store import append_audit_event
+    from app.services.bulk_generation import generate_documents_bulk, load_value_rows
+    from app.services.document_library import DocumentLibrary
     from app.services.download_contract import execute_with_retry_contract
-    from app.services.runtime_policy import load_runtime_policy_gate
+    from app.services.runtime_policy import RuntimePolicyRegistry
+    from app.services.search_backends import (
+        CompositeSearchBackend,
+        LocalCacheBackend,
+        SearchQuery,
+        SeleniumSearchBackend,
+    )
     from app.services.search_stability import (
         build_search_context,
         stable_sort_tenders,
         validate_download_scope,
     )
+    from app.services.submission_bundle import build_submission_bundle, size_limit
     from app.services.template_builder import extract_placeholders_from_docx, render_docx_template
+    from app.services.tracing import TRACE_FILE_NAME, span, trace, traced
     from app.services.ux_guidance import build_corrective_guidance
     from app.services.validation_engine import validate_required_inputs
     from app.services.workflow_router import route_action
@@ -37,8 +48,6 @@ try:
     from app.services.tender_search import (
         TenderRow,
         click_download_all_in_modal,
-        collect_tenders,
-        collect_all_pages,
         ensure_on_notices,
         find_dossier_on_pages,
         has_any_result_rows,
@@ -50,16 +59,27 @@ try:
         wait_for_result_rows,
     )
 except ImportError:
+    from services.artifact_registry import find_latest_artifact
     from services.authorization import authorize_action, build_auth_audit_event
     from services.audit_store import append_audit_event
+    from services.bulk_generation import generate_documents_bulk, load_value_rows
+    from services.document_library import DocumentLibrary
     from services.download_contract import execute_with_retry_contract
-    from services.runtime_policy import load_runtime_policy_gate
+    from services.runtime_policy import RuntimePolicyRegistry
+    from services.search_backends import (
+        CompositeSearchBackend,
+        LocalCacheBackend,
+        SearchQuery,
+        SeleniumSearchBackend,
+    )
     from services.search_stability import (
         build_search_context,
         stable_sort_tenders,
         validate_download_scope,
     )
+    from services.submission_bundle import build_submission_bundle, size_limit
     from services.template_builder import extract_placeholders_from_docx, render_docx_template
+    from services.tracing import TRACE_FILE_NAME, span, trace, traced
     from services.ux_guidance import build_corrective_guidance
     from services.validation_engine import validate_required_inputs
     from services.workflow_router import route_action
@@ -67,8 +87,6 @@ except ImportError:
     from services.tender_search import (
         TenderRow,
         click_download_all_in_modal,
-        collect_tenders,
-        collect_all_pages,
         ensure_on_notices,
         find_dossier_on_pages,
         has_any_result_rows,
@@ -87,11 +105,16 @@ MATRIX_FG = "#8CFF8C"
 MATRIX_ACCENT = "#00FF41"
 MATRIX_MUTED = "#5ECB74"
 COMPLIANCE_RULES_DIR = Path.cwd() / "compliance" / "rules"
+SEARCH_CACHE_PATH = Path.cwd() / "task_force" / "out" / "search_cache.json"
+SEARCH_CACHE_MAX_AGE_SEC = 5 * 60
+SEARCH_LATENCY_BUDGET_SEC = 180.0
+TRACE_PATH = Path.cwd() / "task_force" / "out" / TRACE_FILE_NAME
 
 
 class TenderSearchFrame(ttk.Frame):
-    def __init__(self, master):
+    def __init__(self, master, policy_registry: RuntimePolicyRegistry):
         super().__init__(master)
+        self.policy_registry = policy_registry
         self.var_keyword = tk.StringVar(value="Internet")
         self.var_download = tk.StringVar(value=str(Path.cwd() / "downloads"))
         self.var_headless = tk.BooleanVar(value=True)
@@ -113,6 +136,15 @@ class TenderSearchFrame(ttk.Frame):
         self.driver = None
         self.wait = None
         self._driver_lock = threading.Lock()
+        # Fresh cached answers first, then the live portal; the chain reorders by observed latency.
+        search_cache = LocalCacheBackend(SEARCH_CACHE_PATH, max_age_sec=SEARCH_CACHE_MAX_AGE_SEC)
+        self.search_engine = CompositeSearchBackend(
+            [search_cache, SeleniumSearchBackend(self.ensure_driver, self.log)],
+            mode="chain",
+            latency_budget_sec=SEARCH_LATENCY_BUDGET_SEC,
+            cache=search_cache,
+            log=self.log,
+        )
         self._build_ui()
         self.after(250, self.on_connect)
 
@@ -207,7 +239,9 @@ class TenderSearchFrame(ttk.Frame):
         self.log("INFO: Logs copied to clipboard.")
 
     def _enforce_runtime_policy(self, action: str) -> bool:
-        decision = load_runtime_policy_gate(COMPLIANCE_RULES_DIR).decide(action)
+        # Only rule files changed by a generator run since the last action are re-read.
+        self.policy_registry.apply_change_manifest()
+        decision = self.policy_registry.decide(action)
         active = ",".join(decision.active_rule_ids) if decision.active_rule_ids else "none"
         self.log(
             f"POLICY_GATE action={action} module={decision.module} "
@@ -245,8 +279,9 @@ class TenderSearchFrame(ttk.Frame):
         def work():
             t0 = time.perf_counter()
             try:
-                driver, wait = self.ensure_driver()
-                ensure_on_notices(driver, wait)
+                with trace("connect", export_path=TRACE_PATH, log=self.log):
+                    driver, wait = self.ensure_driver()
+                    ensure_on_notices(driver, wait)
                 self.log(f"INFO: Connected. ready_sec={time.perf_counter() - t0:.2f}")
             except Exception as exc:
                 self.log(f"ERROR: Connect failed: {exc}")
@@ -263,76 +298,78 @@ class TenderSearchFrame(ttk.Frame):
 
         def work():
             self.log("INFO: Running tender context extraction...")
-            cmd = [
-                sys.executable,
-                str(script_path),
-                "--input-dir",
-                "downloads",
-                "--out-dir",
-                "task_force/out/tender_context",
-                "--max-files",
-                "12",
-                "--context-template",
-                "task_force/templates/context_template_v2.docx",
-            ]
-            active_tender_id = self._resolve_active_tender_id_from_selection_or_cache()
-            if active_tender_id:
-                cmd.extend(["--tender-id", active_tender_id])
-                self.log(f"INFO: Context extraction scoped to tender: {active_tender_id}")
-            try:
-                result = subprocess.run(
-                    cmd,
-                    cwd=str(Path.cwd()),
-                    capture_output=True,
-                    text=True,
-                    check=False,
-                )
-                if result.stdout.strip():
-                    lines_to_log = self._filter_context_stdout_lines(
-                        result.stdout.strip().splitlines(),
-                        active_tender_id,
-                    )
-                    for line in lines_to_log:
-                        self.log(f"CTX: {line}")
-                if result.returncode != 0:
-                    if result.stderr.strip():
-                        self.log(f"ERROR: {result.stderr.strip()}")
-                    if notify_errors:
-                        messagebox.showerror("Extract failed", "Tender context extraction failed. Check logs.")
-                    return
-                self.log("INFO: Tender context extraction completed.")
+            with trace("context_extraction", export_path=TRACE_PATH, log=self.log):
+                cmd = [
+                    sys.executable,
+                    str(script_path),
+                    "--input-dir",
+                    "downloads",
+                    "--out-dir",
+                    "task_force/out/tender_context",
+                    "--max-files",
+                    "12",
+                    "--context-template",
+                    "task_force/templates/context_template_v2.docx",
+                    "--incremental",
+                ]
+                active_tender_id = self._resolve_active_tender_id_from_selection_or_cache()
+                if active_tender_id:
+                    cmd.extend(["--tender-id", active_tender_id])
+                    self.log(f"INFO: Context extraction scoped to tender: {active_tender_id}")
                 if auto_open_context_docx:
+                    # Hot path: only the context DOCX blocks opening; the other outputs follow in a second pass.
+                    if not self._run_context_extraction([*cmd, "--formats", "context_docx"], active_tender_id, notify_errors):
+                        return
+                    self.log("INFO: Tender context extraction completed.")
                     self.on_open_latest_context_docx(notify_if_missing=False)
-            except Exception as exc:
-                self.log(f"ERROR: Context extraction failed: {exc}")
-                if notify_errors:
-                    messagebox.showerror("Extract failed", str(exc))
+                    self.log("INFO: Generating remaining tender context outputs...")
+                    if self._run_context_extraction(cmd, active_tender_id, notify_errors=False):
+                        self.log("INFO: Remaining tender context outputs ready.")
+                    return
+                if self._run_context_extraction(cmd, active_tender_id, notify_errors):
+                    self.log("INFO: Tender context extraction completed.")
 
         threading.Thread(target=work, daemon=True).start()
 
+    @traced()
+    def _run_context_extraction(self, cmd: list[str], active_tender_id: str | None, notify_errors: bool) -> bool:
+        try:
+            result = subprocess.run(
+                cmd,
+                cwd=str(Path.cwd()),
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            if result.stdout.strip():
+                lines_to_log = self._filter_context_stdout_lines(
+                    result.stdout.strip().splitlines(),
+                    active_tender_id,
+                )
+                for line in lines_to_log:
+                    self.log(f"CTX: {line}")
+            if result.returncode != 0:
+                if result.stderr.strip():
+                    self.log(f"ERROR: {result.stderr.strip()}")
+                if notify_errors:
+                    messagebox.showerror("Extract failed", "Tender context extraction failed. Check logs.")
+                return False
+            return True
+        except Exception as exc:
+            self.log(f"ERROR: Context extraction failed: {exc}")
+            if notify_errors:
+                messagebox.showerror("Extract failed", str(exc))
+            return False
+
     def on_open_latest_context_docx(self, notify_if_missing: bool = True):
         out_dir = Path.cwd() / "task_force" / "out" / "tender_context"
         tender_id = self._resolve_active_tender_id_from_selection_or_cache()
-        files: list[Path] = []
-        if tender_id:
-            slug = tender_id.replace("-", "_")
-            files = sorted(
-                out_dir.glob(f"tender_context_{slug}_*.docx"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-        if not files:
-            files = sorted(
-                out_dir.glob("tender_context_*.docx"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-        if not files:
+        latest = find_latest_artifact(out_dir, ("context_docx",), tender_id)
+        if latest is None:
             self.log(f"INFO: No tender context DOCX found in: {out_dir}")
             if notify_if_missing:
                 messagebox.showinfo("No context DOCX", f"No context DOCX found in:\n{out_dir}")
             return
-        latest = files[0]
         try:
             if os.name == "nt":
                 os.startfile(str(latest))
@@ -375,30 +412,12 @@ class TenderSearchFrame(ttk.Frame):
     def on_open_latest_upload_hints(self, notify_if_missing: bool = True):
         out_dir = Path.cwd() / "task_force" / "out" / "tender_context"
         tender_id = self._resolve_active_tender_id_from_selection_or_cache()
-        xlsx_files: list[Path] = []
-        csv_files: list[Path] = []
-        if tender_id:
-            slug = tender_id.replace("-", "_")
-            xlsx_files = sorted(
-                out_dir.glob(f"upload_hints_{slug}_*.xlsx"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-            csv_files = sorted(
-                out_dir.glob(f"upload_hints_{slug}_*.csv"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-        if not xlsx_files and not csv_files:
-            xlsx_files = sorted(out_dir.glob("upload_hints_*.xlsx"), key=lambda p: p.stat().st_mtime, reverse=True)
-            csv_files = sorted(out_dir.glob("upload_hints_*.csv"), key=lambda p: p.stat().st_mtime, reverse=True)
-        files = xlsx_files if xlsx_files else csv_files
-        if not files:
+        latest = find_latest_artifact(out_dir, ("xlsx", "csv"), tender_id)
+        if latest is None:
             self.log(f"INFO: No upload hints found in: {out_dir}")
             if notify_if_missing:
                 messagebox.showinfo("No hints", f"No upload hints found in:\n{out_dir}")
             return
-        latest = files[0]
         try:
             if os.name == "nt":
                 os.startfile(str(latest))
@@ -412,26 +431,12 @@ class TenderSearchFrame(ttk.Frame):
     def on_open_latest_requirements_template(self, notify_if_missing: bool = True):
         out_dir = Path.cwd() / "task_force" / "out" / "tender_context"
         tender_id = self._resolve_active_tender_id_from_selection_or_cache()
-        files: list[Path] = []
-        if tender_id:
-            slug = tender_id.replace("-", "_")
-            files = sorted(
-                out_dir.glob(f"upload_requirements_template_{slug}_*.csv"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-        if not files:
-            files = sorted(
-                out_dir.glob("upload_requirements_template_*.csv"),
-                key=lambda p: p.stat().st_mtime,
-                reverse=True,
-            )
-        if not files:
+        latest = find_latest_artifact(out_dir, ("req",), tender_id)
+        if latest is None:
             self.log(f"INFO: No upload requirements template found in: {out_dir}")
             if notify_if_missing:
                 messagebox.showinfo("No template", f"No requirements template found in:\n{out_dir}")
             return
-        latest = files[0]
         try:
             if os.name == "nt":
                 os.startfile(str(latest))
@@ -610,127 +615,82 @@ class TenderSearchFrame(ttk.Frame):
         def work():
             self.log(f"SEARCH: {keyword}")
             try:
-                used_fallback = False
-                try:
-                    max_pages = max(1, int((self.var_max_pages.get() or "5").strip()))
-                except ValueError:
-                    max_pages = 5
-                    self.log("WARN: Invalid max pages value. Using 5.")
-                driver, wait = self.ensure_driver()
-                snapshot_dir = str(Path(self.var_download.get().strip() or str(Path.cwd() / "downloads")) / "debug")
-                ensure_on_notices(driver, wait)
-                open_search_panel(driver, wait, self.log)
-                search_keyword(driver, wait, keyword)
-                if self.var_collect_all_pages.get():
-                    self.results = collect_all_pages(
-                        driver,
-                        wait,
-                        self.log,
-                        max_pages=max_pages,
-                        snapshot_dir=snapshot_dir,
-                    )
-                else:
-                    wait_for_result_rows(
-                        driver,
-                        wait,
-                        self.log,
-                        attempts=3,
-                        base_delay_sec=1.2,
-                        snapshot_dir=snapshot_dir,
-                        max_total_wait_sec=8.0,
-                    )
-                    self.results = collect_tenders(driver, wait, self.log)
-
-                if len(self.results) == 0:
-                    self.log("INFO: No results after first keyword filter attempt. Retrying once.")
-                    # Reset form/page state and retry once.
-                    ensure_on_notices(driver, wait)
-                    open_search_panel(driver, wait, self.log)
-                    search_keyword(driver, wait, keyword)
-                    if self.var_collect_all_pages.get():
-                        self.results = collect_all_pages(
-                            driver,
-                            wait,
-                            self.log,
+                with trace("search", export_path=TRACE_PATH, log=self.log, keyword=keyword) as search_span:
+                    try:
+                        max_pages = max(1, int((self.var_max_pages.get() or "5").strip()))
+                    except ValueError:
+                        max_pages = 5
+                        self.log("WARN: Invalid max pages value. Using 5.")
+                    snapshot_dir = str(Path(self.var_download.get().strip() or str(Path.cwd() / "downloads")) / "debug")
+                    outcome = self.search_engine.run(
+                        SearchQuery(
+                            keyword=keyword,
+                            collect_all_pages=self.var_collect_all_pages.get(),
                             max_pages=max_pages,
                             snapshot_dir=snapshot_dir,
                         )
-                    else:
-                        wait_for_result_rows(
-                            driver,
-                            wait,
-                            self.log,
-                            attempts=3,
-                            base_delay_sec=1.2,
-                            snapshot_dir=snapshot_dir,
-                            max_total_wait_sec=8.0,
-                        )
-                        self.results = collect_tenders(driver, wait, self.log)
-
-                if len(self.results) == 0:
-                    # Final fallback: collect baseline rows without keyword filter.
+                    )
+                    self.results = outcome.rows
+                    used_fallback = outcome.used_fallback
                     self.log(
-                        "WARN: search_filter_failed=true; collecting baseline results without filter."
+                        f"SEARCH_SOURCE backend={outcome.backend} rows={len(outcome.rows)} "
+                        f"elapsed_sec={outcome.elapsed_sec:.2f}"
                     )
-                    ensure_on_notices(driver, wait)
-                    if self.var_collect_all_pages.get():
-                        self.results = collect_all_pages(
-                            driver,
-                            wait,
-                            self.log,
-                            max_pages=max_pages,
-                            snapshot_dir=snapshot_dir,
+                    for name, error in outcome.failures.items():
+                        self.log(f"WARN: search backend {name} failed: {type(error).__name__}: {error}")
+
+                    raw_count = len(self.results)
+                    raw_results = list(self.results)
+                    with span("post_filter", strict=self.var_strict_filter.get()):
+                        if self.var_strict_filter.get():
+                            self.results = self._post_filter_by_keyword(self.results, keyword)
+                        filtered_count = len(self.results)
+                    if self.var_strict_filter.get() and raw_count > 0 and filtered_count == 0:
+                        self.log(
+                            "INFO: Strict post-filter matched 0 rows. Disable strict filter to inspect raw rows."
+                        )
+                        for i, sample in enumerate(raw_results[:3], start=1):
+                            txt = (sample.row_text or sample.title or "")[:220]
+                            self.log(f"DEBUG_FILTER_SAMPLE[{i}]: {txt}")
+                    with span("stable_sort", rows=filtered_count):
+                        self.results = stable_sort_tenders(self.results)
+                    if filtered_count != raw_count:
+                        self.log(
+                            f"INFO: Applied strict keyword post-filter: {raw_count} -> {filtered_count} rows."
                         )
+                    elif not self.var_strict_filter.get():
+                        self.log("INFO: Strict keyword filter is OFF; showing unfiltered collected rows.")
+
+                    pages_scanned = max((r.source_page for r in self.results), default=0)
+                    if pages_scanned == 0 and raw_count > 0:
+                        pages_scanned = 1
+
+                    if used_fallback:
+                        self.var_search_mode.set("Mode: fallback baseline (search_filter_failed=true)")
                     else:
-                        self.results = collect_tenders(driver, wait, self.log)
-                    used_fallback = True
-
-                raw_count = len(self.results)
-                raw_results = list(self.results)
-                if self.var_strict_filter.get():
-                    self.results = self._post_filter_by_keyword(self.results, keyword)
-                filtered_count = len(self.results)
-                if self.var_strict_filter.get() and raw_count > 0 and filtered_count == 0:
-                    self.log(
-                        "INFO: Strict post-filter matched 0 rows. Disable strict filter to inspect raw rows."
+                        self.var_search_mode.set("Mode: filtered")
+                    self.var_search_quality.set(
+                        f"Quality: raw={raw_count} filtered={filtered_count} "
+                        f"fallback={'yes' if used_fallback else 'no'} pages={pages_scanned}"
                     )
-                    for i, sample in enumerate(raw_results[:3], start=1):
-                        txt = (sample.row_text or sample.title or "")[:220]
-                        self.log(f"DEBUG_FILTER_SAMPLE[{i}]: {txt}")
-                self.results = stable_sort_tenders(self.results)
-                if filtered_count != raw_count:
-                    self.log(
-                        f"INFO: Applied strict keyword post-filter: {raw_count} -> {filtered_count} rows."
+                    search_span.attributes.update(
+                        backend=outcome.backend, raw=raw_count, filtered=filtered_count, fallback=used_fallback
                     )
-                elif not self.var_strict_filter.get():
-                    self.log("INFO: Strict keyword filter is OFF; showing unfiltered collected rows.")
-
-                pages_scanned = max((r.source_page for r in self.results), default=0)
-                if pages_scanned == 0 and raw_count > 0:
-                    pages_scanned = 1
-
-                if used_fallback:
-                    self.var_search_mode.set("Mode: fallback baseline (search_filter_failed=true)")
-                else:
-                    self.var_search_mode.set("Mode: filtered")
-                self.var_search_quality.set(
-                    f"Quality: raw={raw_count} filtered={filtered_count} "
-                    f"fallback={'yes' if used_fallback else 'no'} pages={pages_scanned}"
-                )
-                self.last_search_context = build_search_context(
-                    keyword=keyword,
-                    match_mode=self.var_match_mode.get(),
-                    strict_filter=self.var_strict_filter.get(),
-                    rows=self.results,
-                )
-
-                self.tree.delete(*self.tree.get_children())
-                for row in self.results:
-                    self.tree.insert(
-                        "",
-                        "end",
-                        values=(row.index, row.title, row.institution, row.deadline, row.dossier_id),
+                    self.last_search_context = build_search_context(
+                        keyword=keyword,
+                        match_mode=self.var_match_mode.get(),
+                        strict_filter=self.var_strict_filter.get(),
+                        rows=self.results,
                     )
+
+                    with span("render_results", rows=len(self.results)):
+                        self.tree.delete(*self.tree.get_children())
+                        for row in self.results:
+                            self.tree.insert(
+                                "",
+                                "end",
+                                values=(row.index, row.title, row.institution, row.deadline, row.dossier_id),
+                            )
             except WebDriverException as exc:
                 self.var_search_mode.set("Mode: error")
                 self.log(f"ERROR: WebDriver: {exc}")
@@ -786,163 +746,167 @@ class TenderSearchFrame(ttk.Frame):
         def work():
             total_started = 0
             try:
-                driver, wait = self.ensure_driver()
-                keyword = (self.last_search_context or {}).get("keyword", "").strip()
-                try:
-                    max_pages = max(1, int((self.var_max_pages.get() or "5").strip()))
-                except ValueError:
-                    max_pages = 5
-
-                def prepare_download_scope() -> bool:
-                    # If search results are already present, reuse current context.
+                with trace("download", export_path=TRACE_PATH, log=self.log, dossiers=len(selected)):
+                    driver, wait = self.ensure_driver()
+                    keyword = (self.last_search_context or {}).get("keyword", "").strip()
                     try:
-                        if has_any_result_rows(driver):
-                            self.log("INFO: Reusing current results context for download scope.")
-                            return True
-                    except Exception:
-                        pass
+                        max_pages = max(1, int((self.var_max_pages.get() or "5").strip()))
+                    except ValueError:
+                        max_pages = 5
 
-                    for attempt in range(1, 4):
+                    @traced()
+                    def prepare_download_scope() -> bool:
+                        # If search results are already present, reuse current context.
                         try:
-                            ensure_on_notices(driver, wait)
-                            open_search_panel(driver, wait, self.log)
-                            if keyword:
-                                search_keyword(driver, wait, keyword)
-                                found_rows = wait_for_result_rows(
-                                    driver,
-                                    wait,
-                                    self.log,
-                                    attempts=3,
-                                    base_delay_sec=1.0,
-                                    snapshot_dir=str(
-                                        Path(
-                                            self.var_download.get().strip()
-                                            or str(Path.cwd() / "downloads")
-                                        )
-                                        / "debug"
-                                    ),
+                            if has_any_result_rows(driver):
+                                self.log("INFO: Reusing current results context for download scope.")
+                                return True
+                        except Exception:
+                            pass
+
+                        for attempt in range(1, 4):
+                            try:
+                                ensure_on_notices(driver, wait)
+                                open_search_panel(driver, wait, self.log)
+                                if keyword:
+                                    search_keyword(driver, wait, keyword)
+                                    found_rows = wait_for_result_rows(
+                                        driver,
+                                        wait,
+                                        self.log,
+                                        attempts=3,
+                                        base_delay_sec=1.0,
+                                        snapshot_dir=str(
+                                            Path(
+                                                self.var_download.get().strip()
+                                                or str(Path.cwd() / "downloads")
+                                            )
+                                            / "debug"
+                                        ),
+                                    )
+                                    if not found_rows:
+                                        raise RuntimeError("Search scope prepared but no rows became visible.")
+                                if not has_any_result_rows(driver):
+                                    raise RuntimeError("Search scope contains no visible result rows.")
+                                return True
+                            except Exception as exc:
+                                self.log(
+                                    f"WARN: prepare_download_scope attempt {attempt}/3 failed: "
+                                    f"{type(exc).__name__}: {exc}"
                                 )
-                                if not found_rows:
-                                    raise RuntimeError("Search scope prepared but no rows became visible.")
-                            if not has_any_result_rows(driver):
-                                raise RuntimeError("Search scope contains no visible result rows.")
-                            return True
-                        except Exception as exc:
-                            self.log(
-                                f"WARN: prepare_download_scope attempt {attempt}/3 failed: "
-                                f"{type(exc).__name__}: {exc}"
+                                time.sleep(1.0 * attempt)
+                        return False
+
+                    for idx, item_id in enumerate(selected, 1):
+                        _, title, institution, deadline, dossier_id = self.tree.item(item_id)["values"]
+                        visible_dossiers = {
+                            str(self.tree.item(i)["values"][4]) for i in self.tree.get_children()
+                        }
+                        if str(dossier_id) not in visible_dossiers:
+                            raise RuntimeError(
+                                "Download guard blocked dossier outside current visible filtered rows."
                             )
-                            time.sleep(1.0 * attempt)
-                    return False
-
-                for idx, item_id in enumerate(selected, 1):
-                    _, title, institution, deadline, dossier_id = self.tree.item(item_id)["values"]
-                    visible_dossiers = {
-                        str(self.tree.item(i)["values"][4]) for i in self.tree.get_children()
-                    }
-                    if str(dossier_id) not in visible_dossiers:
-                        raise RuntimeError(
-                            "Download guard blocked dossier outside current visible filtered rows."
-                        )
-                    self.log(f"DOWNLOAD [{idx}/{len(selected)}] {title} ({institution}) [{deadline}]")
+                        self.log(f"DOWNLOAD [{idx}/{len(selected)}] {title} ({institution}) [{deadline}]")
 
-                    def op(_: int) -> int:
-                        found = find_dossier_on_pages(
-                            driver, wait, dossier_id, self.log, max_pages=max_pages
-                        )
-                        if not found:
-                            self.log(
-                                "INFO: Dossier not found in current context, rebuilding keyword scope."
-                            )
-                            if not prepare_download_scope():
-                                raise RuntimeError("Could not prepare search scope for download.")
+                        @traced("download_attempt")
+                        def op(_: int) -> int:
                             found = find_dossier_on_pages(
                                 driver, wait, dossier_id, self.log, max_pages=max_pages
                             )
-                        if not found:
+                            if not found:
+                                self.log(
+                                    "INFO: Dossier not found in current context, rebuilding keyword scope."
+                                )
+                                if not prepare_download_scope():
+                                    raise RuntimeError("Could not prepare search scope for download.")
+                                found = find_dossier_on_pages(
+                                    driver, wait, dossier_id, self.log, max_pages=max_pages
+                                )
+                            if not found:
+                                raise RuntimeError(
+                                    f"Dossier not found on first {max_pages} pages in current search scope: {dossier_id}"
+                                )
+                            click_download_all_in_modal(driver, wait)
+                            time.sleep(1.0)
+
+                            if len(driver.window_handles) > 1:
+                                driver.switch_to.window(driver.window_handles[-1])
+
+                            started_local = handle_download_doc_without_login(driver, self.log)
+                            if started_local == 0 and username and password:
+                                if login_on_download_doc(driver, username, password, self.log):
+                                    try:
+                                        all_btn = WebDriverWait(driver, 5).until(
+                                            EC.element_to_be_clickable((By.ID, "ctl00_publicAccess_btnDownloadAll"))
+                                        )
+                                        all_btn.click()
+                                        time.sleep(1.2)
+                                    except Exception:
+                                        pass
+                                    started_local = handle_download_doc_without_login(driver, self.log)
+                            if started_local == 0:
+                                raise RuntimeError("No direct download links found.")
+                            return started_local
+
+                        with span("download_dossier", dossier_id=str(dossier_id)):
+                            result = execute_with_retry_contract(
+                                operation=op,
+                                max_attempts=2,
+                                on_event=lambda m, d=dossier_id: self.log(f"DOWNLOAD_STATE dossier={d} {m}"),
+                            )
+                        if result.status != "success":
+                            err_msg = result.error.user_message if result.error else "Unknown download error."
+                            guidance = build_corrective_guidance(
+                                error_code=(result.error.code if result.error else "unexpected_error"),
+                                action="download_selected",
+                                mode=self.var_process_mode.get(),
+                            )
+                            self.log(
+                                f"GUIDANCE code={guidance['error_code']} retry_safe={str(guidance['retry_safe']).lower()}"
+                            )
+                            for step in guidance["steps"]:
+                                self.log(f"GUIDANCE_STEP: {step}")
+                            append_audit_event(
+                                audit_file=self.audit_file,
+                                event_type="download_selected",
+                                actor=username or "anonymous",
+                                module="download",
+                                status="failed",
+                                dossier_id=str(dossier_id),
+                                metadata={
+                                    "institution": str(institution),
+                                    "deadline": str(deadline),
+                                    "attempts_used": result.attempts_used,
+                                    "error_code": result.error.code if result.error else "unknown",
+                                    "error_message": err_msg,
+                                },
+                            )
                             raise RuntimeError(
-                                f"Dossier not found on first {max_pages} pages in current search scope: {dossier_id}"
+                                f"Download failed for dossier {dossier_id}: {err_msg} "
+                                f"(attempts={result.attempts_used})"
                             )
-                        click_download_all_in_modal(driver, wait)
-                        time.sleep(1.0)
-
-                        if len(driver.window_handles) > 1:
-                            driver.switch_to.window(driver.window_handles[-1])
-
-                        started_local = handle_download_doc_without_login(driver, self.log)
-                        if started_local == 0 and username and password:
-                            if login_on_download_doc(driver, username, password, self.log):
-                                try:
-                                    all_btn = WebDriverWait(driver, 5).until(
-                                        EC.element_to_be_clickable((By.ID, "ctl00_publicAccess_btnDownloadAll"))
-                                    )
-                                    all_btn.click()
-                                    time.sleep(1.2)
-                                except Exception:
-                                    pass
-                                started_local = handle_download_doc_without_login(driver, self.log)
-                        if started_local == 0:
-                            raise RuntimeError("No direct download links found.")
-                        return started_local
-
-                    result = execute_with_retry_contract(
-                        operation=op,
-                        max_attempts=2,
-                        on_event=lambda m, d=dossier_id: self.log(f"DOWNLOAD_STATE dossier={d} {m}"),
-                    )
-                    if result.status != "success":
-                        err_msg = result.error.user_message if result.error else "Unknown download error."
-                        guidance = build_corrective_guidance(
-                            error_code=(result.error.code if result.error else "unexpected_error"),
-                            action="download_selected",
-                            mode=self.var_process_mode.get(),
-                        )
-                        self.log(
-                            f"GUIDANCE code={guidance['error_code']} retry_safe={str(guidance['retry_safe']).lower()}"
-                        )
-                        for step in guidance["steps"]:
-                            self.log(f"GUIDANCE_STEP: {step}")
+
+                        total_started += result.started_count
                         append_audit_event(
                             audit_file=self.audit_file,
                             event_type="download_selected",
                             actor=username or "anonymous",
                             module="download",
-                            status="failed",
+                            status="success",
                             dossier_id=str(dossier_id),
                             metadata={
                                 "institution": str(institution),
                                 "deadline": str(deadline),
                                 "attempts_used": result.attempts_used,
-                                "error_code": result.error.code if result.error else "unknown",
-                                "error_message": err_msg,
+                                "started_count": result.started_count,
                             },
                         )
-                        raise RuntimeError(
-                            f"Download failed for dossier {dossier_id}: {err_msg} "
-                            f"(attempts={result.attempts_used})"
-                        )
-
-                    total_started += result.started_count
-                    append_audit_event(
-                        audit_file=self.audit_file,
-                        event_type="download_selected",
-                        actor=username or "anonymous",
-                        module="download",
-                        status="success",
-                        dossier_id=str(dossier_id),
-                        metadata={
-                            "institution": str(institution),
-                            "deadline": str(deadline),
-                            "attempts_used": result.attempts_used,
-                            "started_count": result.started_count,
-                        },
-                    )
-                self.log(f"DONE: Started downloads: {total_started}")
-                inferred_tid = self._infer_recent_tender_id_from_downloads()
-                if inferred_tid:
-                    self.last_active_tender_id = inferred_tid
-                    self.log(f"INFO: Active tender inferred from recent downloads: {inferred_tid}")
-                self.on_extract_tender_context(auto_open_context_docx=True, notify_errors=False)
+                    self.log(f"DONE: Started downloads: {total_started}")
+                    inferred_tid = self._infer_recent_tender_id_from_downloads()
+                    if inferred_tid:
+                        self.last_active_tender_id = inferred_tid
+                        self.log(f"INFO: Active tender inferred from recent downloads: {inferred_tid}")
+                    self.on_extract_tender_context(auto_open_context_docx=True, notify_errors=False)
             except Exception as exc:
                 self.log(f"ERROR: Download failed: {exc}")
                 guidance = build_corrective_guidance(
@@ -1021,8 +985,9 @@ class TenderSearchFrame(ttk.Frame):
 
 
 class DocumentationFrame(ttk.Frame):
-    def __init__(self, master):
+    def __init__(self, master, policy_registry: RuntimePolicyRegistry):
         super().__init__(master)
+        self.policy_registry = policy_registry
         self.var_template = tk.StringVar(value="")
         self.var_output_dir = tk.StringVar(value=str(Path.cwd() / "generated_docs"))
         self.var_output_name = tk.StringVar(value="tender-document.docx")
@@ -1030,6 +995,9 @@ class DocumentationFrame(ttk.Frame):
         self.var_role = tk.StringVar(value="tender_procurement_specialist")
         self.var_process_mode = tk.StringVar(value="esjn")
         self.audit_file = Path.cwd() / "compliance" / "audit" / "events.jsonl"
+        # Portal upload limits in bytes, set from the profile; None means no limit is enforced.
+        self.portal_max_file_bytes: int | None = None
+        self.portal_max_bundle_bytes: int | None = None
         self._build_ui()
 
     def _build_ui(self):
@@ -1071,6 +1039,10 @@ class DocumentationFrame(ttk.Frame):
         actions.pack(fill="x", padx=8, pady=(0, 8))
         ttk.Button(actions, text="Scan placeholders", command=self.scan_placeholders).pack(side="left")
         ttk.Button(actions, text="Generate document", command=self.generate_document).pack(side="left", padx=6)
+        ttk.Button(actions, text="Generate batch (CSV/XLSX)...", command=self.generate_documents_batch).pack(
+            side="left"
+        )
+        ttk.Button(actions, text="Bundle workspace (ZIP)...", command=self.bundle_workspace).pack(side="left", padx=6)
 
         ttk.Label(self, text="Values (KEY=value, one per line):").pack(anchor="w", padx=8, pady=(0, 4))
         self.values_text = tk.Text(self, height=18, wrap="none")
@@ -1107,7 +1079,9 @@ class DocumentationFrame(ttk.Frame):
         self.log_text.config(state="disabled")
 
     def _enforce_runtime_policy(self, action: str) -> bool:
-        decision = load_runtime_policy_gate(COMPLIANCE_RULES_DIR).decide(action)
+        # Only rule files changed by a generator run since the last action are re-read.
+        self.policy_registry.apply_change_manifest()
+        decision = self.policy_registry.decide(action)
         active = ",".join(decision.active_rule_ids) if decision.active_rule_ids else "none"
         self.log(
             f"POLICY_GATE action={action} module={decision.module} "
@@ -1155,6 +1129,122 @@ class DocumentationFrame(ttk.Frame):
             self.log(f"ERROR: {exc}")
             messagebox.showerror("Error", str(exc))
 
+    def generate_documents_batch(self):
+        template_path = self.var_template.get().strip()
+        output_dir = self.var_output_dir.get().strip() or str(Path.cwd() / "generated_docs")
+        username = (self.var_username.get() or "").strip()
+        if not template_path:
+            messagebox.showwarning("Template missing", "Select a .docx template.")
+            return
+        rows_path = filedialog.askopenfilename(
+            title="Choose value rows",
+            filetypes=[("Value rows", "*.csv *.xlsx"), ("CSV", "*.csv"), ("Excel", "*.xlsx")],
+        )
+        if not rows_path:
+            return
+        route = self._authorize_generate_document(username)
+        if route is None:
+            return
+        required_fields = (
+            ["EPAZAR_OPERATOR_ID", "EPAZAR_CATALOG_ITEM", "EPAZAR_PROCUREMENT_REF"] if route.mode == "epazar" else None
+        )
+
+        def on_progress(row: dict) -> None:
+            if row["status"] == "generated":
+                self.log(f"GENERATED [{row['row']}]: {row['output_path']}")
+            else:
+                self.log(f"BATCH_ROW_FAILED [{row['row']}] {row['dossier_ref']}: {row['error']}")
+
+        def work():
+            try:
+                rows = load_value_rows(rows_path)
+                self.log(f"INFO: Batch generation started: rows={len(rows)} source={rows_path}")
+                summary = generate_documents_bulk(
+                    template_path,
+                    rows,
+                    output_dir,
+                    required_fields=required_fields,
+                    on_progress=on_progress,
+                )
+                self.log(
+                    f"BATCH_DONE generated={summary['generated']} failed={summary['failed']} "
+                    f"elapsed_sec={summary['elapsed_sec']} docs_per_sec={summary['docs_per_sec']}"
+                )
+                self.log(f"BATCH_MANIFEST: {summary['manifest_path']}")
+                append_audit_event(
+                    audit_file=self.audit_file,
+                    event_type="generate_document",
+                    actor=username or "anonymous",
+                    module="doc_builder",
+                    status="success" if not summary["failed"] else "partial",
+                    dossier_id=None,
+                    metadata={
+                        "template_path": template_path,
+                        "output_dir": output_dir,
+                        "rows_path": rows_path,
+                        "generated": summary["generated"],
+                        "failed": summary["failed"],
+                        "manifest_path": summary["manifest_path"],
+                    },
+                )
+                messagebox.showinfo(
+                    "Batch done",
+                    f"Generated {summary['generated']} of {summary['rows_total']} documents.\n{summary['manifest_path']}",
+                )
+            except Exception as exc:
+                self.log(f"ERROR: Batch generation failed: {exc}")
+                append_audit_event(
+                    audit_file=self.audit_file,
+                    event_type="generate_document",
+                    actor=username or "anonymous",
+                    module="doc_builder",
+                    status="failed",
+                    dossier_id=None,
+                    metadata={
+                        "template_path": template_path,
+                        "output_dir": output_dir,
+                        "rows_path": rows_path,
+                        "error_message": str(exc),
+                    },
+                )
+                messagebox.showerror("Batch failed", str(exc))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def bundle_workspace(self):
+        output_dir = self.var_output_dir.get().strip() or str(Path.cwd() / "generated_docs")
+        ws_dir = filedialog.askdirectory(title="Choose workspace folder", initialdir=output_dir)
+        if not ws_dir:
+            return
+
+        def on_progress(step: dict) -> None:
+            self.log(
+                f"BUNDLE [{step['files_done']}/{step['files_total']}] {step['filename']} "
+                f"{step['bytes_done']}/{step['bytes_total']} bytes"
+            )
+
+        def work():
+            try:
+                summary = build_submission_bundle(
+                    ws_dir,
+                    max_file_bytes=self.portal_max_file_bytes,
+                    max_bundle_bytes=self.portal_max_bundle_bytes,
+                    on_progress=on_progress,
+                )
+                self.log(
+                    f"BUNDLE_DONE: {summary['bundle_path']} files={summary['files']} "
+                    f"bytes={summary['bytes_out']} elapsed_sec={summary['elapsed_sec']}"
+                )
+                messagebox.showinfo("Bundle ready", f"Submission bundle saved:\n{summary['bundle_path']}")
+            except ValueError as exc:
+                self.log(f"VALIDATION_ERROR: {exc}")
+                messagebox.showerror("Bundle failed", str(exc))
+            except Exception as exc:
+                self.log(f"ERROR: Bundle failed: {exc}")
+                messagebox.showerror("Bundle failed", str(exc))
+
+        threading.Thread(target=work, daemon=True).start()
+
     def _parse_values(self) -> dict[str, str]:
         values: dict[str, str] = {}
         raw = self.values_text.get("1.0", "end").strip()
@@ -1167,15 +1257,11 @@ class DocumentationFrame(ttk.Frame):
             values[key.strip()] = value.strip()
         return values
 
-    def generate_document(self):
-        template_path = self.var_template.get().strip()
-        output_dir = self.var_output_dir.get().strip() or str(Path.cwd() / "generated_docs")
-        output_name = self.var_output_name.get().strip() or "tender-document.docx"
-        username = (self.var_username.get() or "").strip()
+    def _authorize_generate_document(self, username: str):
         role = (self.var_role.get() or "").strip()
         mapped_role = self._map_role_for_auth(role)
         if not self._enforce_runtime_policy("generate_document"):
-            return
+            return None
         route = route_action(self.var_process_mode.get(), "generate_document")
         self.log(
             f"WORKFLOW_ROUTE mode={route.mode} action=generate_document "
@@ -1183,7 +1269,7 @@ class DocumentationFrame(ttk.Frame):
         )
         if not route.allowed:
             messagebox.showerror("Workflow routing", route.message)
-            return
+            return None
         decision = authorize_action("generate_document", username, mapped_role)
         self.log(f"AUTH_ROLE_MAP ui_role={role or 'unset'} internal_role={mapped_role or 'unset'}")
         self.log(
@@ -1193,6 +1279,16 @@ class DocumentationFrame(ttk.Frame):
         )
         if not decision.allowed:
             messagebox.showerror("Authorization denied", decision.reason)
+            return None
+        return route
+
+    def generate_document(self):
+        template_path = self.var_template.get().strip()
+        output_dir = self.var_output_dir.get().strip() or str(Path.cwd() / "generated_docs")
+        output_name = self.var_output_name.get().strip() or "tender-document.docx"
+        username = (self.var_username.get() or "").strip()
+        route = self._authorize_generate_document(username)
+        if route is None:
             return
         if not template_path:
             messagebox.showwarning("Template missing", "Select a .docx template.")
@@ -1316,9 +1412,14 @@ class DocumentationFrame(ttk.Frame):
             "role": self.var_role.get(),
             "process_mode": self.var_process_mode.get(),
             "values_text": self.values_text.get("1.0", "end"),
+            "portal_max_file_bytes": self.portal_max_file_bytes,
+            "portal_max_bundle_bytes": self.portal_max_bundle_bytes,
         }
 
     def apply_profile_data(self, data: dict) -> None:
+        # Validated first so a bad limit does not leave a half-applied profile.
+        max_file_bytes = size_limit(data.get("portal_max_file_bytes"))
+        max_bundle_bytes = size_limit(data.get("portal_max_bundle_bytes"))
         self.var_template.set(data.get("template", self.var_template.get()))
         self.var_output_dir.set(data.get("output_dir", self.var_output_dir.get()))
         self.var_output_name.set(data.get("output_name", self.var_output_name.get()))
@@ -1330,6 +1431,148 @@ class DocumentationFrame(ttk.Frame):
         self.var_process_mode.set(data.get("process_mode", self.var_process_mode.get()))
         self.values_text.delete("1.0", "end")
         self.values_text.insert("1.0", data.get("values_text", ""))
+        self.portal_max_file_bytes, self.portal_max_bundle_bytes = max_file_bytes, max_bundle_bytes
+
+
+class LibraryFrame(ttk.Frame):
+    COLUMNS = ("Name", "Category", "Type", "Year", "Freshness", "Embedded date", "Path")
+    ALL = "(all)"
+
+    def __init__(self, master):
+        super().__init__(master)
+        self.library = DocumentLibrary(Path.cwd())
+        self._refreshing = False
+        self.var_category = tk.StringVar(value=self.ALL)
+        self.var_doc_type = tk.StringVar(value=self.ALL)
+        self.var_year = tk.StringVar(value=self.ALL)
+        self.var_freshness = tk.StringVar(value=self.ALL)
+        self.var_text = tk.StringVar(value="")
+        self.var_status = tk.StringVar(value="Library: not indexed")
+        self._build_ui()
+        self.apply_filters()
+        self.after(250, self.on_refresh)
+
+    def _build_ui(self):
+        top = ttk.Frame(self)
+        top.pack(fill="x", padx=8, pady=8)
+        self.filter_boxes: dict[str, ttk.Combobox] = {}
+        filters = (
+            ("Category:", "category", self.var_category),
+            ("Type:", "doc_type", self.var_doc_type),
+            ("Year:", "year_tag", self.var_year),
+            ("Freshness:", "freshness_status", self.var_freshness),
+        )
+        for col, (label, key, var) in enumerate(filters):
+            ttk.Label(top, text=label).grid(row=0, column=col * 2, sticky="w", padx=(10 if col else 0, 0))
+            box = ttk.Combobox(top, textvariable=var, values=(self.ALL,), width=16, state="readonly")
+            box.grid(row=0, column=col * 2 + 1, sticky="w")
+            box.bind("<<ComboboxSelected>>", lambda _event: self.apply_filters())
+            self.filter_boxes[key] = box
+        ttk.Label(top, text="Search:").grid(row=0, column=8, sticky="w", padx=(10, 0))
+        search = ttk.Entry(top, textvariable=self.var_text, width=28)
+        search.grid(row=0, column=9, sticky="w")
+        search.bind("<KeyRelease>", lambda _event: self.apply_filters())
+
+        btns = ttk.Frame(self)
+        btns.pack(fill="x", padx=8, pady=(0, 8))
+        ttk.Button(btns, text="Refresh index", command=self.on_refresh).pack(side="left")
+        ttk.Button(btns, text="Open selected", command=self.on_open_selected).pack(side="left", padx=6)
+        ttk.Label(btns, textvariable=self.var_status).pack(side="left", padx=(12, 0))
+
+        wrap = ttk.Frame(self)
+        wrap.pack(fill="both", expand=True, padx=8, pady=(0, 8))
+        self.tree = ttk.Treeview(wrap, columns=self.COLUMNS, show="headings", selectmode="browse")
+        widths = (360, 100, 60, 60, 120, 110, 420)
+        for col, width in zip(self.COLUMNS, widths):
+            self.tree.heading(col, text=col)
+            self.tree.column(col, width=width, anchor="w")
+        self.tree.tag_configure("Likely Outdated", foreground="#FF6B6B")
+        self.tree.tag_configure("Review", foreground="#FFD166")
+        self.tree.pack(side="left", fill="both", expand=True)
+        self.tree.bind("<Double-1>", lambda _event: self.on_open_selected())
+        yscroll = ttk.Scrollbar(wrap, orient="vertical", command=self.tree.yview)
+        yscroll.pack(side="right", fill="y")
+        self.tree.configure(yscroll=yscroll.set)
+
+    def _filter_value(self, var: tk.StringVar) -> str | None:
+        value = var.get()
+        return None if value == self.ALL else value
+
+    def apply_filters(self):
+        rows = self.library.query(
+            category=self._filter_value(self.var_category),
+            doc_type=self._filter_value(self.var_doc_type),
+            year_tag=self._filter_value(self.var_year),
+            freshness_status=self._filter_value(self.var_freshness),
+            text=self.var_text.get(),
+        )
+        self.tree.delete(*self.tree.get_children())
+        for entry in rows:
+            self.tree.insert(
+                "",
+                "end",
+                iid=entry.relative_path,
+                values=(
+                    entry.display_name,
+                    entry.category,
+                    entry.doc_type,
+                    entry.year_tag,
+                    entry.freshness_status,
+                    entry.embedded_creation_date,
+                    entry.relative_path,
+                ),
+                tags=(entry.freshness_status,),
+            )
+        self.var_status.set(f"Library: showing {len(rows)} of {len(self.library.entries)}")
+
+    def _show_refresh(self, library: DocumentLibrary, stats: dict[str, int]):
+        self.library = library
+        self._refreshing = False
+        for key, values in self.library.facets().items():
+            self.filter_boxes[key].configure(values=(self.ALL, *values))
+        self.apply_filters()
+        self.var_status.set(
+            self.var_status.get()
+            + f" (added={stats['added']} updated={stats['updated']} removed={stats['removed']})"
+        )
+
+    def _show_refresh_failed(self, message: str):
+        self._refreshing = False
+        self.var_status.set(f"Library: refresh failed: {message}")
+
+    def on_refresh(self):
+        if self._refreshing:
+            return
+        self._refreshing = True
+        root, index_path = self.library.root, self.library.index_path
+
+        def work():
+            # The filters keep querying the current library on the Tk thread; the
+            # refreshed copy replaces it there once it is complete.
+            try:
+                library = DocumentLibrary(root, index_path)
+                stats = library.refresh()
+            except Exception as exc:
+                message = str(exc)
+                self.after(0, lambda: self._show_refresh_failed(message))
+                return
+            self.after(0, lambda: self._show_refresh(library, stats))
+
+        self.var_status.set("Library: refreshing...")
+        threading.Thread(target=work, daemon=True).start()
+
+    def on_open_selected(self):
+        selected = self.tree.selection()
+        if not selected:
+            return
+        path = self.library.root / selected[0]
+        try:
+            if os.name == "nt":
+                os.startfile(str(path))
+            else:
+                messagebox.showinfo("Library document", str(path))
+        except Exception as exc:
+            messagebox.showerror("Open failed", str(exc))
 
 
 class ProcurementsApp(tk.Tk):
@@ -1374,10 +1617,14 @@ class ProcurementsApp(tk.Tk):
         notebook = ttk.Notebook(self)
         notebook.pack(fill="both", expand=True)
 
-        self.search_tab = TenderSearchFrame(notebook)
-        self.docs_tab = DocumentationFrame(notebook)
+        # One policy registry for all tabs, kept current from the rule change manifest.
+        self.policy_registry = RuntimePolicyRegistry(COMPLIANCE_RULES_DIR)
+        self.search_tab = TenderSearchFrame(notebook, self.policy_registry)
+        self.docs_tab = DocumentationFrame(notebook, self.policy_registry)
         notebook.add(self.search_tab, text="Tender Search")
         notebook.add(self.docs_tab, text="Documentation Builder")
+        self.library_tab = LibraryFrame(notebook)
+        notebook.add(self.library_tab, text="Document Library")
 
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Sequence
+
+REGISTRY_NAME = "artifact_registry.json"
+# The run history lives next to the registry so "open latest" lookups only parse the pointers.
+RUNS_NAME = "artifact_runs.json"
+REGISTRY_VERSION = 2
+
+# Artifact kinds written per tender group by extract_tender_context.py.
+ARTIFACT_FILE_PATTERNS = {
+    "json": "tender_context_{slug}_{stamp}.json",
+    "md": "tender_context_{slug}_{stamp}.md",
+    "context_docx": "tender_context_{slug}_{stamp}.docx",
+    "csv": "upload_hints_{slug}_{stamp}.csv",
+    "xlsx": "upload_hints_{slug}_{stamp}.xlsx",
+    "req": "upload_requirements_template_{slug}_{stamp}.csv",
+    "checklist": "simple_checklist_{slug}_{stamp}.md",
+    "checklist_docx": "simple_checklist_{slug}_{stamp}.docx",
+    "form_docx": "simple_form_{slug}_{stamp}.docx",
+}
+
+
+def tender_slug(tender_id: str) -> str:
+    return tender_id.replace("-", "_")
+
+
+def empty_registry() -> dict[str, Any]:
+    return {"version": REGISTRY_VERSION, "latest": {}, "latest_any": {}, "runs": []}
+
+
+_POINTER_CACHE: dict[str, tuple[int, int, dict[str, Any]]] = {}
+_POINTER_CACHE_LOCK = threading.Lock()
+
+
+def _read_json(path: Path) -> Any:
+    try:
+        return json.loads(path.read_text(encoding="utf-8-sig"))
+    except (OSError, ValueError):
+        return None
+
+
+def _runs_path(registry_path: Path) -> Path:
+    return registry_path.with_name(RUNS_NAME)
+
+
+def _parse_pointers(data: Any) -> dict[str, Any] | None:
+    # Version 1 registries kept the run log inline; their pointers are still valid.
+    if not isinstance(data, dict) or data.get("version") not in (1, REGISTRY_VERSION):
+        return None
+    return {"latest": data.get("latest") or {}, "latest_any": data.get("latest_any") or {}}
+
+
+def load_latest_pointers(path: str | Path) -> dict[str, Any]:
+    """
+    The ``latest``/``latest_any`` maps of the registry, without the run history.
+
+    Parsed once per file version: the result is cached while the file's size
+    and mtime are unchanged, so repeated lookups from the GUI cost one stat.
+    Callers must not mutate the returned dict.
+    """
+    registry_path = Path(path)
+    try:
+        stat_result = registry_path.stat()
+    except OSError:
+        return {"latest": {}, "latest_any": {}}
+    key = str(registry_path.resolve())
+    with _POINTER_CACHE_LOCK:
+        cached = _POINTER_CACHE.get(key)
+    if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+        return cached[2]
+    pointers = _parse_pointers(_read_json(registry_path)) or {"latest": {}, "latest_any": {}}
+    with _POINTER_CACHE_LOCK:
+        _POINTER_CACHE[key] = (stat_result.st_mtime_ns, stat_result.st_size, pointers)
+    return pointers
+
+
+def load_artifact_registry(path: str | Path) -> dict[str, Any]:
+    registry_path = Path(path)
+    data = _read_json(registry_path)
+    pointers = _parse_pointers(data)
+    if pointers is None:
+        return empty_registry()
+    runs = data.get("runs")
+    if not isinstance(runs, list):
+        runs = _read_json(_runs_path(registry_path))
+    return {
+        "version": REGISTRY_VERSION,
+        **pointers,
+        "runs": runs if isinstance(runs, list) else [],
+    }
+
+
+def _write_json(path: Path, data: Any) -> None:
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def save_artifact_registry(path: str | Path, registry: dict[str, Any]) -> None:
+    registry_path = Path(path)
+    registry_path.parent.mkdir(parents=True, exist_ok=True)
+    # History first: a crash in between leaves new runs with old pointers, never the reverse.
+    _write_json(_runs_path(registry_path), registry.get("runs", []))
+    _write_json(
+        registry_path,
+        {
+            "version": REGISTRY_VERSION,
+            "latest": registry.get("latest", {}),
+            "latest_any": registry.get("latest_any", {}),
+        },
+    )
+
+
+def register_artifacts(
+    registry: dict[str, Any],
+    tender_id: str,
+    stamp: str,
+    artifacts: dict[str, str],
+) -> None:
+    """Record one run's artifacts and move the latest pointers for each kind."""
+    if not artifacts:
+        return
+    latest = registry.setdefault("latest", {}).setdefault(tender_id, {})
+    latest_any = registry.setdefault("latest_any", {})
+    for kind, artifact_path in artifacts.items():
+        latest[kind] = str(artifact_path)
+        latest_any[kind] = {"tender_id": tender_id, "path": str(artifact_path)}
+
+    runs = registry.setdefault("runs", [])
+    for run in runs:
+        if run.get("tender_id") == tender_id and run.get("stamp") == stamp:
+            run.setdefault("artifacts", {}).update({k: str(v) for k, v in artifacts.items()})
+            return
+    runs.append({"tender_id": tender_id, "stamp": stamp, "artifacts": {k: str(v) for k, v in artifacts.items()}})
+
+
+def latest_artifact(
+    registry: dict[str, Any],
+    kinds: Sequence[str],
+    tender_id: str | None = None,
+) -> Path | None:
+    """
+    Return the newest registered artifact of the first available kind.
+
+    With ``tender_id`` only that tender's pointers are consulted; without it
+    the newest artifact of any tender is returned. Only pointers whose file
+    still exists are used.
+    """
+    if tender_id:
+        by_kind = registry.get("latest", {}).get(tender_id, {})
+        for kind in kinds:
+            candidate = by_kind.get(kind)
+            if candidate and Path(candidate).exists():
+                return Path(candidate)
+        return None
+    latest_any = registry.get("latest_any", {})
+    for kind in kinds:
+        candidate = (latest_any.get(kind) or {}).get("path")
+        if candidate and Path(candidate).exists():
+            return Path(candidate)
+    return None
+
+
+def _glob_latest(out_dir: Path, kinds: Sequence[str], slug: str) -> Path | None:
+    for kind in kinds:
+        pattern = ARTIFACT_FILE_PATTERNS[kind].format(slug=slug, stamp="*")
+        files = sorted(out_dir.glob(pattern), key=lambda p: p.stat().st_mtime, reverse=True)
+        if files:
+            return files[0]
+    return None
+
+
+def find_latest_artifact(
+    out_dir: str | Path,
+    kinds: Sequence[str],
+    tender_id: str | None = None,
+) -> Path | None:
+    """
+    Registry lookup with a directory scan fallback for outputs that predate
+    the registry (or when the registry file is missing).
+
+    A tender's own artifacts, registered or found on disk, always win over
+    another tender's; the newest artifact of any tender is the last resort.
+    """
+    root = Path(out_dir)
+    pointers = load_latest_pointers(root / REGISTRY_NAME)
+    if tender_id:
+        found = latest_artifact(pointers, kinds, tender_id) or _glob_latest(root, kinds, tender_slug(tender_id))
+        if found is not None:
+            return found
+    return latest_artifact(pointers, kinds) or _glob_latest(root, kinds, "*")
+
+
+def prune_artifact_runs(registry: dict[str, Any], keep_runs: int) -> list[Path]:
+    """
+    Delete artifacts of all but the newest ``keep_runs`` runs per tender.
+
+    Files still referenced by a latest pointer are kept even when their run
+    is dropped (a partial run may not have replaced every kind). Returns the
+    paths that were removed.
+    """
+    if keep_runs <= 0:
+        return []
+    referenced = {p for by_kind in registry.get("latest", {}).values() for p in by_kind.values()}
+    referenced.update(
+        entry.get("path") for entry in registry.get("latest_any", {}).values() if entry.get("path")
+    )
+
+    by_tender: dict[str, list[dict[str, Any]]] = {}
+    for run in registry.get("runs", []):
+        by_tender.setdefault(run.get("tender_id", ""), []).append(run)
+
+    kept_runs: list[dict[str, Any]] = []
+    removed: list[Path] = []
+    for runs in by_tender.values():
+        runs.sort(key=lambda run: run.get("stamp", ""))
+        stale, fresh = runs[:-keep_runs], runs[-keep_runs:]
+        kept_runs.extend(fresh)
+        for run in stale:
+            survivors = {}
+            for kind, artifact_path in run.get("artifacts", {}).items():
+                if artifact_path in referenced:
+                    survivors[kind] = artifact_path
+                    continue
+                path = Path(artifact_path)
+                try:
+                    path.unlink()
+                    removed.append(path)
+                except FileNotFoundError:
+                    continue
+                except OSError:
+                    survivors[kind] = artifact_path
+            if survivors:
+                kept_runs.append({**run, "artifacts": survivors})
+    kept_runs.sort(key=lambda run: (run.get("stamp", ""), run.get("tender_id", "")))
+    registry["runs"] = kept_runs
+    return removed
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import stat
+import threading
+from pathlib import Path
+from typing import Iterable
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore
+
+BLOB_DIR_NAME = ".blobs"
+_INCOMING_PREFIX = ".incoming."
+HASH_CHUNK_BYTES = 1024 * 1024
+# Linux FICLONE ioctl: copy-on-write clone on btrfs/xfs/overlay-capable filesystems.
+_FICLONE = 0x40049409
+
+_BLOB_MODE = stat.S_IREAD | stat.S_IRGRP | stat.S_IROTH
+
+_HASH_CACHE: dict[str, tuple[int, int, str]] = {}
+_HASH_CACHE_LOCK = threading.Lock()
+
+
+def _remember_hash(path: Path, value: str) -> None:
+    stat_result = path.stat()
+    with _HASH_CACHE_LOCK:
+        _HASH_CACHE[str(path.resolve())] = (stat_result.st_mtime_ns, stat_result.st_size, value)
+
+
+def _cached_hash(path: Path) -> str | None:
+    stat_result = path.stat()
+    with _HASH_CACHE_LOCK:
+        cached = _HASH_CACHE.get(str(path.resolve()))
+    if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+        return cached[2]
+    return None
+
+
+def sha256_file(path: str | Path, use_cache: bool = True) -> str:
+    """SHA-256 of a file, remembered per process while its mtime and size are unchanged."""
+    src = Path(path)
+    if use_cache:
+        cached = _cached_hash(src)
+        if cached is not None:
+            return cached
+    digest = hashlib.sha256()
+    with src.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    _remember_hash(src, value)
+    return value
+
+
+def copy_with_sha256(source: str | Path, dst: str | Path) -> tuple[str, int]:
+    """Copy ``source`` to ``dst`` (with metadata) hashing the bytes as they stream; returns (sha256, size)."""
+    src = Path(source)
+    target = Path(dst)
+    digest = hashlib.sha256()
+    size = 0
+    with src.open("rb") as fin, target.open("wb") as fout:
+        for chunk in iter(lambda: fin.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+            fout.write(chunk)
+            size += len(chunk)
+    shutil.copystat(src, target)
+    value = digest.hexdigest()
+    _remember_hash(src, value)
+    return value, size
+
+
+def blob_path(store_dir: str | Path, sha256: str) -> Path:
+    return Path(store_dir) / sha256[:2] / sha256
+
+
+def store_blob(store_dir: str | Path, source: str | Path) -> tuple[str, Path]:
+    """
+    Add ``source`` to the store unless identical content is already there.
+
+    The source is read once: it streams into a temporary file inside the
+    store, hashed on the way, and that file is renamed to its hash (or
+    dropped when the blob exists). A source whose hash this process already
+    knows, with an unchanged mtime and size, is not read at all when its blob
+    is present. Blobs are read-only: hardlinked workspace files share the
+    blob's inode, so an in-place edit of one workspace would otherwise change
+    them all.
+    """
+    src = Path(source)
+    store = Path(store_dir)
+    known = _cached_hash(src)
+    if known is not None and blob_path(store, known).exists():
+        return known, blob_path(store, known)
+    store.mkdir(parents=True, exist_ok=True)
+    tmp_path = store / f"{_INCOMING_PREFIX}{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        sha256, _ = copy_with_sha256(src, tmp_path)
+        target = blob_path(store, sha256)
+        if target.exists():
+            return sha256, target
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.chmod(tmp_path, _BLOB_MODE)
+        try:
+            os.replace(tmp_path, target)
+        except OSError:
+            # Another worker stored the same content first (Windows refuses to replace it).
+            if not target.exists():
+                raise
+        return sha256, target
+    finally:
+        _remove_existing(tmp_path)
+
+
+def prune_blobs(store_dir: str | Path, referenced: Iterable[str]) -> list[Path]:
+    """
+    Delete blobs whose hash is not in ``referenced`` and return their paths.
+
+    A blob that still has other hardlinks is kept even when unreferenced: some
+    workspace file outside the given references is using it. Files being
+    ingested (``.incoming.*``) are never touched.
+    """
+    store = Path(store_dir)
+    if not store.is_dir():
+        return []
+    keep = set(referenced)
+    removed: list[Path] = []
+    for shard in sorted(p for p in store.iterdir() if p.is_dir()):
+        for blob in sorted(shard.iterdir()):
+            if blob.name in keep or not blob.is_file() or blob.stat().st_nlink > 1:
+                continue
+            _remove_existing(blob)
+            removed.append(blob)
+        try:
+            shard.rmdir()
+        except OSError:
+            pass  # still holds blobs
+    return removed
+
+
+def _linked_blob(path: Path, store_dir: Path | None) -> Path | None:
+    """The blob in ``store_dir`` that ``path`` is a hardlink of, if any."""
+    if store_dir is None:
+        return None
+    blob = blob_path(store_dir, sha256_file(path))
+    if blob.exists() and os.path.samefile(blob, path) and blob.resolve() != path.resolve():
+        return blob
+    return None
+
+
+def _remove_existing(path: Path, store_dir: Path | None = None) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return
+    except PermissionError:
+        # Read-only files cannot be unlinked on Windows, and the flag belongs to the file,
+        # not the name: clearing it on a hardlink clears it on the blob as well. A link
+        # into ``store_dir`` is unlinked with the flag cleared and its blob is locked
+        # again right after; links to anything else are left alone.
+        if path.stat().st_nlink > 1:
+            blob = _linked_blob(path, store_dir)
+            if blob is None:
+                raise
+            os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+            try:
+                path.unlink()
+            finally:
+                os.chmod(blob, _BLOB_MODE)
+            return
+        os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+        path.unlink()
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with src.open("rb") as fin, dst.open("wb") as fout:
+            fcntl.ioctl(fout.fileno(), _FICLONE, fin.fileno())
+    except OSError:
+        _remove_existing(dst)
+        return False
+    shutil.copystat(src, dst)
+    os.chmod(dst, stat.S_IREAD | stat.S_IWRITE | stat.S_IRGRP | stat.S_IROTH)
+    return True
+
+
+def materialize_blob(blob: str | Path, dst: str | Path) -> str:
+    """
+    Place a blob at ``dst`` without duplicating its bytes where possible.
+
+    Tries a copy-on-write reflink, then a hardlink, then a plain copy, and
+    returns which one was used. An existing ``dst`` linked to another blob of
+    the same store (an attachment that changed since the last pack) is
+    replaced without leaving that blob writable.
+    """
+    src = Path(blob)
+    target = Path(dst)
+    if target.exists() and os.path.samefile(src, target):
+        return "hardlink"
+    # blob_path layout: <store>/<sha[:2]>/<sha>
+    _remove_existing(target, store_dir=src.parent.parent)
+    if _reflink(src, target):
+        return "reflink"
+    try:
+        os.link(src, target)
+        return "hardlink"
+    except OSError:
+        pass
+    shutil.copy2(src, target)
+    os.chmod(target, stat.S_IREAD | stat.S_IWRITE | stat.S_IRGRP | stat.S_IROTH)
+    return "copy"
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+from openpyxl import load_workbook
+
+from .template_builder import compile_docx_template
+from .workspace_pack import create_workspace_pack, workspace_name
+
+ATTACHMENT_PREFIX = "ATTACHMENT_REQUIRED_"
+
+
+def load_value_rows(path: str | Path) -> list[dict[str, str]]:
+    """Read value sets from a CSV or XLSX file; the first row holds placeholder names."""
+    source = Path(path)
+    if source.suffix.lower() == ".xlsx":
+        wb = load_workbook(source, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = [str(cell).strip() if cell is not None else "" for cell in next(rows, ())]
+            out = []
+            for raw in rows:
+                values = {
+                    key: "" if cell is None else str(cell).strip()
+                    for key, cell in zip(header, raw)
+                    if key
+                }
+                if any(values.values()):
+                    out.append(values)
+            return out
+        finally:
+            wb.close()
+    with source.open("r", encoding="utf-8-sig", newline="") as handle:
+        return [
+            {key.strip(): (value or "").strip() for key, value in row.items() if key}
+            for row in csv.DictReader(handle)
+            if any((value or "").strip() for value in row.values())
+        ]
+
+
+def _row_dossier_ref(values: dict[str, str], row_no: int) -> str:
+    return values.get("DOSSIER_ID") or values.get("TENDER_ID") or f"row-{row_no:03d}"
+
+
+def _row_attachments(values: dict[str, str]) -> tuple[list[str], list[str]]:
+    items = [(k, (v or "").strip()) for k, v in values.items() if k.startswith(ATTACHMENT_PREFIX)]
+    return [v for _, v in items if v], sorted(k for k, v in items if not v)
+
+
+def _render_row(template_path: str, output_path: str, values: dict[str, str]) -> str:
+    # Each worker process compiles the template once and reuses it for every row it renders.
+    compile_docx_template(template_path).render(output_path, values)
+    return output_path
+
+
+def generate_documents_bulk(
+    template_path: str | Path,
+    value_rows: list[dict[str, str]],
+    output_dir: str | Path,
+    max_workers: int | None = None,
+    required_fields: list[str] | None = None,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Render one document per value row and pack each into its own workspace.
+
+    Rows are validated up front against the compiled template's placeholders;
+    valid rows are rendered on a process pool (inline when ``max_workers`` is 1)
+    and each finished document is packed as soon as it is ready. A summary
+    manifest with per-row status and throughput is written to ``output_dir``.
+    """
+    started = time.perf_counter()
+    base = Path(output_dir)
+    docs_dir = base / "documents"
+    docs_dir.mkdir(parents=True, exist_ok=True)
+    compiled = compile_docx_template(template_path)
+    workers = max_workers or min(len(value_rows), os.cpu_count() or 1) or 1
+
+    results: list[dict[str, Any]] = []
+    pending: list[tuple[dict[str, Any], dict[str, str], list[str]]] = []
+    seen_workspaces: set[str] = set()
+    for row_no, values in enumerate(value_rows, start=1):
+        dossier_ref = _row_dossier_ref(values, row_no)
+        # Per-lot rows often share a tender id, and refs such as A/1 and A-1 map to
+        # the same folder; keep their workspaces apart.
+        unique_ref = dossier_ref
+        suffix = 0
+        while workspace_name(unique_ref) in seen_workspaces:
+            suffix += 1
+            unique_ref = f"{dossier_ref}-{row_no:03d}" + (f"-{suffix}" if suffix > 1 else "")
+        dossier_ref = unique_ref
+        seen_workspaces.add(workspace_name(dossier_ref))
+        result: dict[str, Any] = {
+            "row": row_no,
+            "dossier_ref": dossier_ref,
+            "status": "pending",
+            "output_path": "",
+            "workspace_dir": "",
+            "error": "",
+        }
+        results.append(result)
+
+        required = set(compiled.placeholders).union(required_fields or [])
+        missing = sorted(k for k in required if not str(values.get(k, "")).strip())
+        attachments, missing_attachments = _row_attachments(values)
+        if missing or missing_attachments:
+            result["status"] = "failed"
+            result["error"] = "Missing required template values: " + ", ".join(missing + missing_attachments)
+            continue
+        result["output_path"] = str(docs_dir / f"{compiled.path.stem}-row-{row_no:03d}.docx")
+        pending.append((result, values, attachments))
+
+    def finish(result: dict[str, Any], attachments: list[str], error: BaseException | None) -> None:
+        if error is None:
+            try:
+                pack = create_workspace_pack(
+                    base_output_dir=base,
+                    dossier_ref=result["dossier_ref"],
+                    primary_document_path=result["output_path"],
+                    required_attachment_paths=attachments,
+                )
+                result["workspace_dir"] = pack["workspace_dir"]
+                result["status"] = "generated"
+            except Exception as exc:
+                error = exc
+        if error is not None:
+            result["status"] = "failed"
+            result["error"] = str(error)
+        if on_progress is not None:
+            on_progress(result)
+
+    if workers <= 1 or len(pending) <= 1:
+        for result, values, attachments in pending:
+            try:
+                _render_row(str(compiled.path), result["output_path"], values)
+                finish(result, attachments, None)
+            except Exception as exc:
+                finish(result, attachments, exc)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures: dict[Future, tuple[dict[str, Any], list[str]]] = {
+                pool.submit(_render_row, str(compiled.path), result["output_path"], values): (result, attachments)
+                for result, values, attachments in pending
+            }
+            for future in as_completed(futures):
+                result, attachments = futures[future]
+                finish(result, attachments, future.exception())
+
+    elapsed = time.perf_counter() - started
+    generated = sum(1 for r in results if r["status"] == "generated")
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
+    summary = {
+        "generated_at_utc": stamp,
+        "template_path": str(compiled.path),
+        "output_dir": str(base),
+        "rows_total": len(results),
+        "generated": generated,
+        "failed": len(results) - generated,
+        "workers": workers,
+        "elapsed_sec": round(elapsed, 3),
+        "docs_per_sec": round(generated / elapsed, 2) if elapsed > 0 else 0.0,
+        "rows": results,
+    }
+    manifest_path = base / f"bulk_manifest_{stamp}.json"
+    manifest_path.write_text(json.dumps(summary, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    summary["manifest_path"] = str(manifest_path)
+    return summary
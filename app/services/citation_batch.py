@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Sequence
+
+from .pdf_page_index import KeywordMatch, PdfPageIndex
+
+CITATION_CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CitationRequest:
+    key: str  # e.g. a requirement id
+    document: str
+    keywords: tuple[str, ...]
+
+
+class CitationCache:
+    """
+    Persistent ``KeywordMatch`` results per document version and keyword set.
+
+    Entries of a document are dropped as soon as its indexed size or mtime
+    changes, so a hit is always consistent with the page index.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        # document -> {"signature": [size, mtime_ns], "matches": {keyword-set key: KeywordMatch fields}}
+        self._documents: dict[str, dict] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == CITATION_CACHE_VERSION:
+            self._documents = dict(data.get("documents", {}))
+
+    @staticmethod
+    def _key(keywords: Sequence[str], top: int) -> str:
+        return json.dumps([top, list(keywords)], ensure_ascii=False)
+
+    def get(self, document: str, signature: tuple[int, int], keywords: Sequence[str], top: int) -> KeywordMatch | None:
+        entry = self._documents.get(document)
+        if entry is None or tuple(entry["signature"]) != signature:
+            return None
+        cached = entry["matches"].get(self._key(keywords, top))
+        return KeywordMatch(**cached) if cached is not None else None
+
+    def put(self, document: str, signature: tuple[int, int], keywords: Sequence[str], top: int, match: KeywordMatch) -> None:
+        entry = self._documents.get(document)
+        if entry is None or tuple(entry["signature"]) != signature:
+            entry = self._documents[document] = {"signature": list(signature), "matches": {}}
+        entry["matches"][self._key(keywords, top)] = asdict(match)
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": CITATION_CACHE_VERSION, "documents": dict(sorted(self._documents.items()))}
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+
+def run_citation_batch(
+    page_index: PdfPageIndex,
+    requests: Sequence[CitationRequest],
+    cache: CitationCache | None = None,
+    top: int = 3,
+    workers: int | None = None,
+) -> dict[str, KeywordMatch | Exception]:
+    """
+    Resolve many citation requests with each PDF parsed at most once.
+
+    New or changed PDFs are indexed in parallel worker processes; each
+    document's uncached keyword sets are then matched together, so a keyword
+    shared by several requirements is looked up once. Results are keyed by
+    ``CitationRequest.key``; a document that cannot be indexed yields its
+    exception instead of a match.
+    """
+    by_document: dict[str, list[CitationRequest]] = {}
+    for request in requests:
+        by_document.setdefault(page_index.document_key(request.document), []).append(request)
+    failures = page_index.ensure_documents(list(by_document), workers=workers)
+
+    results: dict[str, KeywordMatch | Exception] = {}
+    for document, doc_requests in by_document.items():
+        failure = failures.get(document)
+        if failure is not None:
+            results.update((request.key, failure) for request in doc_requests)
+            continue
+        signature = page_index.signature(document)
+        misses: dict[str, tuple[str, ...]] = {}
+        for request in doc_requests:
+            cached = cache.get(document, signature, request.keywords, top) if cache is not None else None
+            if cached is not None:
+                results[request.key] = cached
+            else:
+                misses[request.key] = request.keywords
+        if not misses:
+            continue
+        for key, match in page_index.match_keyword_sets(document, misses, top=top).items():
+            results[key] = match
+            if cache is not None:
+                cache.put(document, signature, misses[key], top, match)
+    if cache is not None:
+        cache.save()
+    return results
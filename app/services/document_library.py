@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import csv
+import json
+import os
+import re
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Any, Iterator
+
+from .pdf_metadata import pdf_embedded_dates
+
+LIBRARY_INDEX_VERSION = 1
+LIBRARY_SUFFIXES = frozenset({".pdf", ".doc", ".docx"})
+# Top-level knowledge base folders and the category they map to.
+LIBRARY_FOLDERS = (
+    ("Закон за јавни набавки", "law"),
+    ("Упатства", "manual"),
+    ("модели на тендерска документација", "tender_model"),
+)
+REVIEW_INDEX = Path("review") / "index.csv"
+DEFAULT_INDEX_PATH = Path("task_force") / "out" / "document_library_index.json"
+FRESHNESS_BY_RISK = {"High": "Likely Outdated", "Medium": "Review", "Low": "Current"}
+
+
+def infer_risk(path: Path, creation_date: str) -> str:
+    name = path.name.lower()
+    year = None
+    m = re.search(r"(20\d{2})", name)
+    if m:
+        year = int(m.group(1))
+    elif creation_date:
+        year = int(creation_date[:4])
+
+    if any(x in name for x in ["nov2021", "2021"]):
+        return "High"
+    if year is not None:
+        if year <= 2022:
+            return "High"
+        if year <= 2024:
+            return "Medium"
+    return "Low"
+
+
+def infer_tags(path: Path) -> str:
+    name = path.name.lower()
+    tags: list[str] = []
+    if "esjn" in name or "e-nabavki" in name:
+        tags.append("esjn")
+    if "епазар" in name or "epazar" in name:
+        tags.append("epazar")
+    if "digital" in name or "потпис" in name:
+        tags.append("digital-signing")
+    if "финанс" in name or "finans" in name:
+        tags.append("financial-form")
+    if "тендер" in name or "tender" in name:
+        tags.append("tender-doc")
+    if "закон" in name:
+        tags.append("law")
+    return ",".join(tags)
+
+
+@dataclass
+class LibraryEntry:
+    relative_path: str
+    display_name: str
+    category: str
+    subcategory: str
+    doc_type: str
+    year_tag: str
+    size_bytes: int
+    mtime_ns: int
+    embedded_creation_date: str
+    embedded_mod_date: str
+    risk: str
+    freshness_status: str
+    tags: str
+    status: str
+
+
+_ENTRY_FIELDS = {f.name for f in fields(LibraryEntry)}
+
+
+def _load_review_index(path: Path) -> dict[str, dict[str, str]]:
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8-sig", newline="") as handle:
+        return {
+            (row.get("current_path") or "").replace("\\", "/"): row
+            for row in csv.DictReader(handle)
+            if row.get("current_path")
+        }
+
+
+def _iter_library_files(root: Path) -> Iterator[tuple[str, str, os.DirEntry]]:
+    stack = [(root / folder, category) for folder, category in LIBRARY_FOLDERS]
+    while stack:
+        folder, category = stack.pop()
+        try:
+            entries = list(os.scandir(folder))
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append((Path(entry.path), category))
+            elif entry.is_file() and Path(entry.name).suffix.lower() in LIBRARY_SUFFIXES:
+                yield Path(entry.path).relative_to(root).as_posix(), category, entry
+
+
+class DocumentLibrary:
+    """
+    Persistent index over the law, manuals and tender models.
+
+    ``refresh`` only re-reads files whose size or mtime changed since the
+    last run (PDF metadata extraction is the expensive part); queries are
+    answered from memory.
+    """
+
+    def __init__(self, root: str | Path, index_path: str | Path | None = None):
+        self.root = Path(root)
+        self.index_path = Path(index_path) if index_path is not None else self.root / DEFAULT_INDEX_PATH
+        self.entries: dict[str, LibraryEntry] = {}
+        self._review_index_mtime_ns = 0
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != LIBRARY_INDEX_VERSION:
+            return
+        self._review_index_mtime_ns = int(data.get("review_index_mtime_ns", 0))
+        for row in data.get("entries", []):
+            if _ENTRY_FIELDS.issubset(row):
+                entry = LibraryEntry(**{k: row[k] for k in _ENTRY_FIELDS})
+                self.entries[entry.relative_path] = entry
+
+    def save(self) -> None:
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": LIBRARY_INDEX_VERSION,
+            "review_index_mtime_ns": self._review_index_mtime_ns,
+            "entries": [asdict(entry) for entry in self.all()],
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+
+    def _build_entry(self, rel: str, category: str, size: int, mtime_ns: int, review_row: dict[str, str]) -> LibraryEntry:
+        path = self.root / rel
+        creation, mod = pdf_embedded_dates(path)
+        risk = infer_risk(path, creation)
+        year_match = re.search(r"(20\d{2})", path.name)
+        parts = rel.split("/")
+        return LibraryEntry(
+            relative_path=rel,
+            display_name=review_row.get("canonical_name") or path.name,
+            category=category,
+            subcategory=parts[1] if len(parts) > 2 else "",
+            doc_type=path.suffix.lower().lstrip("."),
+            year_tag=review_row.get("year_tag") or (year_match.group(1) if year_match else ""),
+            size_bytes=size,
+            mtime_ns=mtime_ns,
+            embedded_creation_date=creation,
+            embedded_mod_date=mod,
+            risk=risk,
+            freshness_status=FRESHNESS_BY_RISK[risk],
+            tags=infer_tags(path),
+            status=review_row.get("status") or "active",
+        )
+
+    def refresh(self) -> dict[str, int]:
+        """Bring the index in line with the folders; returns per-outcome counts."""
+        review_path = self.root / REVIEW_INDEX
+        review_mtime_ns = review_path.stat().st_mtime_ns if review_path.exists() else 0
+        review_changed = review_mtime_ns != self._review_index_mtime_ns
+        review_rows = _load_review_index(review_path)
+
+        stats = {"scanned": 0, "added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        # Built aside and swapped in, so queries running meanwhile see a consistent index.
+        entries = dict(self.entries)
+        seen: set[str] = set()
+        for rel, category, dir_entry in _iter_library_files(self.root):
+            stats["scanned"] += 1
+            seen.add(rel)
+            stat_result = dir_entry.stat()
+            current = entries.get(rel)
+            if (
+                current is not None
+                and not review_changed
+                and current.size_bytes == stat_result.st_size
+                and current.mtime_ns == stat_result.st_mtime_ns
+            ):
+                stats["unchanged"] += 1
+                continue
+            stats["added" if current is None else "updated"] += 1
+            entries[rel] = self._build_entry(
+                rel, category, stat_result.st_size, stat_result.st_mtime_ns, review_rows.get(rel, {})
+            )
+        for rel in set(entries) - seen:
+            del entries[rel]
+            stats["removed"] += 1
+
+        self.entries = entries
+        self._review_index_mtime_ns = review_mtime_ns
+        if stats["added"] or stats["updated"] or stats["removed"] or review_changed or not self.index_path.exists():
+            self.save()
+        return stats
+
+    def all(self) -> list[LibraryEntry]:
+        entries = self.entries
+        return [entries[rel] for rel in sorted(entries, key=str.lower)]
+
+    def query(
+        self,
+        category: str | None = None,
+        doc_type: str | None = None,
+        year_tag: str | None = None,
+        freshness_status: str | None = None,
+        text: str | None = None,
+    ) -> list[LibraryEntry]:
+        needle = (text or "").strip().lower()
+        out = []
+        for entry in self.all():
+            if category and entry.category != category:
+                continue
+            if doc_type and entry.doc_type != doc_type:
+                continue
+            if year_tag and entry.year_tag != year_tag:
+                continue
+            if freshness_status and entry.freshness_status != freshness_status:
+                continue
+            if needle and needle not in f"{entry.display_name} {entry.relative_path} {entry.tags}".lower():
+                continue
+            out.append(entry)
+        return out
+
+    def facets(self) -> dict[str, list[str]]:
+        """Distinct values per filterable field, for filter dropdowns."""
+        values: dict[str, set[str]] = {"category": set(), "doc_type": set(), "year_tag": set(), "freshness_status": set()}
+        for entry in list(self.entries.values()):
+            for key, bucket in values.items():
+                value: Any = getattr(entry, key)
+                if value:
+                    bucket.add(value)
+        return {key: sorted(bucket) for key, bucket in values.items()}
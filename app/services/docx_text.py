@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import threading
+import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+from . import docx_xml
+
+TEXT_PART_TOKENS = ("document.xml", "header", "footer")
+DOCX_TEXT_CACHE_SIZE = 32
+_W_P = f"{{{docx_xml.W_NS}}}p"
+_W_T = f"{{{docx_xml.W_NS}}}t"
+
+
+def iter_text_part_names(zf: zipfile.ZipFile) -> Iterator[str]:
+    """Body, header and footer parts of a DOCX, in archive order."""
+    for name in zf.namelist():
+        if not name.startswith("word/") or not name.endswith(".xml"):
+            continue
+        if not any(token in name for token in TEXT_PART_TOKENS):
+            continue
+        yield name
+
+
+def iter_paragraph_nodes(root: Any) -> Iterator[tuple[Any, list[Any]]]:
+    """Yield ``(w:p element, its w:t elements)`` in document order."""
+    for para in root.iter(_W_P):
+        yield para, list(para.iter(_W_T))
+
+
+@dataclass(frozen=True)
+class DocxRun:
+    part: str
+    paragraph: int
+    # Offsets into the paragraph's merged text.
+    start: int
+    end: int
+    text: str
+
+
+@dataclass(frozen=True)
+class DocxPart:
+    name: str
+    paragraphs: tuple[str, ...]
+    runs: tuple[DocxRun, ...]
+    # Every ``t`` element of the part (any namespace, including drawing text), in order.
+    text_runs: tuple[str, ...]
+
+
+def _read_part(name: str, source: IO[bytes]) -> DocxPart:
+    """
+    Stream one XML part. A paragraph's text includes the ``w:t`` elements of
+    paragraphs nested in it (text boxes), as ``iter_paragraph_nodes`` does on
+    a parsed tree; paragraphs keep their document (start tag) order and each
+    outermost paragraph is released once it ends.
+    """
+    paragraphs: list[str] = []
+    runs: list[DocxRun] = []
+    text_runs: list[str] = []
+    open_paragraphs: list[tuple[int, list[str]]] = []
+    finished: list[tuple[int, list[str]]] = []
+    started = 0
+    for event, elem in docx_xml.iterparse(source, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == _W_P:
+                open_paragraphs.append((started, []))
+                started += 1
+            continue
+        if docx_xml.is_text_tag(tag):
+            text = elem.text or ""
+            text_runs.append(text)
+            if tag == _W_T:
+                for _, texts in open_paragraphs:
+                    texts.append(text)
+        elif tag == _W_P:
+            finished.append(open_paragraphs.pop())
+            if open_paragraphs:
+                continue
+            for idx, texts in sorted(finished, key=lambda item: item[0]):
+                offset = 0
+                for text in texts:
+                    runs.append(DocxRun(name, idx, offset, offset + len(text), text))
+                    offset += len(text)
+                paragraphs.append("".join(texts))
+            finished.clear()
+            docx_xml.release(elem)
+    return DocxPart(name, tuple(paragraphs), tuple(runs), tuple(text_runs))
+
+
+class DocxText:
+    """Text of a DOCX's body, header and footer parts, parsed once."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        with zipfile.ZipFile(path, "r") as zf:
+            parts = []
+            for name in iter_text_part_names(zf):
+                with zf.open(name) as fh:
+                    parts.append(_read_part(name, fh))
+        self.parts = tuple(parts)
+
+    def paragraphs(self) -> list[str]:
+        return [text for part in self.parts for text in part.paragraphs]
+
+    def runs(self) -> list[DocxRun]:
+        return [run for part in self.parts for run in part.runs]
+
+    def flat_text(self, part_separator: str = "\n\n") -> str:
+        """Stripped, non-empty text runs joined by spaces; parts joined by ``part_separator``."""
+        chunks = []
+        for part in self.parts:
+            merged = " ".join(t.strip() for t in part.text_runs if t.strip())
+            if merged:
+                chunks.append(merged)
+        return part_separator.join(chunks)
+
+
+_DOCX_TEXT_CACHE: "OrderedDict[str, tuple[int, int, DocxText]]" = OrderedDict()
+_DOCX_TEXT_CACHE_LOCK = threading.Lock()
+
+
+def load_docx_text(docx_path: str | Path) -> DocxText:
+    """Return the parsed text, reusing it while the file's mtime and size are unchanged."""
+    path = Path(docx_path)
+    stat_result = path.stat()
+    key = str(path.resolve())
+    with _DOCX_TEXT_CACHE_LOCK:
+        cached = _DOCX_TEXT_CACHE.get(key)
+        if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+            _DOCX_TEXT_CACHE.move_to_end(key)
+            return cached[2]
+    text = DocxText(path)
+    with _DOCX_TEXT_CACHE_LOCK:
+        _DOCX_TEXT_CACHE[key] = (stat_result.st_mtime_ns, stat_result.st_size, text)
+        _DOCX_TEXT_CACHE.move_to_end(key)
+        while len(_DOCX_TEXT_CACHE) > DOCX_TEXT_CACHE_SIZE:
+            _DOCX_TEXT_CACHE.popitem(last=False)
+    return text
+
+
+def clear_docx_text_cache() -> None:
+    with _DOCX_TEXT_CACHE_LOCK:
+        _DOCX_TEXT_CACHE.clear()
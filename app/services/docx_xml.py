@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import io
+import xml.etree.ElementTree as ET
+from typing import IO, Any, Iterator
+
+try:
+    from lxml import etree as _lxml_etree  # type: ignore
+except Exception:  # pragma: no cover
+    _lxml_etree = None  # type: ignore
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+if _lxml_etree is not None:
+    # No entity expansion or network access; large document.xml parts are allowed.
+    _LXML_PARSER = _lxml_etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+
+
+def fromstring(xml_bytes: bytes) -> Any:
+    """Parse a DOCX XML part with lxml when installed, ElementTree otherwise."""
+    if _lxml_etree is not None:
+        return _lxml_etree.fromstring(xml_bytes, _LXML_PARSER)
+    return ET.fromstring(xml_bytes)
+
+
+def tostring(root: Any) -> bytes:
+    if _lxml_etree is not None and isinstance(root, _lxml_etree._Element):
+        return _lxml_etree.tostring(root, encoding="utf-8", xml_declaration=True, standalone=True)
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def sub_element(parent: Any, tag: str) -> Any:
+    if _lxml_etree is not None and isinstance(parent, _lxml_etree._Element):
+        return _lxml_etree.SubElement(parent, tag)
+    return ET.SubElement(parent, tag)
+
+
+def iterparse(source: bytes | IO[bytes], events: tuple[str, ...] = ("end",)) -> Iterator[tuple[str, Any]]:
+    """
+    Parse a DOCX XML part incrementally with lxml when installed, ElementTree
+    otherwise. ``source`` may be the part's bytes or an open stream such as
+    ``ZipFile.open(name)``, which is read in chunks.
+    """
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    if _lxml_etree is not None:
+        return _lxml_etree.iterparse(source, events=events, resolve_entities=False, no_network=True, huge_tree=True)
+    return ET.iterparse(source, events=events)
+
+
+def is_text_tag(tag: Any) -> bool:
+    """True for a ``t`` element in any namespace (body, drawing or math text)."""
+    return isinstance(tag, str) and (tag == "t" or tag.endswith("}t"))
+
+
+def release(elem: Any) -> None:
+    """Drop a finished element's content, and with lxml its already processed siblings."""
+    elem.clear()
+    if _lxml_etree is not None and isinstance(elem, _lxml_etree._Element):
+        parent = elem.getparent()
+        while parent is not None and elem.getprevious() is not None:
+            del parent[0]
+
+
+def iter_text_runs(source: bytes | IO[bytes], tag: str | None = None) -> Iterator[str]:
+    """
+    Yield the text of every ``t`` element (any namespace, or only ``tag``) in
+    document order without building the whole tree: paragraphs are released
+    as soon as they end, so memory stays flat on long documents.
+
+    Same sequence as ``[n.text or "" for n in root.iter("{*}t")]``.
+    """
+    for _, elem in iterparse(source):
+        matches = elem.tag == tag if tag else is_text_tag(elem.tag)
+        if matches:
+            yield elem.text or ""
+        elif isinstance(elem.tag, str) and elem.tag.endswith("}p"):
+            release(elem)
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+MANIFEST_VERSION = 1
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def empty_manifest() -> dict[str, Any]:
+    return {"version": MANIFEST_VERSION, "files": {}, "groups": {}}
+
+
+def load_extraction_manifest(path: str | Path) -> dict[str, Any]:
+    manifest_path = Path(path)
+    if not manifest_path.exists():
+        return empty_manifest()
+    try:
+        data = json.loads(manifest_path.read_text(encoding="utf-8-sig"))
+    except (OSError, ValueError):
+        return empty_manifest()
+    if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+        return empty_manifest()
+    data.setdefault("files", {})
+    data.setdefault("groups", {})
+    return data
+
+
+def save_extraction_manifest(path: str | Path, manifest: dict[str, Any]) -> None:
+    manifest_path = Path(path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, manifest_path)
+
+
+def file_sha256(path: str | Path) -> str:
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def resolve_file_hash(
+    manifest: dict[str, Any],
+    path: str | Path,
+    stat_result: os.stat_result,
+) -> tuple[str, bool]:
+    """
+    Return ``(sha256, changed)`` for a candidate file.
+
+    Size and mtime act as a cheap pre-check; the file is only re-hashed when
+    either differs from the recorded entry.
+    """
+    entry = manifest.get("files", {}).get(str(path))
+    if (
+        entry
+        and entry.get("size") == stat_result.st_size
+        and entry.get("mtime_ns") == stat_result.st_mtime_ns
+        and entry.get("sha256")
+    ):
+        return entry["sha256"], False
+    sha = file_sha256(path)
+    return sha, not entry or entry.get("sha256") != sha
+
+
+def record_file(
+    manifest: dict[str, Any],
+    path: str | Path,
+    stat_result: os.stat_result,
+    sha256: str,
+    tender_id: str | None,
+    status: str,
+) -> None:
+    manifest.setdefault("files", {})[str(path)] = {
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+        "sha256": sha256,
+        "tender_id": tender_id,
+        "status": status,
+    }
+
+
+def forget_missing_files(manifest: dict[str, Any]) -> list[str]:
+    """Drop entries of files that no longer exist, so their parse cache can be pruned."""
+    files = manifest.get("files", {})
+    missing = [path for path in files if not Path(path).exists()]
+    for path in missing:
+        del files[path]
+    return missing
+
+
+def group_inputs_signature(file_hashes: list[tuple[str, str]]) -> str:
+    digest = hashlib.sha256()
+    for path, sha in sorted(file_hashes):
+        digest.update(f"{path}\0{sha}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def current_group_outputs(manifest: dict[str, Any], tender_id: str, signature: str) -> dict[str, str]:
+    """Recorded outputs that were generated from the same inputs and still exist on disk."""
+    group = manifest.get("groups", {}).get(tender_id)
+    if not group or group.get("inputs_signature") != signature:
+        return {}
+    outputs = group.get("outputs") or {}
+    return {kind: p for kind, p in outputs.items() if Path(p).exists()}
+
+
+def missing_group_outputs(
+    manifest: dict[str, Any],
+    tender_id: str,
+    signature: str,
+    formats: Iterable[str],
+) -> list[str]:
+    current = current_group_outputs(manifest, tender_id, signature)
+    return [kind for kind in formats if kind not in current]
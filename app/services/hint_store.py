@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import csv
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+HINT_STORE_NAME = "upload_hints.sqlite3"
+CLASSIFY_BATCH_ROWS = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hint_sources (
+    csv_name TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    row_count INTEGER NOT NULL,
+    removed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS hints (
+    id INTEGER PRIMARY KEY,
+    csv_name TEXT NOT NULL,
+    file TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    term TEXT NOT NULL,
+    source_page TEXT NOT NULL,
+    snippet TEXT NOT NULL,
+    requirement_id TEXT,
+    classifier_version TEXT
+);
+CREATE INDEX IF NOT EXISTS hints_csv_name ON hints (csv_name);
+CREATE INDEX IF NOT EXISTS hints_classifier_version ON hints (classifier_version);
+CREATE INDEX IF NOT EXISTS hints_requirement_id ON hints (requirement_id);
+"""
+# Rows whose CSV still exists; rows of deleted CSVs are kept but not counted.
+_LIVE_ROWS = "csv_name NOT IN (SELECT csv_name FROM hint_sources WHERE removed = 1)"
+
+
+@dataclass
+class RequirementHints:
+    """Aggregated runtime evidence for one requirement."""
+
+    hits: int = 0
+    files: set[str] = field(default_factory=set)
+    pages: set[str] = field(default_factory=set)
+    csv_names: set[str] = field(default_factory=set)
+    snippets: set[str] = field(default_factory=set)
+
+
+class HintStore:
+    """
+    SQLite store of the upload hint rows from every extraction run.
+
+    ``extract_tender_context.py`` records the rows of each ``upload_hints_*.csv``
+    it writes; ``sync_csv_files`` backfills CSVs the store has not seen and
+    replaces the rows of CSVs that changed. A deleted CSV is tombstoned: its
+    rows stay in the store but are no longer classified or counted, and come
+    back if the CSV reappears. Rows are classified once per classifier
+    version, so regenerating the canonical requirements only touches rows
+    added since the last run.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path, timeout=30)
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(hint_sources)")}
+        if "removed" not in columns:
+            # Stores created before deleted CSVs were tombstoned.
+            with self._conn:
+                self._conn.execute("ALTER TABLE hint_sources ADD COLUMN removed INTEGER NOT NULL DEFAULT 0")
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> HintStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _replace_rows(self, csv_path: Path, rows: Iterable[Mapping[str, str]]) -> int:
+        values = [
+            (
+                csv_path.name,
+                (row.get("file") or "").strip(),
+                row.get("tag") or "",
+                row.get("term") or "",
+                (row.get("source_page") or "").strip(),
+                row.get("snippet") or "",
+            )
+            for row in rows
+        ]
+        stat_result = csv_path.stat()
+        self._conn.execute("DELETE FROM hints WHERE csv_name = ?", (csv_path.name,))
+        self._conn.executemany(
+            "INSERT INTO hints (csv_name, file, tag, term, source_page, snippet) VALUES (?, ?, ?, ?, ?, ?)",
+            values,
+        )
+        self._conn.execute(
+            "INSERT OR REPLACE INTO hint_sources (csv_name, size, mtime_ns, row_count) VALUES (?, ?, ?, ?)",
+            (csv_path.name, stat_result.st_size, stat_result.st_mtime_ns, len(values)),
+        )
+        return len(values)
+
+    def record_csv(self, csv_path: str | Path, rows: Iterable[Mapping[str, str]]) -> int:
+        """Store the rows just written to ``csv_path`` so the CSV never has to be re-read."""
+        with self._conn:
+            return self._replace_rows(Path(csv_path), rows)
+
+    def sync_csv_files(self, csv_paths: Iterable[str | Path]) -> dict[str, int]:
+        """Ingest new or changed CSVs and tombstone CSVs that no longer exist."""
+        stats = {"ingested": 0, "unchanged": 0, "removed": 0}
+        known = {
+            name: (size, mtime_ns, bool(removed))
+            for name, size, mtime_ns, removed in self._conn.execute(
+                "SELECT csv_name, size, mtime_ns, removed FROM hint_sources"
+            )
+        }
+        seen: set[str] = set()
+        with self._conn:
+            for csv_path in map(Path, csv_paths):
+                seen.add(csv_path.name)
+                stat_result = csv_path.stat()
+                if known.get(csv_path.name) == (stat_result.st_size, stat_result.st_mtime_ns, False):
+                    stats["unchanged"] += 1
+                    continue
+                with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
+                    self._replace_rows(csv_path, csv.DictReader(handle))
+                stats["ingested"] += 1
+            for name in sorted(set(known) - seen):
+                if known[name][2]:
+                    continue
+                self._conn.execute("UPDATE hint_sources SET removed = 1 WHERE csv_name = ?", (name,))
+                stats["removed"] += 1
+        return stats
+
+    def classify(self, classifier: Callable[[dict[str, str]], str | None], version: str) -> int:
+        """
+        Run ``classifier`` over rows of existing CSVs not yet classified by ``version``.
+
+        Identical (tag, snippet) pairs, common across runs of the same tender,
+        are classified once. Returns the number of rows updated.
+        """
+        decided: dict[tuple[str, str], str | None] = {}
+        updated = 0
+        with self._conn:
+            while True:
+                pending = self._conn.execute(
+                    f"SELECT id, tag, snippet FROM hints WHERE classifier_version IS NOT ? AND {_LIVE_ROWS} LIMIT ?",
+                    (version, CLASSIFY_BATCH_ROWS),
+                ).fetchall()
+                if not pending:
+                    break
+                updates = []
+                for row_id, tag, snippet in pending:
+                    key = (tag, snippet)
+                    if key not in decided:
+                        decided[key] = classifier({"tag": tag, "snippet": snippet})
+                    updates.append((decided[key], version, row_id))
+                self._conn.executemany(
+                    "UPDATE hints SET requirement_id = ?, classifier_version = ? WHERE id = ?", updates
+                )
+                updated += len(updates)
+        return updated
+
+    def requirement_summary(self) -> dict[str, RequirementHints]:
+        """Hit counts and distinct files, pages, CSVs and snippets per classified requirement of existing CSVs."""
+        summary: dict[str, RequirementHints] = {}
+        for req_id, hits in self._conn.execute(
+            f"SELECT requirement_id, COUNT(*) FROM hints WHERE requirement_id IS NOT NULL AND {_LIVE_ROWS} "
+            "GROUP BY requirement_id"
+        ):
+            summary[req_id] = RequirementHints(hits=hits)
+        for column, attr in (("file", "files"), ("source_page", "pages"), ("csv_name", "csv_names"), ("snippet", "snippets")):
+            for req_id, value in self._conn.execute(
+                f"SELECT DISTINCT requirement_id, {column} FROM hints "
+                f"WHERE requirement_id IS NOT NULL AND {column} != '' AND {_LIVE_ROWS}"
+            ):
+                getattr(summary[req_id], attr).add(value)
+        return summary
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable
+
+from .blob_store import sha256_file
+from .docx_text import load_docx_text
+
+MODEL_CORPUS_VERSION = 1
+MODEL_CORPUS_NAME = ".model_corpus.json"
+
+
+def corpus_text(path: Path) -> str:
+    """Whitespace-collapsed, lowercased DOCX text: what keyword traceability matches against."""
+    return re.sub(r"\s+", " ", load_docx_text(path).flat_text(" ").strip()).lower()
+
+
+class ModelCorpus:
+    """
+    Pre-extracted text of the model tender documents with keyword postings.
+
+    Each document is stored with its size, mtime and SHA-256. ``refresh``
+    re-extracts a file only when its content hash changed (a touched but
+    identical file just gets its signature updated). ``documents_with``
+    scans the corpus once per keyword and keeps the answer, in memory and in
+    the cache file, until a document changes.
+    """
+
+    def __init__(self, root: str | Path, cache_path: str | Path):
+        self.root = Path(root)
+        self.cache_path = Path(cache_path)
+        # relative path -> [size, mtime_ns, sha256, text]
+        self._documents: dict[str, list] = {}
+        self._postings: dict[str, list[str]] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != MODEL_CORPUS_VERSION:
+            return
+        self._documents = dict(data.get("documents", {}))
+        self._postings = dict(data.get("postings", {}))
+
+    def save(self) -> None:
+        if not self._dirty and self.cache_path.exists():
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": MODEL_CORPUS_VERSION,
+            "documents": dict(sorted(self._documents.items())),
+            "postings": dict(sorted(self._postings.items())),
+        }
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    @property
+    def documents(self) -> list[str]:
+        return sorted(self._documents)
+
+    def text(self, document: str) -> str:
+        return self._documents[document][3]
+
+    def refresh(self, paths: Iterable[str | Path]) -> dict[str, int]:
+        """Make the corpus hold exactly ``paths``; returns per-outcome counts."""
+        stats = {"extracted": 0, "revalidated": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        changed = False
+        seen: set[str] = set()
+        for path in paths:
+            full = Path(path)
+            rel = full.relative_to(self.root).as_posix()
+            seen.add(rel)
+            stat_result = full.stat()
+            current = self._documents.get(rel)
+            if current and current[0] == stat_result.st_size and current[1] == stat_result.st_mtime_ns:
+                stats["unchanged"] += 1
+                continue
+            sha256 = sha256_file(full)
+            if current and current[2] == sha256:
+                current[0], current[1] = stat_result.st_size, stat_result.st_mtime_ns
+                self._dirty = True
+                stats["revalidated"] += 1
+                continue
+            try:
+                text = corpus_text(full)
+            except Exception:
+                # Unreadable documents are matched as empty, like a DOCX without text.
+                text = ""
+                stats["failed"] += 1
+            else:
+                stats["extracted"] += 1
+            self._documents[rel] = [stat_result.st_size, stat_result.st_mtime_ns, sha256, text]
+            changed = True
+        for rel in set(self._documents) - seen:
+            del self._documents[rel]
+            stats["removed"] += 1
+            changed = True
+        if changed:
+            self._postings = {}
+            self._dirty = True
+        self.save()
+        return stats
+
+    def documents_with(self, keyword: str) -> list[str]:
+        """Documents whose corpus text contains ``keyword`` (lowercased substring), sorted."""
+        needle = keyword.lower()
+        posting = self._postings.get(needle)
+        if posting is None:
+            posting = [rel for rel in self.documents if needle in self._documents[rel][3]]
+            self._postings[needle] = posting
+            self._dirty = True
+        return posting
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import random
+import zlib
+from difflib import SequenceMatcher
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.88
+SHINGLE_SIZE = 4
+NUM_PERMUTATIONS = 48
+BAND_ROWS = 2
+_HASH_MASK = 0xFFFFFFFF
+_SEED = 20260220
+
+
+def _permutation_seeds(count: int) -> tuple[int, ...]:
+    rng = random.Random(_SEED)
+    return tuple(rng.getrandbits(32) for _ in range(count))
+
+
+_SEEDS = _permutation_seeds(NUM_PERMUTATIONS)
+
+
+def shingle_hashes(text: str, size: int = SHINGLE_SIZE) -> set[int]:
+    value = text or ""
+    if len(value) <= size:
+        grams = {value}
+    else:
+        grams = {value[i : i + size] for i in range(len(value) - size + 1)}
+    # crc32 is linear, so mix it once per shingle before the xor permutations.
+    return {(zlib.crc32(g.encode("utf-8")) * 0x9E3779B1) & _HASH_MASK for g in grams}
+
+
+def minhash_signature(text: str) -> tuple[int, ...]:
+    hashes = shingle_hashes(text)
+    return tuple(min(map(seed.__xor__, hashes)) for seed in _SEEDS)
+
+
+def _band_keys(signature: tuple[int, ...]) -> list[tuple[int, tuple[int, ...]]]:
+    return [
+        (band, signature[start : start + BAND_ROWS])
+        for band, start in enumerate(range(0, len(signature), BAND_ROWS))
+    ]
+
+
+def _length_bound(left: str, right: str) -> float:
+    total = len(left) + len(right)
+    return 2.0 * min(len(left), len(right)) / total if total else 1.0
+
+
+def _matches(matcher: SequenceMatcher, threshold: float) -> bool:
+    if matcher.quick_ratio() < threshold:
+        return False
+    return matcher.ratio() >= threshold
+
+
+def sequence_similarity_at_least(left: str, right: str, threshold: float) -> bool:
+    return _matches(SequenceMatcher(None, left, right), threshold)
+
+
+class NearDuplicateIndex:
+    """
+    MinHash/LSH index over normalized fingerprints.
+
+    LSH buckets nominate likely duplicates first; each candidate is confirmed
+    with the same ``SequenceMatcher(None, new, seen).ratio() >= threshold``
+    check the pairwise scan used. LSH recall is probabilistic, so when no
+    candidate matches, the remaining fingerprints are still checked, behind
+    the cheap length and ``quick_ratio`` upper bounds. Answers are therefore
+    exactly those of the pairwise scan; the index only makes duplicates
+    (the common case) cheap to find.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD):
+        self.threshold = threshold
+        self._items: list[str] = []
+        # One matcher per stored fingerprint keeps its seq2 index warm across probes.
+        self._matchers: list[SequenceMatcher] = []
+        self._exact: set[str] = set()
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _candidate_ids(self, fingerprint: str) -> list[int]:
+        seen_ids: set[int] = set()
+        for key in _band_keys(minhash_signature(fingerprint)):
+            seen_ids.update(self._buckets.get(key, ()))
+        return sorted(seen_ids)
+
+    def candidates(self, fingerprint: str) -> list[str]:
+        return [self._items[i] for i in self._candidate_ids(fingerprint)]
+
+    def _confirm(self, fingerprint: str, item_id: int) -> bool:
+        if _length_bound(fingerprint, self._items[item_id]) < self.threshold:
+            return False
+        matcher = self._matchers[item_id]
+        matcher.set_seq1(fingerprint)
+        return _matches(matcher, self.threshold)
+
+    def find_duplicate(self, fingerprint: str) -> str | None:
+        if fingerprint in self._exact:
+            return fingerprint
+        candidate_ids = self._candidate_ids(fingerprint)
+        for item_id in candidate_ids:
+            if self._confirm(fingerprint, item_id):
+                return self._items[item_id]
+        # Pairs LSH failed to bucket together; bounds reject most of them without ratio().
+        tried = set(candidate_ids)
+        for item_id in range(len(self._items)):
+            if item_id not in tried and self._confirm(fingerprint, item_id):
+                return self._items[item_id]
+        return None
+
+    def is_duplicate(self, fingerprint: str) -> bool:
+        return self.find_duplicate(fingerprint) is not None
+
+    def add(self, fingerprint: str) -> None:
+        item_id = len(self._items)
+        self._items.append(fingerprint)
+        self._matchers.append(SequenceMatcher(None, "", fingerprint))
+        self._exact.add(fingerprint)
+        for key in _band_keys(minhash_signature(fingerprint)):
+            self._buckets.setdefault(key, []).append(item_id)
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import BinaryIO
+
+WINDOW_BYTES = 64 * 1024
+OBJECT_READ_BYTES = 4 * 1024
+SCAN_CHUNK_BYTES = 1024 * 1024
+MAX_XREF_SECTIONS = 32
+
+_STARTXREF = re.compile(rb"startxref\s+(\d+)")
+_INFO_REF = re.compile(rb"/Info\s+(\d+)\s+(\d+)\s+R")
+_PREV = re.compile(rb"/Prev\s+(\d+)")
+_SUBSECTION = re.compile(rb"\s*(\d+)\s+(\d+)\s*?\r?\n")
+_CREATION = re.compile(rb"/CreationDate\s*\(D:(\d{4})(\d{2})(\d{2})")
+_MOD = re.compile(rb"/ModDate\s*\(D:(\d{4})(\d{2})(\d{2})")
+# XMP packets write dates as elements or attributes: <xmp:CreateDate>2021-01-08T..., xmp:CreateDate="2021-01-08...".
+_XMP_CREATION = re.compile(rb"xmp:CreateDate(?:>|=\")\s*(\d{4})-(\d{2})-(\d{2})")
+_XMP_MOD = re.compile(rb"xmp:ModifyDate(?:>|=\")\s*(\d{4})-(\d{2})-(\d{2})")
+
+
+def _date(match: re.Match | None) -> str:
+    return "-".join(part.decode("ascii") for part in match.groups()) if match else ""
+
+
+def _dates_in(data: bytes) -> tuple[str, str]:
+    creation = _date(_CREATION.search(data)) or _date(_XMP_CREATION.search(data))
+    mod = _date(_MOD.search(data)) or _date(_XMP_MOD.search(data))
+    return creation, mod
+
+
+def _read_at(handle: BinaryIO, offset: int, size: int) -> bytes:
+    handle.seek(max(offset, 0))
+    return handle.read(size)
+
+
+def _xref_object_offset(handle: BinaryIO, xref_offset: int, obj_num: int) -> int | None:
+    """Offset of ``obj_num`` from a classic xref table chain (``/Prev`` followed), or None."""
+    for _ in range(MAX_XREF_SECTIONS):
+        handle.seek(xref_offset)
+        if handle.read(4) != b"xref":
+            return None  # xref stream (PDF 1.5+); the caller falls back to windows
+        pos = xref_offset + 4
+        while True:
+            header = _SUBSECTION.match(_read_at(handle, pos, 64))
+            if header is None:
+                break
+            start, count = int(header.group(1)), int(header.group(2))
+            entries_at = pos + header.end()
+            if start <= obj_num < start + count:
+                entry = _read_at(handle, entries_at + (obj_num - start) * 20, 20)
+                if entry[17:18] == b"n":
+                    return int(entry[:10])
+                return None
+            pos = entries_at + count * 20
+        trailer = _read_at(handle, pos, OBJECT_READ_BYTES)
+        prev = _PREV.search(trailer)
+        if prev is None:
+            return None
+        xref_offset = int(prev.group(1))
+    return None
+
+
+def _info_dates(handle: BinaryIO, size: int, tail: bytes) -> tuple[str, str]:
+    startxref = None
+    for startxref in _STARTXREF.finditer(tail):
+        pass
+    if startxref is None:
+        return "", ""
+    xref_offset = int(startxref.group(1))
+    if not 0 <= xref_offset < size:
+        return "", ""
+    info = None
+    for info in _INFO_REF.finditer(tail):
+        pass
+    if info is None:
+        # Cross-reference streams carry the trailer keys in the stream dictionary.
+        info = _INFO_REF.search(_read_at(handle, xref_offset, OBJECT_READ_BYTES))
+    if info is None:
+        return "", ""
+    offset = _xref_object_offset(handle, xref_offset, int(info.group(1)))
+    if offset is None or not 0 <= offset < size:
+        return "", ""
+    obj = _read_at(handle, offset, OBJECT_READ_BYTES)
+    if not re.match(rb"\s*%d\s+\d+\s+obj" % int(info.group(1)), obj):
+        return "", ""  # stale or malformed xref entry
+    end = obj.find(b"endobj")
+    return _dates_in(obj[: end if end >= 0 else len(obj)])
+
+
+def pdf_embedded_dates(path: Path) -> tuple[str, str]:
+    """
+    ``(creation, modification)`` dates as YYYY-MM-DD from a PDF's Info
+    dictionary or XMP packet, reading as little of the file as possible.
+
+    The current Info dictionary is located through the trailer and xref
+    table with a few bounded seeks; head and tail windows (linearized files,
+    cross-reference streams, XMP) come next, and only then is the file
+    scanned in chunks with constant memory.
+    """
+    if path.suffix.lower() != ".pdf":
+        return "", ""
+    try:
+        size = path.stat().st_size
+        with path.open("rb") as handle:
+            tail = _read_at(handle, size - WINDOW_BYTES, WINDOW_BYTES)
+            creation, mod = _info_dates(handle, size, tail)
+            if creation and mod:
+                return creation, mod
+            for window in (_read_at(handle, 0, WINDOW_BYTES), tail):
+                found = _dates_in(window)
+                creation, mod = creation or found[0], mod or found[1]
+            if (creation and mod) or size <= 2 * WINDOW_BYTES:
+                return creation, mod
+            return _scan_dates(handle, creation, mod)
+    except Exception:
+        return "", ""
+
+
+def _scan_dates(handle: BinaryIO, creation: str, mod: str) -> tuple[str, str]:
+    handle.seek(0)
+    carry = b""
+    while not (creation and mod):
+        chunk = handle.read(SCAN_CHUNK_BYTES)
+        if not chunk:
+            break
+        data = carry + chunk
+        found = _dates_in(data)
+        creation, mod = creation or found[0], mod or found[1]
+        carry = data[-128:]
+    return creation, mod
+
+
+class PdfDateCache:
+    """Persistent ``pdf_embedded_dates`` results keyed by path, size and mtime."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._entries: dict[str, list] = {}
+        self._dirty = False
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._entries = data
+        except (OSError, ValueError):
+            pass
+
+    def get(self, pdf_path: Path) -> tuple[str, str]:
+        stat_result = pdf_path.stat()
+        key = str(pdf_path.resolve())
+        cached = self._entries.get(key)
+        if cached and cached[0] == stat_result.st_size and cached[1] == stat_result.st_mtime_ns:
+            return cached[2], cached[3]
+        creation, mod = pdf_embedded_dates(pdf_path)
+        self._entries[key] = [stat_result.st_size, stat_result.st_mtime_ns, creation, mod]
+        self._dirty = True
+        return creation, mod
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self._entries, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self._dirty = False
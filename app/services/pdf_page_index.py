@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Mapping, Sequence
+
+try:
+    from pypdf import PdfReader
+except Exception:  # pragma: no cover
+    PdfReader = None  # type: ignore
+
+PAGE_INDEX_VERSION = 1
+PAGE_INDEX_FOLDERS = ("Закон за јавни набавки", "Упатства")
+DEFAULT_PAGE_INDEX_PATH = Path("task_force") / "out" / "pdf_page_index.json"
+GRAM = 3
+SNIPPET_BEFORE = 140
+SNIPPET_AFTER = 220
+
+_SOFT_HYPHEN = "\u00ad"
+# Latin letters that PDFs (and typists) mix into Macedonian words, including ј and ѕ.
+_HOMOGLYPHS = str.maketrans("aceijopsxy", "асеіјорѕху")
+
+
+def normalize_page_text(text: str) -> str:
+    """NFC-compose (so ѓ/ќ/ѝ split into letter + combining mark match typed text), drop soft hyphens, collapse whitespace."""
+    text = unicodedata.normalize("NFC", text or "").replace(_SOFT_HYPHEN, "")
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def search_key(text: str) -> str:
+    """
+    Lowercased text with Latin homoglyphs folded to Cyrillic.
+
+    The mapping is one character to one character, so offsets in the key are
+    offsets in the original text.
+    """
+    return text.lower().translate(_HOMOGLYPHS)
+
+
+def normalize_query(text: str) -> str:
+    return search_key(unicodedata.normalize("NFC", text or ""))
+
+
+def _grams(text: str) -> set[str]:
+    return {text[i : i + GRAM] for i in range(len(text) - GRAM + 1)}
+
+
+@dataclass
+class PageHit:
+    document: str
+    page: int  # 1-based
+    keywords: list[str]
+    snippet: str
+
+
+@dataclass
+class KeywordMatch:
+    pages: list[int]
+    keywords: list[str]
+    snippet: str
+
+
+def snippet_around(text: str, keyword: str) -> str:
+    idx = search_key(text).find(normalize_query(keyword))
+    if idx < 0:
+        return text[:260]
+    return text[max(0, idx - SNIPPET_BEFORE) : min(len(text), idx + SNIPPET_AFTER)]
+
+
+def extract_pdf_pages(path: str | Path) -> list[str]:
+    """Normalized text of every page; runs in worker processes, so it only touches its argument."""
+    if PdfReader is None:
+        raise RuntimeError("pypdf is not installed; cannot index PDF pages.")
+    with Path(path).open("rb") as handle:
+        reader = PdfReader(handle)
+        return [normalize_page_text(page.extract_text() or "") for page in reader.pages]
+
+
+def _rank_pages(hits: dict[int, list[str]], pages: list[str], top: int) -> KeywordMatch:
+    ranked = sorted(hits.items(), key=lambda item: (-len(item[1]), item[0]))[:top]
+    found: list[str] = []
+    for _, page_keywords in ranked:
+        for keyword in page_keywords:
+            if keyword not in found:
+                found.append(keyword)
+    snippet = snippet_around(pages[ranked[0][0]], ranked[0][1][0]) if ranked else ""
+    return KeywordMatch([idx + 1 for idx, _ in ranked], found, snippet)
+
+
+class _DocumentPages:
+    def __init__(self, pages: list[str]):
+        self.pages = pages
+        self.lowered = [search_key(page) for page in pages]
+        self._postings: dict[str, set[int]] | None = None
+
+    @property
+    def postings(self) -> dict[str, set[int]]:
+        # Built on first lookup; a trigram maps to the pages containing it.
+        if self._postings is None:
+            postings: dict[str, set[int]] = {}
+            for page_idx, low in enumerate(self.lowered):
+                for gram in _grams(low):
+                    postings.setdefault(gram, set()).add(page_idx)
+            self._postings = postings
+        return self._postings
+
+    def pages_containing(self, keyword: str) -> list[int]:
+        """0-based pages whose search key contains ``keyword``'s (substring, like ``in``)."""
+        needle = normalize_query(keyword)
+        if not needle:
+            return []
+        if len(needle) < GRAM:
+            candidates: Iterable[int] = range(len(self.lowered))
+        else:
+            candidate_set: set[int] | None = None
+            for gram in _grams(needle):
+                pages = self.postings.get(gram)
+                if not pages:
+                    return []
+                candidate_set = set(pages) if candidate_set is None else candidate_set & pages
+                if not candidate_set:
+                    return []
+            candidates = sorted(candidate_set or ())
+        return [idx for idx in candidates if needle in self.lowered[idx]]
+
+
+class PdfPageIndex:
+    """
+    Persistent page-level text index over the law and manual PDFs.
+
+    Page texts are extracted once per file version (size + mtime) and kept in
+    one JSON file; trigram posting lists are built in memory on first lookup,
+    so keyword and citation queries never re-parse a PDF.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        index_path: str | Path | None = None,
+        folders: Sequence[str] = PAGE_INDEX_FOLDERS,
+    ):
+        self.root = Path(root)
+        self.index_path = Path(index_path) if index_path is not None else self.root / DEFAULT_PAGE_INDEX_PATH
+        self.folders = tuple(folders)
+        self._meta: dict[str, tuple[int, int]] = {}
+        self._documents: dict[str, _DocumentPages] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            data = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict) or data.get("version") != PAGE_INDEX_VERSION:
+            return
+        for rel, doc in data.get("documents", {}).items():
+            self._meta[rel] = (int(doc["size"]), int(doc["mtime_ns"]))
+            self._documents[rel] = _DocumentPages(list(doc["pages"]))
+
+    def save(self) -> None:
+        if not self._dirty and self.index_path.exists():
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": PAGE_INDEX_VERSION,
+            "documents": {
+                rel: {"size": size, "mtime_ns": mtime_ns, "pages": self._documents[rel].pages}
+                for rel, (size, mtime_ns) in sorted(self._meta.items())
+            },
+        }
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    @property
+    def documents(self) -> list[str]:
+        return sorted(self._documents)
+
+    def document_key(self, path: str | Path) -> str:
+        """Index key of ``path``: root-relative, forward slashes."""
+        candidate = Path(path)
+        if candidate.is_absolute():
+            try:
+                return candidate.relative_to(self.root).as_posix()
+            except ValueError:
+                return candidate.as_posix()
+        return candidate.as_posix().replace("\\", "/")
+
+    def _stat_signature(self, rel: str) -> tuple[int, int]:
+        stat_result = (self.root / rel).stat()
+        return (stat_result.st_size, stat_result.st_mtime_ns)
+
+    def signature(self, document: str | Path) -> tuple[int, int]:
+        """``(size, mtime_ns)`` of the indexed version of ``document``."""
+        return self._meta[self.ensure_document(document)]
+
+    def ensure_document(self, path: str | Path) -> str:
+        """Index one PDF if it is new or changed; returns its index key."""
+        rel = self.document_key(path)
+        signature = self._stat_signature(rel)
+        if self._meta.get(rel) == signature:
+            return rel
+        pages = extract_pdf_pages(self.root / rel)
+        self._meta[rel] = signature
+        self._documents[rel] = _DocumentPages(pages)
+        self._dirty = True
+        return rel
+
+    def ensure_documents(self, paths: Iterable[str | Path], workers: int | None = None) -> dict[str, Exception]:
+        """
+        Index several PDFs, parsing the new or changed ones in parallel worker
+        processes (pypdf is pure Python, so threads would not help). Returns
+        the documents that could not be indexed, by index key.
+        """
+        failures: dict[str, Exception] = {}
+        pending: dict[str, tuple[int, int]] = {}
+        for path in paths:
+            rel = self.document_key(path)
+            try:
+                signature = self._stat_signature(rel)
+            except OSError as exc:
+                failures[rel] = exc
+                continue
+            if self._meta.get(rel) != signature:
+                pending[rel] = signature
+        if not pending:
+            return failures
+
+        workers = max(1, min(workers or os.cpu_count() or 1, len(pending)))
+        results: dict[str, list[str] | Exception] = {}
+        if workers == 1:
+            for rel in pending:
+                try:
+                    results[rel] = extract_pdf_pages(self.root / rel)
+                except Exception as exc:
+                    results[rel] = exc
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = {rel: pool.submit(extract_pdf_pages, self.root / rel) for rel in pending}
+                for rel, future in futures.items():
+                    try:
+                        results[rel] = future.result()
+                    except Exception as exc:
+                        results[rel] = exc
+        for rel, result in results.items():
+            if isinstance(result, Exception):
+                failures[rel] = result
+                continue
+            self._meta[rel] = pending[rel]
+            self._documents[rel] = _DocumentPages(result)
+            self._dirty = True
+        return failures
+
+    def refresh(self, workers: int | None = None) -> dict[str, int]:
+        """Index new or changed PDFs under the configured folders and drop deleted ones."""
+        stats = {"indexed": 0, "unchanged": 0, "removed": 0, "failed": 0}
+        found: list[str] = []
+        for folder in self.folders:
+            found.extend(path.relative_to(self.root).as_posix() for path in sorted((self.root / folder).rglob("*.pdf")))
+        previous = {rel: self._meta.get(rel) for rel in found}
+        failures = self.ensure_documents(found, workers=workers)
+        if failures and PdfReader is None:
+            raise RuntimeError("pypdf is not installed; cannot index PDF pages.")
+        for rel in found:
+            if rel in failures:
+                stats["failed"] += 1
+            else:
+                stats["unchanged" if self._meta.get(rel) == previous[rel] else "indexed"] += 1
+        seen = set(found)
+        for rel in [rel for rel in self._meta if rel not in seen and rel.split("/", 1)[0] in self.folders]:
+            del self._meta[rel]
+            del self._documents[rel]
+            self._dirty = True
+            stats["removed"] += 1
+        self.save()
+        return stats
+
+    def pages(self, document: str | Path) -> list[str]:
+        return self._documents[self.ensure_document(document)].pages
+
+    def keyword_pages(self, document: str | Path, keyword: str) -> list[int]:
+        """1-based pages of ``document`` containing ``keyword`` (case-insensitive substring)."""
+        doc = self._documents[self.ensure_document(document)]
+        return [idx + 1 for idx in doc.pages_containing(keyword)]
+
+    def match_keywords(self, document: str | Path, keywords: Sequence[str], top: int = 3) -> KeywordMatch:
+        """
+        Pages with the most distinct keyword hits (ties: earlier page first),
+        the keywords found there and a snippet around the best page's first hit.
+        """
+        return self.match_keyword_sets(document, {"": keywords}, top=top)[""]
+
+    def match_keyword_sets(
+        self,
+        document: str | Path,
+        keyword_sets: Mapping[str, Sequence[str]],
+        top: int = 3,
+    ) -> dict[str, KeywordMatch]:
+        """``match_keywords`` for many keyword sets at once; each distinct keyword is looked up once."""
+        doc = self._documents[self.ensure_document(document)]
+        pages_by_keyword: dict[str, list[int]] = {}
+        out: dict[str, KeywordMatch] = {}
+        for key, keywords in keyword_sets.items():
+            hits: dict[int, list[str]] = {}
+            for keyword in keywords:
+                if keyword not in pages_by_keyword:
+                    pages_by_keyword[keyword] = doc.pages_containing(keyword)
+                for idx in pages_by_keyword[keyword]:
+                    hits.setdefault(idx, []).append(keyword)
+            out[key] = _rank_pages(hits, doc.pages, top)
+        return out
+
+    def search(self, text: str, documents: Sequence[str] | None = None, limit: int = 50) -> list[PageHit]:
+        """Pages containing every whitespace-separated term of ``text``, in document/page order."""
+        terms = [term for term in normalize_query(text).split() if term]
+        if not terms:
+            return []
+        out: list[PageHit] = []
+        for rel in documents if documents is not None else self.documents:
+            doc = self._documents.get(rel)
+            if doc is None:
+                continue
+            pages: set[int] | None = None
+            for term in terms:
+                found = set(doc.pages_containing(term))
+                pages = found if pages is None else pages & found
+                if not pages:
+                    break
+            for idx in sorted(pages or ()):
+                out.append(PageHit(rel, idx + 1, terms, snippet_around(doc.pages[idx], terms[0])))
+                if len(out) >= limit:
+                    return out
+        return out
@@ -6,6 +6,12 @@ from typing import Any
 
 
 APPROVED_STATE = "approved"
+# Written next to the rules directory by compliance/generate_compliance_artifacts.py.
+RULE_CHANGE_MANIFEST_NAME = "rule_changes.json"
+
+
+def read_rule_file(rule_path: str | Path) -> dict[str, Any]:
+    return json.loads(Path(rule_path).read_text(encoding="utf-8-sig"))
 
 
 def load_runtime_rules(rules_dir: str | Path) -> list[dict[str, Any]]:
@@ -20,8 +26,21 @@ def load_runtime_rules(rules_dir: str | Path) -> list[dict[str, Any]]:
 
     approved_rules: list[dict[str, Any]] = []
     for rule_path in sorted(root.glob("*.json")):
-        rule = json.loads(rule_path.read_text(encoding="utf-8-sig"))
+        rule = read_rule_file(rule_path)
         if rule.get("approval_state") == APPROVED_STATE:
             approved_rules.append(rule)
 
     return approved_rules
+
+
+def load_rule_change_manifest(path: str | Path) -> dict[str, Any]:
+    """The generator's latest change manifest, or an empty one (sequence 0)."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8-sig"))
+    except (OSError, ValueError):
+        return {"sequence": 0, "rules": {}}
+    if not isinstance(data, dict):
+        return {"sequence": 0, "rules": {}}
+    data.setdefault("sequence", 0)
+    data.setdefault("rules", {})
+    return data
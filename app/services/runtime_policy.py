@@ -3,7 +3,13 @@ from __future__ import annotations
 from dataclasses import dataclass
 from pathlib import Path
 
-from .policy_loader import load_runtime_rules
+from .policy_loader import (
+    APPROVED_STATE,
+    RULE_CHANGE_MANIFEST_NAME,
+    load_rule_change_manifest,
+    load_runtime_rules,
+    read_rule_file,
+)
 
 
 ACTION_TO_MODULE = {
@@ -69,3 +75,64 @@ class RuntimePolicyGate:
 
 def load_runtime_policy_gate(rules_dir: str | Path) -> RuntimePolicyGate:
     return RuntimePolicyGate(load_runtime_rules(rules_dir))
+
+
+class RuntimePolicyRegistry:
+    """
+    Long-lived policy gate that hot-reloads only the rules that changed.
+
+    ``apply_change_manifest`` reads the generator's change manifest and
+    re-reads just the rule files it lists. If the registry missed a
+    generator run (the manifest sequence skipped ahead), every file is
+    reloaded instead, since the manifest only describes the latest run.
+    """
+
+    def __init__(self, rules_dir: str | Path, manifest_path: str | Path | None = None):
+        self.rules_dir = Path(rules_dir)
+        self.manifest_path = (
+            Path(manifest_path) if manifest_path is not None else self.rules_dir.parent / RULE_CHANGE_MANIFEST_NAME
+        )
+        self._sequence = int(load_rule_change_manifest(self.manifest_path)["sequence"])
+        self._rules: dict[str, dict] = {}
+        self._gate = RuntimePolicyGate([])
+        self.reload_all()
+
+    def _rebuild_gate(self) -> None:
+        self._gate = RuntimePolicyGate(
+            [rule for _, rule in sorted(self._rules.items()) if rule.get("approval_state") == APPROVED_STATE]
+        )
+
+    def reload_all(self) -> None:
+        rules_dir = self.rules_dir
+        self._rules = (
+            {path.name: read_rule_file(path) for path in sorted(rules_dir.glob("*.json"))} if rules_dir.exists() else {}
+        )
+        self._rebuild_gate()
+
+    def apply_change_manifest(self) -> list[str]:
+        """Reload the rule files changed by the latest generator run; returns the file names re-read."""
+        manifest = load_rule_change_manifest(self.manifest_path)
+        sequence = int(manifest["sequence"])
+        if sequence == self._sequence:
+            return []
+        if sequence != self._sequence + 1:
+            self._sequence = sequence
+            self.reload_all()
+            return sorted(self._rules)
+        self._sequence = sequence
+        changed = sorted(set(manifest["rules"].get("added", [])) | set(manifest["rules"].get("updated", [])))
+        for name in changed:
+            path = self.rules_dir / name
+            if path.exists():
+                self._rules[name] = read_rule_file(path)
+            else:
+                self._rules.pop(name, None)
+        self._rebuild_gate()
+        return changed
+
+    @property
+    def gate(self) -> RuntimePolicyGate:
+        return self._gate
+
+    def decide(self, action: str) -> PolicyDecision:
+        return self._gate.decide(action)
@@ -0,0 +1,486 @@
+from __future__ import annotations
+
+import contextvars
+import json
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_futures
+from dataclasses import asdict, dataclass, field
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Callable, Iterator, Protocol, Sequence
+
+try:
+    from .tender_search import (
+        TenderRow,
+        collect_all_pages,
+        collect_tenders,
+        dedupe_tenders,
+        ensure_on_notices,
+        open_search_panel,
+        search_keyword,
+        wait_for_result_rows,
+    )
+    from .tracing import span
+except ImportError:
+    from tender_search import (
+        TenderRow,
+        collect_all_pages,
+        collect_tenders,
+        dedupe_tenders,
+        ensure_on_notices,
+        open_search_panel,
+        search_keyword,
+        wait_for_result_rows,
+    )
+    from tracing import span
+
+LOCAL_CACHE_MAX_AGE_SEC = 15 * 60
+LATENCY_SMOOTHING = 0.3
+
+
+def _no_log(_msg: str) -> None:
+    return None
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    keyword: str
+    collect_all_pages: bool = False
+    max_pages: int = 1
+    snapshot_dir: str | None = None
+
+    @property
+    def page_limit(self) -> int:
+        return max(1, self.max_pages) if self.collect_all_pages else 1
+
+
+class SearchBackend(Protocol):
+    """
+    A source of notice rows for a keyword.
+
+    ``last_used_fallback`` is True after a search that could not apply the
+    keyword on the portal and returned unfiltered rows instead.
+    """
+
+    name: str
+    last_used_fallback: bool
+
+    def search(self, query: SearchQuery) -> Iterator[TenderRow]: ...
+
+
+class SeleniumSearchBackend:
+    """The portal UI driven through Chrome: search, one retry, then an unfiltered baseline."""
+
+    name = "selenium"
+
+    def __init__(self, session: Callable[[], tuple], log: Callable[[str], None] = _no_log):
+        # ``session`` returns ``(driver, wait)``, creating the browser on first use.
+        self.session = session
+        self.log = log
+        self.last_used_fallback = False
+
+    def _collect(self, driver, wait, query: SearchQuery) -> list[TenderRow]:
+        if query.collect_all_pages:
+            return collect_all_pages(driver, wait, self.log, max_pages=query.page_limit, snapshot_dir=query.snapshot_dir)
+        wait_for_result_rows(
+            driver,
+            wait,
+            self.log,
+            attempts=3,
+            base_delay_sec=1.2,
+            snapshot_dir=query.snapshot_dir,
+            max_total_wait_sec=8.0,
+        )
+        return collect_tenders(driver, wait, self.log)
+
+    def search(self, query: SearchQuery) -> Iterator[TenderRow]:
+        self.last_used_fallback = False
+        driver, wait = self.session()
+        ensure_on_notices(driver, wait)
+        open_search_panel(driver, wait, self.log)
+        search_keyword(driver, wait, query.keyword)
+        rows = self._collect(driver, wait, query)
+
+        if not rows:
+            self.log("INFO: No results after first keyword filter attempt. Retrying once.")
+            # Reset form/page state and retry once.
+            ensure_on_notices(driver, wait)
+            open_search_panel(driver, wait, self.log)
+            search_keyword(driver, wait, query.keyword)
+            rows = self._collect(driver, wait, query)
+
+        if not rows:
+            # Final fallback: collect baseline rows without keyword filter.
+            self.log("WARN: search_filter_failed=true; collecting baseline results without filter.")
+            ensure_on_notices(driver, wait)
+            if query.collect_all_pages:
+                rows = collect_all_pages(
+                    driver, wait, self.log, max_pages=query.page_limit, snapshot_dir=query.snapshot_dir
+                )
+            else:
+                rows = collect_tenders(driver, wait, self.log)
+            self.last_used_fallback = True
+        yield from rows
+
+
+class _NoticeTableParser(HTMLParser):
+    """Collects table rows the way ``fetch_tenders_via_js`` reads the rendered notices page."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.rows: list[dict] = []
+        self._table_depth = 0
+        self._row: dict | None = None
+        self._cell: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = {name: value or "" for name, value in attrs}
+        if tag == "table":
+            self._table_depth += 1
+        elif tag == "tr":
+            self._row = {"cells": [], "links": [], "data_rel": attributes.get("data-rel", "").strip()}
+        elif tag == "td" and self._row is not None:
+            self._cell = []
+        elif tag == "a" and "data-rel" in attributes and self._row is not None:
+            if self._table_depth or "show-documents" in attributes.get("class", ""):
+                self._row["links"].append(attributes["data-rel"])
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "td" and self._row is not None and self._cell is not None:
+            self._row["cells"].append(" ".join("".join(self._cell).split()))
+            self._cell = None
+        elif tag == "tr" and self._row is not None:
+            self.rows.append(self._row)
+            self._row = None
+        elif tag == "table":
+            self._table_depth = max(0, self._table_depth - 1)
+
+    def handle_data(self, data: str) -> None:
+        if self._cell is not None:
+            self._cell.append(data)
+
+
+def parse_notice_rows(html: str, source_page: int = 1) -> list[TenderRow]:
+    """Notice rows from a rendered (or recorded) notices page; dossier links first, bare table rows otherwise."""
+    parser = _NoticeTableParser()
+    parser.feed(html)
+    parser.close()
+
+    def cell(cells: list[str], idx: int) -> str:
+        return cells[idx] if idx < len(cells) else ""
+
+    out: list[TenderRow] = []
+    for row in parser.rows:
+        for dossier in row["links"]:
+            cells = row["cells"]
+            out.append(
+                TenderRow(
+                    index=len(out) + 1,
+                    title=cell(cells, 1),
+                    institution=cell(cells, 2),
+                    deadline=cell(cells, 3),
+                    dossier_id=dossier,
+                    source_page=source_page,
+                    row_text=" | ".join(cells),
+                )
+            )
+    if out:
+        return out
+    for row in parser.rows:
+        cells = row["cells"]
+        if len(cells) < 3:
+            continue
+        title = cell(cells, 1) or cell(cells, 0)
+        institution = cell(cells, 2)
+        deadline = cell(cells, 3)
+        if not (title or institution or deadline):
+            continue
+        out.append(
+            TenderRow(
+                index=len(out) + 1,
+                title=title,
+                institution=institution,
+                deadline=deadline,
+                dossier_id=row["data_rel"],
+                source_page=source_page,
+                row_text=" | ".join(cells),
+            )
+        )
+    return out
+
+
+def _http_get(url: str, timeout_sec: float) -> str:
+    request = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0", "Accept": "text/html"})
+    with urllib.request.urlopen(request, timeout=timeout_sec) as response:
+        charset = response.headers.get_content_charset() or "utf-8"
+        return response.read().decode(charset, errors="replace")
+
+
+class HttpSearchBackend:
+    """
+    Server-rendered notice listings fetched directly, without a browser.
+
+    ``url_template`` takes ``{keyword}`` (URL-quoted) and ``{page}``; each page
+    is parsed with ``parse_notice_rows``. Pagination stops at an empty page
+    or when a page repeats the previous one.
+    """
+
+    name = "http"
+
+    def __init__(
+        self,
+        url_template: str,
+        timeout_sec: float = 10.0,
+        fetch: Callable[[str, float], str] = _http_get,
+    ):
+        self.url_template = url_template
+        self.timeout_sec = timeout_sec
+        self.fetch = fetch
+        self.last_used_fallback = False
+
+    def search(self, query: SearchQuery) -> Iterator[TenderRow]:
+        rows: list[TenderRow] = []
+        previous: tuple[str, ...] | None = None
+        for page in range(1, query.page_limit + 1):
+            url = self.url_template.format(keyword=urllib.parse.quote(query.keyword), page=page)
+            page_rows = parse_notice_rows(self.fetch(url, self.timeout_sec), source_page=page)
+            signature = tuple(r.dossier_id for r in page_rows[:5])
+            if not page_rows or signature == previous:
+                break
+            previous = signature
+            rows.extend(page_rows)
+        yield from dedupe_tenders(rows)
+
+
+class LocalCacheBackend:
+    """Results of recent searches, answered instantly while younger than ``max_age_sec``."""
+
+    name = "local_cache"
+
+    def __init__(self, cache_path: str | Path, max_age_sec: float = LOCAL_CACHE_MAX_AGE_SEC):
+        self.cache_path = Path(cache_path)
+        self.max_age_sec = max_age_sec
+        self.last_used_fallback = False
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict] = {}
+        try:
+            data = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if isinstance(data, dict):
+                self._entries = data
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def _key(query: SearchQuery) -> str:
+        return f"{query.keyword.strip().casefold()}|{query.page_limit}"
+
+    def search(self, query: SearchQuery) -> Iterator[TenderRow]:
+        with self._lock:
+            entry = self._entries.get(self._key(query))
+        if entry is None or time.time() - float(entry.get("stored_at", 0)) > self.max_age_sec:
+            return
+        for row in entry.get("rows", []):
+            yield TenderRow(**row)
+
+    def remember(self, query: SearchQuery, rows: Sequence[TenderRow]) -> None:
+        with self._lock:
+            self._entries[self._key(query)] = {"stored_at": time.time(), "rows": [asdict(row) for row in rows]}
+            cutoff = time.time() - self.max_age_sec
+            self._entries = {k: v for k, v in self._entries.items() if float(v.get("stored_at", 0)) >= cutoff}
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+            tmp_path.write_text(json.dumps(self._entries, ensure_ascii=False) + "\n", encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+
+
+@dataclass
+class SearchOutcome:
+    rows: list[TenderRow]
+    backend: str
+    used_fallback: bool
+    elapsed_sec: float
+    failures: dict[str, Exception] = field(default_factory=dict)
+
+
+@dataclass
+class _BackendHealth:
+    latency_sec: float | None = None
+    consecutive_failures: int = 0
+    down_until: float = 0.0
+
+
+class CompositeSearchBackend:
+    """
+    Several backends behind one ``search``, under a latency budget.
+
+    ``chain`` tries healthy backends one after another, fastest observed
+    first, until one returns rows; ``race`` starts them all and takes the
+    first non-empty answer. A backend that raises or overruns the budget
+    ``failure_threshold`` times in a row is skipped for ``cooldown_sec``.
+    Keyword-filtered answers from other backends are stored in ``cache``.
+    Threads cannot be cancelled, so an overrunning backend finishes in the
+    background and its late answer is dropped; until it does, that backend is
+    not started again (a Selenium backend drives a single browser).
+    """
+
+    name = "composite"
+
+    def __init__(
+        self,
+        backends: Sequence[SearchBackend],
+        mode: str = "chain",
+        latency_budget_sec: float = 60.0,
+        cache: LocalCacheBackend | None = None,
+        failure_threshold: int = 2,
+        cooldown_sec: float = 120.0,
+        log: Callable[[str], None] = _no_log,
+    ):
+        if mode not in {"chain", "race"}:
+            raise ValueError(f"Unknown search mode: {mode}")
+        self.backends = list(backends)
+        self.mode = mode
+        self.latency_budget_sec = latency_budget_sec
+        self.cache = cache
+        self.failure_threshold = failure_threshold
+        self.cooldown_sec = cooldown_sec
+        self.log = log
+        self.last_used_fallback = False
+        self.health = {backend.name: _BackendHealth() for backend in self.backends}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self.backends)), thread_name_prefix="search")
+        self._running: dict[str, Future] = {}
+        self._running_lock = threading.Lock()
+
+    def search(self, query: SearchQuery) -> Iterator[TenderRow]:
+        yield from self.run(query).rows
+
+    def ordered_backends(self) -> list[SearchBackend]:
+        """Healthy backends, fastest first (never-measured ones keep their configured order up front)."""
+        now = time.monotonic()
+        healthy = [b for b in self.backends if self.health[b.name].down_until <= now] or list(self.backends)
+        return sorted(healthy, key=lambda b: self.health[b.name].latency_sec or 0.0)
+
+    @staticmethod
+    def _collect(backend: SearchBackend, query: SearchQuery) -> tuple[list[TenderRow], bool, float]:
+        started = time.perf_counter()
+        with span("search_backend", backend=backend.name) as backend_span:
+            rows = list(backend.search(query))
+            if backend_span is not None:
+                backend_span.attributes["rows"] = len(rows)
+        return rows, bool(getattr(backend, "last_used_fallback", False)), time.perf_counter() - started
+
+    def _is_cache(self, backend: SearchBackend) -> bool:
+        return backend is self.cache or isinstance(backend, LocalCacheBackend)
+
+    def _submit(self, backend: SearchBackend, query: SearchQuery) -> Future | None:
+        """Start ``backend`` on the pool; None while its previous search is still running."""
+        with self._running_lock:
+            previous = self._running.get(backend.name)
+            if previous is not None and not previous.done():
+                return None
+            # Worker threads do not inherit context variables; carry the caller's trace along.
+            future = self._executor.submit(contextvars.copy_context().run, self._collect, backend, query)
+            self._running[backend.name] = future
+            return future
+
+    def _record_success(self, backend: SearchBackend, elapsed: float) -> None:
+        health = self.health[backend.name]
+        health.consecutive_failures = 0
+        if health.latency_sec is None:
+            health.latency_sec = elapsed
+        else:
+            health.latency_sec += LATENCY_SMOOTHING * (elapsed - health.latency_sec)
+
+    def _record_failure(self, backend: SearchBackend, error: Exception, failures: dict[str, Exception]) -> None:
+        failures[backend.name] = error
+        reason = f"{type(error).__name__}: {error}"
+        health = self.health[backend.name]
+        health.consecutive_failures += 1
+        if health.consecutive_failures >= self.failure_threshold:
+            health.down_until = time.monotonic() + self.cooldown_sec
+            health.consecutive_failures = 0
+            self.log(f"WARN: search backend {backend.name} marked unhealthy for {self.cooldown_sec:.0f}s ({reason}).")
+
+    def run(self, query: SearchQuery) -> SearchOutcome:
+        started = time.perf_counter()
+        deadline = time.monotonic() + self.latency_budget_sec
+        backends = self.ordered_backends()
+        failures: dict[str, Exception] = {}
+        futures: dict[Future, SearchBackend] = {}
+        busy: list[SearchBackend] = []
+        winner: tuple[SearchBackend, list[TenderRow], bool] | None = None
+
+        def start(backend: SearchBackend) -> Future | None:
+            future = self._submit(backend, query)
+            if future is None:
+                # Not a health failure: the overrun that keeps it busy was already counted.
+                busy.append(backend)
+                failures[backend.name] = RuntimeError("previous search is still running")
+            else:
+                futures[future] = backend
+            return future
+
+        def settle(future: Future) -> tuple[SearchBackend, list[TenderRow], bool] | None:
+            backend = futures[future]
+            try:
+                rows, used_fallback, elapsed = future.result()
+            except Exception as exc:
+                self._record_failure(backend, exc, failures)
+                return None
+            self._record_success(backend, elapsed)
+            return (backend, rows, used_fallback) if rows else None
+
+        if self.mode == "race":
+            for backend in backends:
+                start(backend)
+            pending = set(futures)
+            while pending and winner is None:
+                done, pending = wait_futures(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    winner = winner or settle(future)
+        else:
+            pending = set()
+            for backend in backends:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                future = start(backend)
+                if future is None:
+                    continue
+                done, _ = wait_futures([future], timeout=remaining)
+                if not done:
+                    pending = {future}
+                    break
+                winner = settle(future)
+                if winner is not None:
+                    break
+        for future in pending:
+            overrun = TimeoutError(f"exceeded latency budget of {self.latency_budget_sec:.1f}s")
+            self._record_failure(futures[future], overrun, failures)
+
+        elapsed = time.perf_counter() - started
+        if winner is None:
+            # A cache miss is not an answer: fail when every live backend that was tried failed.
+            live = [b for b in [*futures.values(), *busy] if not self._is_cache(b)]
+            live_failures = {b.name: failures[b.name] for b in live if b.name in failures}
+            if live_failures and len(live_failures) == len(live):
+                if len(live_failures) == 1:
+                    # A single live source keeps its own exception type for the caller's handling.
+                    raise next(iter(live_failures.values()))
+                raise RuntimeError(
+                    "All search backends failed: "
+                    + "; ".join(f"{name}: {type(error).__name__}: {error}" for name, error in failures.items())
+                )
+            self.last_used_fallback = False
+            return SearchOutcome([], backends[0].name if backends else "none", False, elapsed, failures)
+
+        backend, rows, used_fallback = winner
+        self.last_used_fallback = used_fallback
+        if self.cache is not None and backend is not self.cache and not used_fallback:
+            self.cache.remember(query, rows)
+        return SearchOutcome(rows, backend.name, used_fallback, elapsed, failures)
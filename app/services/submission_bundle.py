@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+import zipfile
+from pathlib import Path
+from typing import Any, Callable
+
+from .workspace_pack import verify_workspace_pack
+
+BUNDLE_CHUNK_BYTES = 1024 * 1024
+# Formats that are already compressed (DOCX/XLSX are ZIPs themselves); deflating them again only costs time.
+STORED_SUFFIXES = frozenset(
+    {".pdf", ".jpg", ".jpeg", ".png", ".gif", ".tif", ".tiff", ".zip", ".7z", ".rar", ".docx", ".xlsx", ".p7s", ".p7m"}
+)
+
+
+def size_limit(value: Any) -> int | None:
+    """
+    Byte limit from a profile or other configuration: a positive integer, or
+    ``None`` (also for missing, empty or 0 values) when no limit is enforced.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        raise ValueError(f"Invalid size limit: {value!r}")
+    try:
+        limit = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid size limit: {value!r}") from None
+    if limit < 0:
+        raise ValueError(f"Invalid size limit: {value!r}")
+    return limit or None
+
+
+def compression_for(path: Path) -> int:
+    return zipfile.ZIP_STORED if path.suffix.lower() in STORED_SUFFIXES else zipfile.ZIP_DEFLATED
+
+
+def _bundle_members(ws_dir: Path) -> list[Path]:
+    """Manifest order (primary, attachments, checklist, manifest), then any other files in the folder."""
+    ordered: list[Path] = []
+    manifest_path = ws_dir / "manifest.json"
+    if manifest_path.exists():
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        names = [manifest.get("primary_document", "")]
+        names += [row.get("filename", "") for row in manifest.get("attachments", [])]
+        names += [manifest.get("checklist", ""), "manifest.json"]
+        ordered = [ws_dir / name for name in names if name and (ws_dir / name).is_file()]
+    listed = set(ordered)
+    extras = sorted(p for p in ws_dir.iterdir() if p.is_file() and p not in listed and not p.name.startswith("."))
+    return ordered + extras
+
+
+def build_submission_bundle(
+    workspace_dir: str | Path,
+    output_path: str | Path | None = None,
+    max_file_bytes: int | None = None,
+    max_bundle_bytes: int | None = None,
+    verify: bool = True,
+    on_progress: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Stream a workspace pack into a ZIP ready for portal upload.
+
+    Files are copied into the archive in chunks, never loaded whole. Already
+    compressed formats are stored, text formats deflated. The pack is
+    verified against its manifest first, per-file and bundle size limits are
+    enforced, and the ZIP only appears at ``output_path`` (default
+    ``<workspace>.zip`` next to the folder) once it is complete.
+    """
+    started = time.perf_counter()
+    ws_dir = Path(workspace_dir)
+    if not ws_dir.is_dir():
+        raise ValueError(f"Workspace does not exist: {ws_dir}")
+    if verify and (ws_dir / "manifest.json").exists():
+        report = verify_workspace_pack(ws_dir)
+        if not report["ok"]:
+            raise ValueError(
+                "Workspace failed verification: "
+                + ", ".join(f"{p['filename']} ({p['problem']})" for p in report["problems"])
+            )
+
+    members = _bundle_members(ws_dir)
+    sizes = {member: member.stat().st_size for member in members}
+    if max_file_bytes:
+        too_large = [f"{m.name} ({sizes[m]} bytes)" for m in members if sizes[m] > max_file_bytes]
+        if too_large:
+            raise ValueError(f"Files exceed the portal limit of {max_file_bytes} bytes: " + ", ".join(too_large))
+
+    bundle = Path(output_path) if output_path is not None else ws_dir.with_name(ws_dir.name + ".zip")
+    bundle.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = bundle.with_name(f".{bundle.name}.tmp")
+    bytes_total = sum(sizes.values())
+    bytes_done = 0
+    try:
+        with zipfile.ZipFile(tmp_path, "w", allowZip64=True) as zout:
+            for files_done, member in enumerate(members, start=1):
+                info = zipfile.ZipInfo.from_file(member, arcname=member.name)
+                info.compress_type = compression_for(member)
+                force_zip64 = sizes[member] >= zipfile.ZIP64_LIMIT
+                with member.open("rb") as src, zout.open(info, "w", force_zip64=force_zip64) as dst:
+                    shutil.copyfileobj(src, dst, BUNDLE_CHUNK_BYTES)
+                bytes_done += sizes[member]
+                if on_progress is not None:
+                    on_progress(
+                        {
+                            "filename": member.name,
+                            "files_done": files_done,
+                            "files_total": len(members),
+                            "bytes_done": bytes_done,
+                            "bytes_total": bytes_total,
+                        }
+                    )
+        bundle_size = tmp_path.stat().st_size
+        if max_bundle_bytes and bundle_size > max_bundle_bytes:
+            raise ValueError(f"Bundle is {bundle_size} bytes, over the portal limit of {max_bundle_bytes} bytes")
+        os.replace(tmp_path, bundle)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    elapsed = time.perf_counter() - started
+    return {
+        "bundle_path": str(bundle),
+        "files": len(members),
+        "bytes_in": bytes_total,
+        "bytes_out": bundle_size,
+        "elapsed_sec": round(elapsed, 3),
+        "mb_per_sec": round(bytes_total / 1_000_000 / elapsed, 2) if elapsed > 0 else 0.0,
+    }
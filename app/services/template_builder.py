@@ -1,68 +1,189 @@
 ﻿# -*- coding: utf-8 -*-
 import re
+import threading
 import zipfile
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-import xml.etree.ElementTree as ET
+from typing import Any
+
+from . import docx_xml
+from .docx_text import iter_paragraph_nodes, iter_text_part_names
+from .zip_stream import copy_zip_entry
 
 PLACEHOLDER_PATTERN = re.compile(r"\{\{([A-Za-z0-9_]+)\}\}")
-W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W_NS = docx_xml.W_NS
 NS = {"w": W_NS}
-
-
-def _iter_target_xml_entries(zf: zipfile.ZipFile):
-    for name in zf.namelist():
-        if not name.startswith("word/") or not name.endswith(".xml"):
-            continue
-        if not any(token in name for token in ("document.xml", "header", "footer")):
-            continue
-        yield name
-
-
-def _replace_placeholders_in_xml(xml_bytes: bytes, values: dict[str, str]) -> bytes:
-    root = ET.fromstring(xml_bytes)
-
-    for para in root.findall(".//w:p", NS):
-        text_nodes = para.findall(".//w:t", NS)
-        if not text_nodes:
-            continue
-
-        merged = "".join(node.text or "" for node in text_nodes)
-        replaced = merged
-        for key, raw_value in values.items():
-            replaced = replaced.replace("{{" + key + "}}", raw_value)
-
-        if replaced != merged:
-            text_nodes[0].text = replaced
-            for extra in text_nodes[1:]:
-                extra.text = ""
-
-    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
-
-
-def extract_placeholders_from_docx(template_path: str) -> list[str]:
+_W_T = f"{{{W_NS}}}t"
+TEMPLATE_CACHE_SIZE = 8
+
+
+@dataclass
+class _PlaceholderParagraph:
+    text_nodes: list[Any]
+    original_texts: list[str | None]
+    # Only runs overlapped by a placeholder: (node index, node start offset, [(start, end, key)]).
+    runs: list[tuple[int, int, list[tuple[int, int, str]]]]
+
+
+def _may_have_placeholders(zf: zipfile.ZipFile, name: str) -> bool:
+    """Stream the part's ``w:t`` text looking for ``{{``, even split across runs, without building a tree."""
+    tail = ""
+    with zf.open(name) as fh:
+        for text in docx_xml.iter_text_runs(fh, tag=_W_T):
+            if "{{" in tail + text:
+                return True
+            if text:
+                tail = text[-1]
+    return False
+
+
+def _compile_paragraph(text_nodes: list[Any], merged: str) -> _PlaceholderParagraph | None:
+    matches = [(m.start(), m.end(), m.group(1)) for m in PLACEHOLDER_PATTERN.finditer(merged)]
+    if not matches:
+        return None
+    runs: list[tuple[int, int, list[tuple[int, int, str]]]] = []
+    offset = 0
+    for idx, node in enumerate(text_nodes):
+        end = offset + len(node.text or "")
+        overlapping = [match for match in matches if match[0] < end and match[1] > offset]
+        if overlapping:
+            runs.append((idx, offset, overlapping))
+        offset = end
+    return _PlaceholderParagraph(text_nodes, [node.text for node in text_nodes], runs)
+
+
+def _substitute_runs(para: _PlaceholderParagraph, values: dict[str, str]) -> None:
+    """
+    Rewrite only the runs a placeholder touches.
+
+    The value goes into the run where the placeholder starts; the remainder of
+    a placeholder split across runs is cut from the following runs, so text
+    outside placeholders keeps its run (and formatting).
+    """
+    for idx, start, matches in para.runs:
+        text = para.original_texts[idx] or ""
+        pieces: list[str] = []
+        pos = 0
+        changed = False
+        for match_start, match_end, key in matches:
+            if key not in values:
+                continue
+            changed = True
+            local_start = max(match_start - start, 0)
+            pieces.append(text[pos:local_start])
+            if match_start >= start:
+                pieces.append(str(values[key]))
+            pos = min(match_end - start, len(text))
+        if changed:
+            pieces.append(text[pos:])
+            para.text_nodes[idx].text = "".join(pieces)
+
+
+@dataclass
+class _CompiledPart:
+    root: Any
+    paragraphs: list[_PlaceholderParagraph]
+
+
+class CompiledTemplate:
+    """
+    A DOCX template parsed once.
+
+    Parts without placeholders are copied from the template file on every
+    render. For the rest only the paragraphs with placeholders are kept,
+    with the runs each placeholder spans; a render patches those runs in
+    place, serializes the part and restores the original text.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.parts: dict[str, _CompiledPart] = {}
+        placeholders: set[str] = set()
+        with zipfile.ZipFile(path, "r") as zf:
+            for name in iter_text_part_names(zf):
+                # Most parts (headers, footers) carry no placeholder and are copied raw on render.
+                if not _may_have_placeholders(zf, name):
+                    continue
+                root = docx_xml.fromstring(zf.read(name))
+                paragraphs: list[_PlaceholderParagraph] = []
+                for _, text_nodes in iter_paragraph_nodes(root):
+                    merged = "".join(node.text or "" for node in text_nodes)
+                    if "{{" not in merged:
+                        continue
+                    compiled_para = _compile_paragraph(text_nodes, merged)
+                    if compiled_para is not None:
+                        placeholders.update(key for _, _, matches in compiled_para.runs for *_, key in matches)
+                        paragraphs.append(compiled_para)
+                if paragraphs:
+                    self.parts[name] = _CompiledPart(root=root, paragraphs=paragraphs)
+        self.placeholders = sorted(placeholders)
+        # Renders patch the shared trees, so serialization is serialized.
+        self._lock = threading.Lock()
+
+    def _render_part(self, part: _CompiledPart, values: dict[str, str]) -> bytes:
+        with self._lock:
+            try:
+                for para in part.paragraphs:
+                    _substitute_runs(para, values)
+                return docx_xml.tostring(part.root)
+            finally:
+                for para in part.paragraphs:
+                    for node, original in zip(para.text_nodes, para.original_texts):
+                        node.text = original
+
+    def render(self, output_path: str | Path, values: dict[str, str]) -> None:
+        dst = Path(output_path)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(self.path, "r") as zin:
+            with zipfile.ZipFile(dst, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+                for item in zin.infolist():
+                    part = self.parts.get(item.filename)
+                    if part is None:
+                        copy_zip_entry(zin, zout, item)
+                    else:
+                        zout.writestr(item, self._render_part(part, values))
+
+
+_TEMPLATE_CACHE: "OrderedDict[str, tuple[int, int, CompiledTemplate]]" = OrderedDict()
+_TEMPLATE_CACHE_LOCK = threading.Lock()
+
+
+def compile_docx_template(template_path: str | Path) -> CompiledTemplate:
+    """Return the compiled template, reusing it while the file's mtime and size are unchanged."""
     path = Path(template_path)
     if not path.exists():
-        raise FileNotFoundError(template_path)
+        raise FileNotFoundError(str(template_path))
+    stat_result = path.stat()
+    key = str(path.resolve())
+    with _TEMPLATE_CACHE_LOCK:
+        cached = _TEMPLATE_CACHE.get(key)
+        if cached and cached[0] == stat_result.st_mtime_ns and cached[1] == stat_result.st_size:
+            _TEMPLATE_CACHE.move_to_end(key)
+            return cached[2]
+    compiled = CompiledTemplate(path)
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE[key] = (stat_result.st_mtime_ns, stat_result.st_size, compiled)
+        _TEMPLATE_CACHE.move_to_end(key)
+        while len(_TEMPLATE_CACHE) > TEMPLATE_CACHE_SIZE:
+            _TEMPLATE_CACHE.popitem(last=False)
+    return compiled
+
+
+def clear_template_cache() -> None:
+    with _TEMPLATE_CACHE_LOCK:
+        _TEMPLATE_CACHE.clear()
 
-    placeholders: set[str] = set()
-    with zipfile.ZipFile(path, "r") as zf:
-        for name in _iter_target_xml_entries(zf):
-            xml_bytes = zf.read(name)
-            root = ET.fromstring(xml_bytes)
-            for para in root.findall(".//w:p", NS):
-                text_nodes = para.findall(".//w:t", NS)
-                merged = "".join(node.text or "" for node in text_nodes)
-                matches = PLACEHOLDER_PATTERN.findall(merged)
-                placeholders.update(matches)
-    return sorted(placeholders)
 
+def extract_placeholders_from_docx(template_path: str) -> list[str]:
+    return list(compile_docx_template(template_path).placeholders)
 
-def validate_required_template_values(
-    template_path: str,
+
+def _missing_template_values(
+    placeholders: list[str],
     values: dict[str, str],
-    required_fields: list[str] | None = None,
+    required_fields: list[str] | None,
 ) -> list[str]:
-    placeholders = extract_placeholders_from_docx(template_path)
     targets = required_fields if required_fields is not None else placeholders
     missing: list[str] = []
 
@@ -74,20 +195,18 @@ def validate_required_template_values(
     return sorted(set(missing))
 
 
-def render_docx_template(template_path: str, output_path: str, values: dict[str, str]) -> None:
-    src = Path(template_path)
-    dst = Path(output_path)
-    dst.parent.mkdir(parents=True, exist_ok=True)
+def validate_required_template_values(
+    template_path: str,
+    values: dict[str, str],
+    required_fields: list[str] | None = None,
+) -> list[str]:
+    placeholders = extract_placeholders_from_docx(template_path)
+    return _missing_template_values(placeholders, values, required_fields)
 
-    missing = validate_required_template_values(str(src), values)
+
+def render_docx_template(template_path: str, output_path: str, values: dict[str, str]) -> None:
+    compiled = compile_docx_template(template_path)
+    missing = _missing_template_values(compiled.placeholders, values, None)
     if missing:
         raise ValueError("Missing required template values: " + ", ".join(missing))
-
-    with zipfile.ZipFile(src, "r") as zin:
-        target_entries = set(_iter_target_xml_entries(zin))
-        with zipfile.ZipFile(dst, "w", compression=zipfile.ZIP_DEFLATED) as zout:
-            for item in zin.infolist():
-                data = zin.read(item.filename)
-                if item.filename in target_entries:
-                    data = _replace_placeholders_in_xml(data, values)
-                zout.writestr(item, data)
+    compiled.render(output_path, values)
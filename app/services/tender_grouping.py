@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import Protocol, TypeVar
+
+# Portal downloads separate the words with spaces, hyphens or underscores.
+TENDER_DOC_RE = re.compile(r"тендерска[\s_-]+документац")
+TECH_SPEC_RE = re.compile(r"техничка[\s_-]+спецификац")
+ORPHAN_WINDOW_SEC = 12 * 3600
+
+
+class GroupableFile(Protocol):
+    path: Path
+    tender_id: str | None
+
+
+T = TypeVar("T", bound=GroupableFile)
+
+
+def is_tender_document(path: Path) -> bool:
+    return TENDER_DOC_RE.search(path.name.lower()) is not None
+
+
+def is_tech_spec(path: Path) -> bool:
+    return TECH_SPEC_RE.search(path.name.lower()) is not None
+
+
+class TenderDocIndex:
+    """Tender documents sorted by mtime for nearest-neighbour lookups."""
+
+    def __init__(self, docs: list[tuple[float, str]]):
+        # Stable sort keeps list order as the tie-breaker, matching min() over the original list.
+        ordered = sorted(enumerate(docs), key=lambda item: (item[1][0], item[0]))
+        self._mtimes = [mtime for _, (mtime, _) in ordered]
+        self._entries = [(order, tender_id) for order, (_, tender_id) in ordered]
+
+    def nearest(self, mtime: float) -> tuple[str, float] | None:
+        if not self._mtimes:
+            return None
+        pos = bisect_left(self._mtimes, mtime)
+        best: tuple[float, int, str] | None = None
+        for probe in (pos - 1, pos):
+            if not 0 <= probe < len(self._mtimes):
+                continue
+            # Jump to the first entry of an equal-mtime run so the earliest document wins ties.
+            first = bisect_left(self._mtimes, self._mtimes[probe])
+            order, tender_id = self._entries[first]
+            candidate = (abs(self._mtimes[first] - mtime), order, tender_id)
+            if best is None or candidate[:2] < best[:2]:
+                best = candidate
+        assert best is not None
+        return best[2], best[0]
+
+
+def group_files_by_tender(
+    items: list[T],
+    mtimes: dict[Path, float] | None = None,
+    tender_id_filter: str = "",
+    window_sec: float = ORPHAN_WINDOW_SEC,
+) -> dict[str, list[T]]:
+    """
+    Group parsed files by tender id.
+
+    Untagged technical specifications inherit the id of the tender document
+    downloaded closest in time (within ``window_sec``), or ``tender_id_filter``
+    when one is given. Each file is stat'ed at most once.
+    """
+    resolved: dict[Path, float] = dict(mtimes or {})
+
+    def mtime_of(path: Path) -> float:
+        if path not in resolved:
+            resolved[path] = path.stat().st_mtime
+        return resolved[path]
+
+    index = TenderDocIndex(
+        [(mtime_of(p.path), p.tender_id) for p in items if p.tender_id and is_tender_document(p.path)]
+    )
+    for item in items:
+        if item.tender_id or not is_tech_spec(item.path):
+            continue
+        if tender_id_filter:
+            item.tender_id = tender_id_filter
+            continue
+        match = index.nearest(mtime_of(item.path))
+        # Keep assignment conservative for files downloaded in the same window.
+        if match is not None and match[1] <= window_sec:
+            item.tender_id = match[0]
+
+    grouped: dict[str, list[T]] = {}
+    for item in items:
+        if not item.tender_id:
+            continue
+        if tender_id_filter and item.tender_id != tender_id_filter:
+            continue
+        grouped.setdefault(item.tender_id, []).append(item)
+    return grouped
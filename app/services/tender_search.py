@@ -18,6 +18,11 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 
+try:
+    from .tracing import span, traced
+except ImportError:
+    from tracing import span, traced
+
 BASE_URL = "https://e-nabavki.gov.mk/PublicAccess/home.aspx#/notices"
 ROW_SELECTORS = [
     "a.show-documents[data-rel]",
@@ -39,6 +44,7 @@ class TenderRow:
     row_text: str = ""
 
 
+@traced()
 def setup_driver(headless: bool, download_dir: str) -> Chrome:
     os.makedirs(download_dir, exist_ok=True)
     opts = Options()
@@ -86,6 +92,7 @@ def wait_dom_ready(driver: Chrome, sec: int = 20) -> None:
     )
 
 
+@traced()
 def ensure_on_notices(driver: Chrome, wait: WebDriverWait) -> None:
     # Ultra-fast path: if search controls are present, stay on current page context.
     try:
@@ -140,6 +147,7 @@ def ensure_on_notices(driver: Chrome, wait: WebDriverWait) -> None:
             pass
 
 
+@traced()
 def open_search_panel(driver: Chrome, wait: WebDriverWait, log: Callable[[str], None]) -> None:
     panel_xpath = "//span[@label-for='SEARCH']"
     field_xpath = "//input[@ng-model='searchModel.Subject']"
@@ -180,6 +188,7 @@ def open_search_panel(driver: Chrome, wait: WebDriverWait, log: Callable[[str],
                 time.sleep(0.4)
 
 
+@traced()
 def search_keyword(driver: Chrome, wait: WebDriverWait, keyword: str) -> None:
     # Fast-path: exact controls from current e-nabavki notices page layout.
     try:
@@ -334,6 +343,7 @@ def has_any_result_rows(driver: Chrome) -> bool:
         return False
 
 
+@traced()
 def save_debug_snapshot(
     driver: Chrome, snapshot_dir: str, prefix: str = "search-timeout"
 ) -> tuple[str, str]:
@@ -350,6 +360,7 @@ def save_debug_snapshot(
     return str(html_path), str(png_path)
 
 
+@traced()
 def wait_for_result_rows(
     driver: Chrome,
     wait: WebDriverWait,
@@ -391,6 +402,7 @@ def wait_for_result_rows(
     return False
 
 
+@traced()
 def collect_tenders(driver: Chrome, wait: WebDriverWait, log: Callable[[str], None]) -> list[TenderRow]:
     data = fetch_tenders_via_js(driver)
     if not data:
@@ -412,6 +424,7 @@ def collect_tenders(driver: Chrome, wait: WebDriverWait, log: Callable[[str], No
     return rows
 
 
+@traced()
 def click_next_page(driver: Chrome, wait: WebDriverWait, log: Callable[[str], None]) -> bool:
     # Fast-path: click next paginator using JS lookup before expensive XPath fallbacks.
     try:
@@ -479,6 +492,7 @@ def dedupe_tenders(rows: list[TenderRow]) -> list[TenderRow]:
     return out
 
 
+@traced()
 def collect_all_pages(
     driver: Chrome,
     wait: WebDriverWait,
@@ -490,15 +504,18 @@ def collect_all_pages(
     page = 1
     prev_signature: tuple[str, ...] | None = None
     while page <= max_pages:
-        wait_for_result_rows(
-            driver,
-            wait,
-            log,
-            attempts=2,
-            base_delay_sec=1.0,
-            snapshot_dir=snapshot_dir,
-        )
-        page_rows = collect_tenders(driver, wait, log)
+        with span("result_page", page=page) as page_span:
+            wait_for_result_rows(
+                driver,
+                wait,
+                log,
+                attempts=2,
+                base_delay_sec=1.0,
+                snapshot_dir=snapshot_dir,
+            )
+            page_rows = collect_tenders(driver, wait, log)
+            if page_span is not None:
+                page_span.attributes["rows"] = len(page_rows)
         for r in page_rows:
             r.source_page = page
         log(f"INFO: Page {page} rows: {len(page_rows)}")
@@ -529,6 +546,7 @@ def collect_all_pages(
     return unique_rows
 
 
+@traced()
 def find_dossier_on_pages(
     driver: Chrome,
     wait: WebDriverWait,
@@ -557,6 +575,7 @@ def find_dossier_on_pages(
     return False
 
 
+@traced()
 def click_show_for_dossier(driver: Chrome, wait: WebDriverWait, dossier_id: str) -> None:
     show = wait.until(
         EC.element_to_be_clickable(
@@ -566,6 +585,7 @@ def click_show_for_dossier(driver: Chrome, wait: WebDriverWait, dossier_id: str)
     js_click(driver, show)
 
 
+@traced()
 def click_download_all_in_modal(driver: Chrome, wait: WebDriverWait) -> None:
     button = wait.until(
         EC.element_to_be_clickable((By.XPATH, "//span[@label-for='DOWNLOAD_ALL_TD_DOCS']"))
@@ -573,6 +593,7 @@ def click_download_all_in_modal(driver: Chrome, wait: WebDriverWait) -> None:
     js_click(driver, button)
 
 
+@traced()
 def handle_download_doc_without_login(driver: Chrome, log: Callable[[str], None]) -> int:
     try:
         try:
@@ -612,6 +633,7 @@ def handle_download_doc_without_login(driver: Chrome, log: Callable[[str], None]
         return 0
 
 
+@traced()
 def login_on_download_doc(
     driver: Chrome, username: str, password: str, log: Callable[[str], None], timeout: int = 15
 ) -> bool:
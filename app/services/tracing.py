@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import functools
+import json
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+TRACE_FILE_NAME = "traces.jsonl"
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+_export_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    started_at: float  # epoch seconds
+    duration_sec: float = 0.0
+    status: str = "ok"
+    error: str = ""
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+
+class Trace:
+    """Finished spans of one traced operation (a search, a download run, an extraction)."""
+
+    def __init__(self, name: str, attributes: dict[str, Any]):
+        self.trace_id = uuid.uuid4().hex
+        self.root = Span(name, self.trace_id, uuid.uuid4().hex[:16], None, time.time(), attributes=attributes)
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def add(self, span: Span) -> None:
+        with self._lock:
+            # Spans that finish after the trace was exported (abandoned worker threads) are dropped.
+            if not self._closed:
+                self.spans.append(span)
+
+    def close(self) -> list[Span]:
+        with self._lock:
+            self._closed = True
+            return [self.root, *self.spans]
+
+
+_active: ContextVar[tuple[Trace, Span] | None] = ContextVar("tender_trace_active", default=None)
+
+
+def current_span() -> Span | None:
+    active = _active.get()
+    return active[1] if active is not None else None
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """
+    Time a stage of the active trace, nested under the enclosing span.
+
+    Outside a trace this yields None and records nothing, so library code
+    can be instrumented unconditionally.
+    """
+    active = _active.get()
+    if active is None:
+        yield None
+        return
+    trace_, parent = active
+    current = Span(name, trace_.trace_id, uuid.uuid4().hex[:16], parent.span_id, time.time(), attributes=attributes)
+    token = _active.set((trace_, current))
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as exc:
+        current.status = "error"
+        current.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        current.duration_sec = time.perf_counter() - started
+        _active.reset(token)
+        trace_.add(current)
+
+
+def traced(name: str | None = None) -> Callable[[_F], _F]:
+    """Decorator form of ``span`` named after the function."""
+
+    def decorate(func: _F) -> _F:
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if _active.get() is None:
+                return func(*args, **kwargs)
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def summarize_spans(spans: list[Span]) -> str:
+    """One log line: root duration, then per-stage totals (count when repeated) in first-seen order."""
+    if not spans:
+        return ""
+    root = spans[0]
+    totals: dict[str, list[float]] = {}
+    for item in sorted(spans[1:], key=lambda s: s.started_at):
+        entry = totals.setdefault(item.name, [0.0, 0])
+        entry[0] += item.duration_sec
+        entry[1] += 1
+    parts = [f"TRACE {root.name} total_sec={root.duration_sec:.2f} status={root.status}"]
+    for stage, (total, count) in totals.items():
+        parts.append(f"{stage}={total:.2f}" + (f"x{count}" if count > 1 else ""))
+    return " ".join(parts)
+
+
+def export_spans(spans: list[Span], path: str | Path) -> None:
+    """Append spans as JSON lines; several threads and processes may share one trace file."""
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    payload = "".join(json.dumps(asdict(item), ensure_ascii=False, default=str) + "\n" for item in spans)
+    with _export_lock, target.open("a", encoding="utf-8") as handle:
+        handle.write(payload)
+
+
+@contextmanager
+def trace(
+    name: str,
+    export_path: str | Path | None = None,
+    log: Callable[[str], None] | None = None,
+    **attributes: Any,
+) -> Iterator[Span]:
+    """
+    Root span of one operation. On exit its spans are appended to
+    ``export_path`` and the per-stage summary goes to ``log``. Inside an
+    active trace this is just a nested span.
+    """
+    if _active.get() is not None:
+        with span(name, **attributes) as nested:
+            yield nested  # type: ignore[misc]
+        return
+    trace_ = Trace(name, attributes)
+    token = _active.set((trace_, trace_.root))
+    started = time.perf_counter()
+    try:
+        yield trace_.root
+    except BaseException as exc:
+        trace_.root.status = "error"
+        trace_.root.error = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        trace_.root.duration_sec = time.perf_counter() - started
+        _active.reset(token)
+        spans = trace_.close()
+        if export_path is not None:
+            try:
+                export_spans(spans, export_path)
+            except OSError as exc:
+                if log is not None:
+                    log(f"WARN: Could not write trace file {export_path}: {exc}")
+        if log is not None:
+            log(summarize_spans(spans))
@@ -3,8 +3,14 @@ from __future__ import annotations
 import csv
 import json
 import re
-import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
+
+from .blob_store import BLOB_DIR_NAME, copy_with_sha256, materialize_blob, prune_blobs, sha256_file, store_blob
+
+PACK_WORKERS = 4
+WORKSPACE_PREFIX = "workspace-"
 
 
 def _slug(value: str) -> str:
@@ -12,8 +18,13 @@ def _slug(value: str) -> str:
     return clean or "workspace"
 
 
+def workspace_name(dossier_ref: str) -> str:
+    """Folder name of a dossier's workspace; refs differing only in punctuation share it."""
+    return f"{WORKSPACE_PREFIX}{_slug(dossier_ref)}"
+
+
 def _workspace_dir(base_output_dir: str | Path, dossier_ref: str) -> Path:
-    return Path(base_output_dir) / f"workspace-{_slug(dossier_ref)}"
+    return Path(base_output_dir) / workspace_name(dossier_ref)
 
 
 def create_workspace_pack(
@@ -21,7 +32,18 @@ def create_workspace_pack(
     dossier_ref: str,
     primary_document_path: str | Path,
     required_attachment_paths: list[str] | None = None,
+    blob_store_dir: str | Path | None = None,
 ) -> dict[str, str]:
+    """
+    Assemble a workspace folder with the primary document and its attachments.
+
+    Attachments go through a content-addressed blob store (``.blobs`` under
+    ``base_output_dir`` unless ``blob_store_dir`` is given) and are reflinked
+    or hardlinked into the workspace, so the same certificate reused across
+    tenders is stored once. Attachments are ingested on a thread pool and
+    hashed while they stream; manifest.json and checklist.csv record each
+    file's size and SHA-256 for ``verify_workspace_pack``.
+    """
     base = Path(base_output_dir)
     base.mkdir(parents=True, exist_ok=True)
     primary = Path(primary_document_path)
@@ -38,27 +60,36 @@ def create_workspace_pack(
 
     primary_name = f"00-primary-{_slug(primary.stem)}{primary.suffix.lower()}"
     primary_dst = ws_dir / primary_name
-    shutil.copy2(primary, primary_dst)
+    primary_sha256, primary_size = copy_with_sha256(primary, primary_dst)
+
+    store_dir = Path(blob_store_dir) if blob_store_dir is not None else base / BLOB_DIR_NAME
 
-    copied_attachments: list[dict[str, str]] = []
-    for idx, source in enumerate(sorted(required), start=1):
+    def ingest(idx: int, source: str) -> dict[str, Any]:
         src = Path(source)
         dst_name = f"{idx:02d}-attachment-{_slug(src.stem)}{src.suffix.lower()}"
-        dst = ws_dir / dst_name
-        shutil.copy2(src, dst)
-        copied_attachments.append(
-            {
-                "source_path": str(src),
-                "copied_filename": dst_name,
-                "status": "ok",
-            }
-        )
+        sha256, blob = store_blob(store_dir, src)
+        link = materialize_blob(blob, ws_dir / dst_name)
+        return {
+            "source_path": str(src),
+            "copied_filename": dst_name,
+            "size_bytes": blob.stat().st_size,
+            "sha256": sha256,
+            "link": link,
+            "status": "ok",
+        }
+
+    ordered = sorted(required)
+    if len(ordered) <= 1:
+        copied_attachments = [ingest(idx, src) for idx, src in enumerate(ordered, start=1)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(PACK_WORKERS, len(ordered))) as pool:
+            copied_attachments = list(pool.map(ingest, range(1, len(ordered) + 1), ordered))
 
     checklist_path = ws_dir / "checklist.csv"
     with checklist_path.open("w", encoding="utf-8", newline="") as handle:
         writer = csv.DictWriter(
             handle,
-            fieldnames=["item", "type", "source_path", "copied_filename", "status"],
+            fieldnames=["item", "type", "source_path", "copied_filename", "size_bytes", "sha256", "status"],
         )
         writer.writeheader()
         writer.writerow(
@@ -67,6 +98,8 @@ def create_workspace_pack(
                 "type": "primary",
                 "source_path": str(primary),
                 "copied_filename": primary_name,
+                "size_bytes": primary_size,
+                "sha256": primary_sha256,
                 "status": "ok",
             }
         )
@@ -77,6 +110,8 @@ def create_workspace_pack(
                     "type": "attachment",
                     "source_path": row["source_path"],
                     "copied_filename": row["copied_filename"],
+                    "size_bytes": row["size_bytes"],
+                    "sha256": row["sha256"],
                     "status": row["status"],
                 }
             )
@@ -85,7 +120,20 @@ def create_workspace_pack(
         "workspace_dir": str(ws_dir),
         "dossier_ref": dossier_ref,
         "primary_document": primary_name,
+        "primary_size_bytes": primary_size,
+        "primary_sha256": primary_sha256,
         "required_attachment_count": len(copied_attachments),
+        "attachments": [
+            {
+                "filename": row["copied_filename"],
+                "source_path": row["source_path"],
+                "size_bytes": row["size_bytes"],
+                "sha256": row["sha256"],
+                "link": row["link"],
+            }
+            for row in copied_attachments
+        ],
+        "blob_store": str(store_dir),
         "checklist": "checklist.csv",
     }
     manifest_path = ws_dir / "manifest.json"
@@ -97,3 +145,73 @@ def create_workspace_pack(
         "manifest_path": str(manifest_path),
     }
 
+
+def prune_workspace_blobs(base_output_dir: str | Path, blob_store_dir: str | Path | None = None) -> list[Path]:
+    """
+    Delete blobs no workspace under ``base_output_dir`` references any more.
+
+    References are read from each workspace's manifest.json that points at
+    this store; the store defaults to ``.blobs`` under ``base_output_dir`` as
+    in ``create_workspace_pack``. A store shared with workspaces elsewhere
+    keeps every blob that is still hardlinked into one of them.
+    """
+    base = Path(base_output_dir)
+    store_dir = Path(blob_store_dir) if blob_store_dir is not None else base / BLOB_DIR_NAME
+    if not store_dir.is_dir():
+        return []
+    referenced: set[str] = set()
+    for manifest_path in base.glob(f"{WORKSPACE_PREFIX}*/manifest.json"):
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # An unreadable manifest could reference anything; keep the store as it is.
+            return []
+        store = manifest.get("blob_store")
+        if store and Path(store).resolve() != store_dir.resolve():
+            continue
+        referenced.update(row["sha256"] for row in manifest.get("attachments", []) if row.get("sha256"))
+    return prune_blobs(store_dir, referenced)
+
+
+def verify_workspace_pack(workspace_dir: str | Path) -> dict[str, Any]:
+    """
+    Re-check every file listed in a pack's manifest.json against its recorded
+    size and SHA-256.
+
+    Sizes are compared first so truncated or replaced scans fail without
+    hashing; the remaining files are rehashed on a thread pool.
+    """
+    ws_dir = Path(workspace_dir)
+    manifest = json.loads((ws_dir / "manifest.json").read_text(encoding="utf-8"))
+    expected = []
+    if manifest.get("primary_sha256"):
+        expected.append((manifest["primary_document"], manifest.get("primary_size_bytes"), manifest["primary_sha256"]))
+    for row in manifest.get("attachments", []):
+        expected.append((row["filename"], row.get("size_bytes"), row["sha256"]))
+
+    problems: list[dict[str, str]] = []
+    if len(expected) != 1 + int(manifest.get("required_attachment_count", 0)):
+        problems.append({"filename": "manifest.json", "problem": "missing_integrity_data"})
+
+    to_hash = []
+    for filename, size, sha256 in expected:
+        path = ws_dir / filename
+        if not path.is_file():
+            problems.append({"filename": filename, "problem": "missing"})
+        elif size is not None and path.stat().st_size != size:
+            problems.append({"filename": filename, "problem": "size_mismatch"})
+        else:
+            to_hash.append((filename, path, sha256))
+
+    with ThreadPoolExecutor(max_workers=PACK_WORKERS) as pool:
+        actual = list(pool.map(lambda item: sha256_file(item[1], use_cache=False), to_hash))
+    for (filename, _, sha256), digest in zip(to_hash, actual):
+        if digest != sha256:
+            problems.append({"filename": filename, "problem": "hash_mismatch"})
+
+    return {
+        "workspace_dir": str(ws_dir),
+        "ok": not problems,
+        "checked": len(expected),
+        "problems": problems,
+    }
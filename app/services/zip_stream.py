@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import copy
+import shutil
+import struct
+import zipfile
+
+COPY_CHUNK_BYTES = 1024 * 1024
+_LOCAL_HEADER_SIZE = 30
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_FLAG_ENCRYPTED = 0x01
+_FLAG_DATA_DESCRIPTOR = 0x08
+
+
+def _can_copy_raw(zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo) -> bool:
+    if info.flag_bits & _FLAG_ENCRYPTED:
+        return False
+    if max(info.file_size, info.compress_size, info.header_offset) >= zipfile.ZIP64_LIMIT:
+        return False
+    return zin.fp is not None and zout.fp is not None and not getattr(zout, "_writing", False)
+
+
+def _copy_recompressed(zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    with zin.open(info) as src, zout.open(copy.copy(info), "w") as dst:
+        shutil.copyfileobj(src, dst, COPY_CHUNK_BYTES)
+
+
+def copy_zip_entry(zin: zipfile.ZipFile, zout: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+    """
+    Copy one entry from ``zin`` to ``zout`` without decompressing it.
+
+    The local header is rewritten at the current end of ``zout`` and the
+    compressed bytes are streamed after it in chunks, reusing the CRC and
+    sizes from the central directory, so large media parts cost a file copy,
+    not a deflate round-trip. Entries that cannot be copied raw (encrypted,
+    zip64) are streamed through ``ZipFile.open`` instead.
+    """
+    if not _can_copy_raw(zin, zout, info):
+        _copy_recompressed(zin, zout, info)
+        return
+
+    src = zin.fp
+    src.seek(info.header_offset)
+    header = src.read(_LOCAL_HEADER_SIZE)
+    if len(header) != _LOCAL_HEADER_SIZE or header[:4] != _LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local file header for {info.filename}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    src.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_len + extra_len)
+
+    out_info = copy.copy(info)
+    # Sizes and CRC are known up front, so no trailing data descriptor is written.
+    out_info.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+    dst = zout.fp
+    if getattr(zout, "_seekable", True):
+        dst.seek(zout.start_dir)
+    out_info.header_offset = dst.tell()
+    dst.write(out_info.FileHeader())
+    remaining = info.compress_size
+    while remaining:
+        chunk = src.read(min(COPY_CHUNK_BYTES, remaining))
+        if not chunk:
+            raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+        dst.write(chunk)
+        remaining -= len(chunk)
+    zout.filelist.append(out_info)
+    zout.NameToInfo[out_info.filename] = out_info
+    zout.start_dir = dst.tell()
+    zout._didModify = True
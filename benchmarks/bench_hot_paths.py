@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "task_force" / "scripts"))
+
+import extract_tender_context as etc  # noqa: E402
+from app.main import TenderSearchFrame  # noqa: E402
+from app.services import pdf_page_index  # noqa: E402
+from app.services.search_backends import HttpSearchBackend, SearchQuery, parse_notice_rows  # noqa: E402
+from app.services.search_stability import stable_sort_tenders  # noqa: E402
+from app.services.template_builder import clear_template_cache, render_docx_template  # noqa: E402
+from bench_template_render import build_model_tender  # noqa: E402
+from fixtures import (  # noqa: E402
+    RecordedPortal,
+    latin_pdf_pages,
+    notice_page_html,
+    tech_spec_hits,
+    tender_documentation,
+    tender_rows,
+    write_pdf,
+)
+
+BASELINE_PATH = ROOT / "benchmarks" / "baselines" / "hot_paths.json"
+BASELINE_VERSION = 1
+DEFAULT_THRESHOLD = 1.5
+# Timings are stored relative to this fixed pure-Python workload, so a baseline
+# recorded on one machine stays meaningful on a faster or slower one.
+CALIBRATION_SIZE = 100_000
+
+
+@dataclass
+class Case:
+    name: str
+    run: Callable[[], Any]
+    size: str
+
+
+class _MatchMode:
+    def __init__(self, mode: str):
+        self.mode = mode
+
+    def get(self) -> str:
+        return self.mode
+
+
+def _filter_frame(mode: str) -> TenderSearchFrame:
+    # The keyword filter only reads the match mode; no Tk root is needed to exercise it.
+    frame = TenderSearchFrame.__new__(TenderSearchFrame)
+    frame.var_match_mode = _MatchMode(mode)
+    frame.log = lambda _msg: None
+    return frame
+
+
+def calibrate() -> None:
+    rng = random.Random(1)
+    words = ["".join(rng.choice("абвгдежзиклмнопрст") for _ in range(8)) for _ in range(CALIBRATION_SIZE // 10)]
+    sorted(words)
+    sum(len(str(i)) for i in range(CALIBRATION_SIZE))
+    " ".join(words).lower().count("аб")
+
+
+def build_cases(work_dir: Path) -> list[Case]:
+    cases: list[Case] = []
+
+    rows = tender_rows(2000)
+    portal = RecordedPortal(work_dir / "portal")
+    portal.record("интернет", rows[:400], per_page=20)
+    backend = HttpSearchBackend(RecordedPortal.URL_TEMPLATE, fetch=portal.fetch)
+    portal_query = SearchQuery(keyword="интернет", collect_all_pages=True, max_pages=20)
+    cases.append(Case("portal_search_offline", lambda: list(backend.search(portal_query)), "pages=20 rows=400"))
+
+    page_html = notice_page_html(rows[:200])
+    cases.append(Case("parse_notice_rows", lambda: parse_notice_rows(page_html), "rows=200"))
+
+    contains = _filter_frame("contains")
+    all_words = _filter_frame("all_words")
+    cases.append(
+        Case("post_filter_contains", lambda: contains._post_filter_by_keyword(rows, "интернет"), "rows=2000")
+    )
+    cases.append(
+        Case(
+            "post_filter_all_words",
+            lambda: all_words._post_filter_by_keyword(rows, "набавка опрема"),
+            "rows=2000",
+        )
+    )
+
+    shuffled = tender_rows(20000, seed=9)
+    cases.append(Case("stable_sort_tenders", lambda: stable_sort_tenders(shuffled), "rows=20000"))
+
+    long_text = etc.join_pages(tender_documentation(1500))
+    cases.append(Case("extract_target_sections", lambda: etc.extract_target_sections(long_text), "pages=1500"))
+
+    pages = tender_documentation(150)
+    full_text = etc.join_pages(pages)
+    paragraphs = etc.split_paragraphs(full_text)
+    cases.append(
+        Case(
+            "find_hits",
+            lambda: etc.find_hits(paragraphs, pages),
+            f"paragraphs={len(paragraphs)} pages={len(pages)}",
+        )
+    )
+
+    hits = tech_spec_hits(800)
+    cases.append(
+        Case(
+            "dedupe_top_tech_spec_hits",
+            lambda: etc.dedupe_top_tech_spec_hits(hits, etc.MAX_HIDDEN_TECH_SPEC_ITEMS),
+            "hits=800",
+        )
+    )
+
+    template = work_dir / "model_tender.docx"
+    values = build_model_tender(template, pages=60, keys=200)
+    rendered = work_dir / "rendered.docx"
+    clear_template_cache()
+    cases.append(
+        Case("render_docx_template", lambda: render_docx_template(str(template), str(rendered), values), "pages=60")
+    )
+
+    if pdf_page_index.PdfReader is not None:
+        pdf_path = work_dir / "annex.pdf"
+        write_pdf(pdf_path, latin_pdf_pages(80))
+        cases.append(Case("extract_pdf_pages", lambda: pdf_page_index.extract_pdf_pages(pdf_path), "pages=80"))
+    return cases
+
+
+def best_of(repeat: int, fn: Callable[[], Any]) -> float:
+    fn()  # warm-up: imports, compiled templates and regex caches
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def load_baseline(path: Path) -> dict[str, Any] | None:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) and data.get("version") == BASELINE_VERSION else None
+
+
+def save_baseline(path: Path, threshold: float, calibration_sec: float, results: dict[str, dict[str, Any]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": BASELINE_VERSION,
+        "threshold": threshold,
+        "calibration_sec": round(calibration_sec, 6),
+        "cases": results,
+    }
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Time search, filtering and extraction hot paths on synthetic inputs and compare against baselines."
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case (best time is kept).")
+    parser.add_argument("--only", default="", help="Comma-separated case names to run.")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline JSON file.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=None,
+        help=f"Fail when a case is this many times slower than its baseline (default: from baseline, else {DEFAULT_THRESHOLD}).",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="Record the current timings as the baseline.")
+    args = parser.parse_args()
+
+    baseline_path = Path(args.baseline)
+    baseline = load_baseline(baseline_path)
+    threshold = args.threshold or (baseline or {}).get("threshold") or DEFAULT_THRESHOLD
+    wanted = {name.strip() for name in args.only.split(",") if name.strip()}
+
+    timings: dict[str, tuple[Case, float]] = {}
+    # Calibration runs are interleaved with the cases and the fastest one is kept, so a
+    # burst of load on a shared machine skews neither side of the ratio for long.
+    calibration_sec = best_of(args.repeat, calibrate)
+    with tempfile.TemporaryDirectory() as tmp:
+        for case in build_cases(Path(tmp)):
+            if wanted and case.name not in wanted:
+                continue
+            timings[case.name] = (case, best_of(args.repeat, case.run))
+            calibration_sec = min(calibration_sec, best_of(args.repeat, calibrate))
+    print(f"calibration_sec={calibration_sec:.4f} threshold={threshold:.2f}x")
+
+    results: dict[str, dict[str, Any]] = {}
+    regressions: list[str] = []
+    for name, (case, sec) in timings.items():
+        relative = sec / calibration_sec
+        results[name] = {"sec": round(sec, 6), "relative": round(relative, 4), "size": case.size}
+        previous = (baseline or {}).get("cases", {}).get(name)
+        if previous is None:
+            status, ratio_text = "new", "-"
+        else:
+            ratio = relative / max(previous["relative"], 1e-9)
+            status = "REGRESSION" if ratio > threshold else "ok"
+            ratio_text = f"{ratio:.2f}x"
+            if status == "REGRESSION":
+                regressions.append(name)
+        print(
+            f"case={name:26s} {case.size:28s} sec={sec:.4f} relative={relative:8.3f} "
+            f"vs_baseline={ratio_text:>6s} status={status}"
+        )
+
+    if args.update_baseline:
+        merged = {**(baseline or {}).get("cases", {}), **results} if wanted else results
+        save_baseline(baseline_path, threshold, calibration_sec, merged)
+        print(f"BASELINE: wrote {len(results)} case(s) to {baseline_path}")
+        return 0
+    if regressions:
+        print(f"FAIL: {len(regressions)} case(s) slower than {threshold:.2f}x baseline: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
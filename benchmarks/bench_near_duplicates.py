@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import csv
+import random
+import sys
+import time
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "task_force" / "scripts"))
+
+import extract_tender_context as etc  # noqa: E402
+from fixtures import sentence  # noqa: E402
+
+TENDER_CONTEXT_DIR = ROOT / "task_force" / "out" / "tender_context"
+
+
+def load_real_snippets() -> list[str]:
+    snippets: list[str] = []
+    seen: set[str] = set()
+    for path in sorted(TENDER_CONTEXT_DIR.glob("upload_requirements_template_*.csv")):
+        with path.open("r", encoding="utf-8-sig", newline="") as fh:
+            for row in csv.DictReader(fh):
+                text = (row.get("requirement_text") or "").strip()
+                if len(text) < 40 or text in seen:
+                    continue
+                seen.add(text)
+                snippets.append(text[:500])
+    return snippets
+
+
+def synthetic_snippets(count: int = 300, seed: int = 17) -> list[str]:
+    """Stand-in pool when no extraction outputs exist (fresh checkout, CI)."""
+    rng = random.Random(seed)
+    return [sentence(rng, 12, 40)[:500] for _ in range(count)]
+
+
+def build_hit_set(snippets: list[str], size: int, seed: int = 11) -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    hits: list[dict[str, Any]] = []
+    while len(hits) < size:
+        text = rng.choice(snippets)
+        if rng.random() < 0.35:
+            # Re-extracted pages often differ only by whitespace or a trailing token.
+            cut = max(24, len(text) - rng.randint(1, 6))
+            text = text[:cut].replace("  ", " ")
+        hits.append({"keyword": "услов", "page": rng.randint(1, 80), "snippet": text})
+    return hits
+
+
+def dedupe_pairwise(hits: list[dict[str, Any]], max_items: int) -> list[dict[str, Any]]:
+    ranked = sorted(hits, key=etc.score_tech_spec_hit, reverse=True)
+    kept: list[dict[str, Any]] = []
+    fingerprints: list[str] = []
+    for hit in ranked:
+        fp = etc.normalize_for_similarity(str(hit.get("snippet", "")))
+        if len(fp) < 24:
+            continue
+        if any(fp == seen or SequenceMatcher(None, fp, seen).ratio() >= 0.88 for seen in fingerprints):
+            continue
+        kept.append(hit)
+        fingerprints.append(fp)
+        if len(kept) >= max_items:
+            break
+    return kept
+
+
+def timed(fn, *args) -> tuple[float, Any]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare pairwise SequenceMatcher and MinHash/LSH tech-spec dedupe.")
+    parser.add_argument("--sizes", default="40,200,800", help="Comma-separated hit set sizes.")
+    parser.add_argument("--max-items", type=int, default=10_000, help="Kept-item cap (the extractor uses 10).")
+    args = parser.parse_args()
+
+    snippets = load_real_snippets()
+    source = "real"
+    if not snippets:
+        snippets, source = synthetic_snippets(), "synthetic"
+        print(f"No requirement snippets found in {TENDER_CONTEXT_DIR}; using the synthetic fixture pool.")
+
+    print(f"snippet_pool={len(snippets)} source={source} max_items={args.max_items}")
+    for size in [int(x) for x in args.sizes.split(",") if x.strip()]:
+        hits = build_hit_set(snippets, size)
+        legacy_sec, legacy = timed(dedupe_pairwise, hits, args.max_items)
+        lsh_sec, indexed = timed(etc.dedupe_top_tech_spec_hits, hits, args.max_items)
+        same = [h["snippet"] for h in legacy] == [h["snippet"] for h in indexed]
+        print(
+            f"hits={size:5d} kept={len(indexed):4d} pairwise_sec={legacy_sec:.3f} "
+            f"minhash_sec={lsh_sec:.3f} speedup={legacy_sec / max(lsh_sec, 1e-9):.1f}x identical={same}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
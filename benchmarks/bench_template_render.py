@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.docx_text import iter_text_part_names  # noqa: E402
+from app.services.template_builder import (  # noqa: E402
+    NS,
+    clear_template_cache,
+    compile_docx_template,
+)
+
+WORDS = (
+    "понудувач",
+    "договорен",
+    "орган",
+    "услови",
+    "техничка",
+    "спецификација",
+    "гаранција",
+    "документ",
+    "рок",
+    "испорака",
+    "набавка",
+    "критериум",
+)
+PARAGRAPHS_PER_PAGE = 40
+
+
+def legacy_replace_placeholders_in_xml(xml_bytes: bytes, values: dict[str, str]) -> bytes:
+    # The pre-compiled renderer: every key is tried against every paragraph.
+    root = ET.fromstring(xml_bytes)
+    for para in root.findall(".//w:p", NS):
+        text_nodes = para.findall(".//w:t", NS)
+        if not text_nodes:
+            continue
+        merged = "".join(node.text or "" for node in text_nodes)
+        replaced = merged
+        for key, raw_value in values.items():
+            replaced = replaced.replace("{{" + key + "}}", raw_value)
+        if replaced != merged:
+            text_nodes[0].text = replaced
+            for extra in text_nodes[1:]:
+                extra.text = ""
+    return ET.tostring(root, encoding="utf-8", xml_declaration=True)
+
+
+def legacy_render(template_path: Path, output_path: Path, values: dict[str, str]) -> None:
+    with zipfile.ZipFile(template_path, "r") as zin:
+        target_entries = set(iter_text_part_names(zin))
+        with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+            for item in zin.infolist():
+                data = zin.read(item.filename)
+                if item.filename in target_entries:
+                    data = legacy_replace_placeholders_in_xml(data, values)
+                zout.writestr(item, data)
+
+
+def build_model_tender(path: Path, pages: int, keys: int, seed: int = 7) -> dict[str, str]:
+    """Synthetic Cyrillic tender: formatted runs, every 12th paragraph carries a (sometimes split) placeholder."""
+    rng = random.Random(seed)
+    paragraphs: list[str] = []
+    for idx in range(pages * PARAGRAPHS_PER_PAGE):
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(12, 30)))
+        runs = [f'<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{idx}. </w:t></w:r>']
+        if idx % 12 == 0:
+            key = f"FIELD_{rng.randrange(keys)}"
+            if idx % 24 == 0:
+                runs.append(f"<w:r><w:t>{sentence} {{{{{key[:3]}</w:t></w:r><w:r><w:t>{key[3:]}}}}}</w:t></w:r>")
+            else:
+                runs.append(f"<w:r><w:t>{sentence} {{{{{key}}}}}</w:t></w:r>")
+        else:
+            runs.append(f"<w:r><w:t>{sentence}</w:t></w:r>")
+        paragraphs.append(f"<w:p>{''.join(runs)}</w:p>")
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{NS["w"]}"><w:body>{"".join(paragraphs)}</w:body></w:document>'
+    )
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+        zf.writestr("word/document.xml", document)
+    return {f"FIELD_{i}": f"вредност {i}" for i in range(keys)}
+
+
+def paragraph_texts(path: Path) -> list[str]:
+    with zipfile.ZipFile(path) as zf:
+        root = ET.fromstring(zf.read("word/document.xml"))
+    return ["".join(t.text or "" for t in p.findall(".//w:t", NS)) for p in root.findall(".//w:p", NS)]
+
+
+def best_of(repeat: int, fn, *args) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare per-key and compiled single-pass DOCX placeholder rendering.")
+    parser.add_argument("--pages", type=int, default=200, help="Synthetic model tender size in pages.")
+    parser.add_argument("--keys", type=int, default=400, help="Number of keys in the value map.")
+    parser.add_argument("--repeat", type=int, default=5, help="Renders per variant (best time is reported).")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        template = tmp_dir / "model_tender.docx"
+        values = build_model_tender(template, args.pages, args.keys)
+        legacy_out = tmp_dir / "legacy.docx"
+        compiled_out = tmp_dir / "compiled.docx"
+
+        legacy_sec = best_of(args.repeat, legacy_render, template, legacy_out, values)
+        clear_template_cache()
+        start = time.perf_counter()
+        compiled = compile_docx_template(template)
+        compile_sec = time.perf_counter() - start
+        render_sec = best_of(args.repeat, compiled.render, compiled_out, values)
+        identical = paragraph_texts(legacy_out) == paragraph_texts(compiled_out)
+
+    print(
+        f"pages={args.pages} keys={args.keys} placeholders={len(compiled.placeholders)} "
+        f"legacy_sec={legacy_sec:.3f} compile_sec={compile_sec:.3f} compiled_render_sec={render_sec:.3f} "
+        f"speedup={legacy_sec / max(render_sec, 1e-9):.1f}x identical_text={identical}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
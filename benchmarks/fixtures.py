@@ -0,0 +1,202 @@
+"""Synthetic, offline inputs for the benchmarks: Cyrillic tender rows and documents, PDFs and recorded portal pages."""
+from __future__ import annotations
+
+import html
+import json
+import random
+import sys
+import urllib.parse
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.tender_search import TenderRow  # noqa: E402
+
+WORDS = (
+    "понудувач",
+    "договорен",
+    "орган",
+    "услови",
+    "техничка",
+    "спецификација",
+    "гаранција",
+    "документ",
+    "рок",
+    "испорака",
+    "набавка",
+    "критериум",
+    "интернет",
+    "услуги",
+    "опрема",
+    "одржување",
+)
+SUBJECTS = (
+    "Набавка на интернет услуги",
+    "Сервисирање и одржување на возила",
+    "Набавка на канцелариски материјали",
+    "Изведба на градежни работи",
+    "Набавка на компјутерска опрема",
+    "Осигурување на имот и вработени",
+    "Internet i telekomunikaciski uslugi",
+)
+INSTITUTIONS = (
+    "Општина Охрид",
+    "ЈП Водовод и канализација Скопје",
+    "Универзитет Св. Кирил и Методиј",
+    "Министерство за финансии",
+    "Клиничка болница Битола",
+)
+SECTION_TITLES = {
+    "1.3": "Предмет на договорот за јавна набавка",
+    "1.5": "Проценета вредност",
+    "1.6.1": "Услови за учество",
+    "3.4": "Рок за доставување на понудите",
+    "3.9": "Гаранција на понудата",
+    "4.2": "Способност за вршење професионална дејност",
+    "4.3": "Економска и финансиска состојба",
+    "4.3.1": "Докази за економска состојба",
+    "5.1": "Критериум за избор",
+    "6.1": "Техничка спецификација",
+}
+# Helvetica in the PDF fixture only covers Latin-1, so PDF pages use transliterated text.
+LATIN_WORDS = ("ponuduvac", "dogovoren", "organ", "uslovi", "tehnicka", "specifikacija", "garancija", "rok", "nabavka")
+
+
+def sentence(rng: random.Random, low: int = 8, high: int = 24) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def tender_rows(count: int, seed: int = 3) -> list[TenderRow]:
+    rng = random.Random(seed)
+    rows: list[TenderRow] = []
+    for idx in range(count):
+        title = f"{rng.choice(SUBJECTS)} {rng.randint(1, 99)}/2026"
+        institution = rng.choice(INSTITUTIONS)
+        deadline = f"{rng.randint(1, 28):02d}.{rng.randint(1, 12):02d}.2026"
+        dossier = f"{rng.randint(10000, 99999)}-2026"
+        rows.append(
+            TenderRow(
+                index=idx + 1,
+                title=title,
+                institution=institution,
+                deadline=deadline,
+                dossier_id=dossier,
+                source_page=idx // 10 + 1,
+                row_text=" | ".join([str(idx + 1), title, institution, deadline, sentence(rng, 4, 10)]),
+            )
+        )
+    return rows
+
+
+def notice_page_html(rows: list[TenderRow]) -> str:
+    """A notices listing shaped like the rendered portal table."""
+    body = []
+    for row in rows:
+        cells = [str(row.index), row.title, row.institution, row.deadline]
+        tds = "".join(f"<td>{html.escape(cell)}</td>" for cell in cells)
+        link = f'<td><a class="btn show-documents" data-rel="{html.escape(row.dossier_id)}">Документи</a></td>'
+        body.append(f"<tr>{tds}{link}</tr>")
+    return (
+        '<html><head><meta charset="utf-8"></head><body><div id="notices">'
+        "<table><thead><tr><th>#</th><th>Предмет</th><th>Институција</th><th>Рок</th><th></th></tr></thead>"
+        f"<tbody>{''.join(body)}</tbody></table></div></body></html>"
+    )
+
+
+class RecordedPortal:
+    """
+    Replays recorded notices pages instead of the live portal.
+
+    ``record`` stores one HTML file per (keyword, page) plus an index; the
+    instance's ``fetch`` plugs into ``HttpSearchBackend`` in place of urllib.
+    """
+
+    INDEX_NAME = "index.json"
+    URL_TEMPLATE = "https://portal.invalid/notices?keyword={keyword}&page={page}"
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        index_path = directory / self.INDEX_NAME
+        self.index: dict[str, str] = json.loads(index_path.read_text(encoding="utf-8")) if index_path.exists() else {}
+
+    def record(self, keyword: str, rows: list[TenderRow], per_page: int) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        pages = [rows[i : i + per_page] for i in range(0, len(rows), per_page)] or [[]]
+        for page_no, page_rows in enumerate(pages, start=1):
+            url = self.URL_TEMPLATE.format(keyword=urllib.parse.quote(keyword), page=page_no)
+            name = f"notices_{len(self.index):04d}.html"
+            (self.directory / name).write_text(notice_page_html(page_rows), encoding="utf-8")
+            self.index[url] = name
+        (self.directory / self.INDEX_NAME).write_text(json.dumps(self.index, ensure_ascii=False), encoding="utf-8")
+
+    def fetch(self, url: str, timeout_sec: float) -> str:
+        name = self.index.get(url)
+        return (self.directory / name).read_text(encoding="utf-8") if name else notice_page_html([])
+
+
+def tender_documentation(pages: int, seed: int = 5) -> list[str]:
+    """Page texts of a tender documentation: a table of contents, then numbered sections with keyword paragraphs."""
+    rng = random.Random(seed)
+    toc = ["СОДРЖИНА"] + [f"{sec}. {title} ........ {rng.randint(2, 40)}" for sec, title in SECTION_TITLES.items()]
+    out = ["\n".join(toc)]
+    sections = list(SECTION_TITLES.items())
+    for page_no in range(1, pages):
+        chunks = []
+        if page_no <= len(sections):
+            sec, title = sections[page_no - 1]
+            chunks.append(f"{sec}. {title}")
+        for _ in range(rng.randint(6, 12)):
+            if rng.random() < 0.15:
+                chunks.append(f"{rng.randint(7, 12)}.{rng.randint(1, 9)} {sentence(rng, 3, 6)}")
+            chunks.append(sentence(rng))
+        out.append("\n\n".join(chunks))
+    return out
+
+
+def tech_spec_hits(count: int, seed: int = 11) -> list[dict[str, Any]]:
+    """Hits with the near-duplicates re-extracted pages produce (whitespace changes, trimmed tails)."""
+    rng = random.Random(seed)
+    pool = [sentence(rng, 12, 40) for _ in range(max(4, count // 3))]
+    hits: list[dict[str, Any]] = []
+    for _ in range(count):
+        text = rng.choice(pool)
+        if rng.random() < 0.35:
+            text = text[: max(24, len(text) - rng.randint(1, 6))].replace(" ", "  ", 1)
+        hits.append({"keyword": "услов", "page": rng.randint(1, 80), "snippet": text})
+    return hits
+
+
+def write_pdf(path: Path, pages: list[str]) -> None:
+    """Minimal uncompressed PDF with one Helvetica text line per page."""
+    count = len(pages)
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [" + b" ".join(f"{3 + i * 2} 0 R".encode() for i in range(count)) + b"] /Count %d >>" % count,
+    ]
+    font_id = 3 + count * 2
+    for i, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 %d 0 R >> >> /Contents %d 0 R >>"
+            % (font_id, 4 + i * 2)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    path.write_bytes(bytes(out))
+
+
+def latin_pdf_pages(pages: int, seed: int = 13) -> list[str]:
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(LATIN_WORDS) for _ in range(12)) for _ in range(pages)]
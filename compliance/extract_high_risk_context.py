@@ -2,18 +2,23 @@
 from __future__ import annotations
 
 import csv
-import re
-from dataclasses import dataclass
+import sys
 from pathlib import Path
 from typing import Dict, List
 
-from pypdf import PdfReader
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.services.citation_batch import CitationCache, CitationRequest, run_citation_batch  # noqa: E402
+from app.services.pdf_page_index import PdfPageIndex  # noqa: E402
 
 ROOT = Path(r"C:\Users\rabota\Desktop\App for public procurements")
 MATRIX_IN = ROOT / "compliance" / "requirements_matrix.csv"
 OUT_DIR = ROOT / "compliance" / "extraction"
 MATRIX_OUT = ROOT / "compliance" / "requirements_matrix_draft_with_citations.csv"
 SNIPPETS_OUT = OUT_DIR / "high_risk_extraction_snippets.md"
+CITATION_CACHE = OUT_DIR / ".citation_cache.json"
 
 KEYWORDS: Dict[str, List[str]] = {
     "REQ-ESJN-2021-001": ["пребар", "оглас", "досие", "subject", "notice"],
@@ -28,57 +33,6 @@ KEYWORDS: Dict[str, List[str]] = {
 }
 
 
-@dataclass
-class MatchResult:
-    pages: List[int]
-    keywords: List[str]
-    snippet: str
-
-
-def normalize(text: str) -> str:
-    return re.sub(r"\s+", " ", text or "").strip()
-
-
-def load_pdf_pages(path: Path) -> List[str]:
-    reader = PdfReader(str(path))
-    pages: List[str] = []
-    for p in reader.pages:
-        txt = p.extract_text() or ""
-        pages.append(normalize(txt))
-    return pages
-
-
-def find_matches(pages: List[str], kws: List[str]) -> MatchResult:
-    scored: List[tuple[int, int, List[str]]] = []
-    for i, page in enumerate(pages, start=1):
-        low = page.lower()
-        hit_kws = [k for k in kws if k.lower() in low]
-        if hit_kws:
-            scored.append((i, len(hit_kws), hit_kws))
-    scored.sort(key=lambda t: (-t[1], t[0]))
-    top = scored[:3]
-    top_pages = [t[0] for t in top]
-    top_kws: List[str] = []
-    for _, _, hk in top:
-        for h in hk:
-            if h not in top_kws:
-                top_kws.append(h)
-
-    snippet = ""
-    if top:
-        page_no = top[0][0]
-        text = pages[page_no - 1]
-        first_kw = top[0][2][0]
-        idx = text.lower().find(first_kw.lower())
-        if idx >= 0:
-            start = max(0, idx - 140)
-            end = min(len(text), idx + 220)
-            snippet = text[start:end]
-        else:
-            snippet = text[:260]
-    return MatchResult(top_pages, top_kws, snippet)
-
-
 def main() -> None:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -94,29 +48,33 @@ def main() -> None:
                 fixed[nk] = v
             rows.append(fixed)
 
-    pdf_cache: Dict[str, List[str]] = {}
+    # Page texts come from the persistent index; new or changed PDFs are parsed once each, in parallel.
+    page_index = PdfPageIndex(ROOT)
     report_lines: List[str] = ["# High-Risk Manual Extraction (Draft)", ""]
 
-    for r in rows:
-        req_id = r["requirement_id"]
+    # Keyed by row position: each row is cited independently.
+    requests: List[CitationRequest] = []
+    for idx, r in enumerate(rows):
         src_rel = r["source_file"]
         src = ROOT / src_rel
-        kws = KEYWORDS.get(req_id, [])
+        kws = KEYWORDS.get(r["requirement_id"], [])
+        if kws and src.exists() and src.suffix.lower() == ".pdf":
+            requests.append(CitationRequest(str(idx), src_rel, tuple(kws)))
+    results = run_citation_batch(page_index, requests, cache=CitationCache(CITATION_CACHE))
 
-        if not kws or not src.exists() or src.suffix.lower() != ".pdf":
+    for idx, r in enumerate(rows):
+        req_id = r["requirement_id"]
+        src_rel = r["source_file"]
+        match = results.get(str(idx))
+        if match is None:
             continue
 
-        if src_rel not in pdf_cache:
-            try:
-                pdf_cache[src_rel] = load_pdf_pages(src)
-            except Exception as exc:
-                r["interpretation_notes"] = (
-                    r["interpretation_notes"]
-                    + f" | Extraction failed: {type(exc).__name__}."
-                )
-                continue
-
-        match = find_matches(pdf_cache[src_rel], kws)
+        if isinstance(match, Exception):
+            r["interpretation_notes"] = (
+                r["interpretation_notes"]
+                + f" | Extraction failed: {type(match).__name__}."
+            )
+            continue
         if match.pages:
             pages_txt = ", ".join(str(p) for p in match.pages)
             kws_txt = ", ".join(match.keywords[:6])
@@ -144,6 +102,7 @@ def main() -> None:
         writer.writerows(rows)
 
     SNIPPETS_OUT.write_text("\n".join(report_lines), encoding="utf-8")
+    page_index.save()
 
     print(f"matrix_out={MATRIX_OUT}")
     print(f"snippets_out={SNIPPETS_OUT}")
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
 import json
+import os
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.policy_loader import (  # noqa: E402
+    RULE_CHANGE_MANIFEST_NAME,
+    load_rule_change_manifest,
+    read_rule_file,
+)
+
 COMPLIANCE_DIR = ROOT / "compliance"
 REVIEW_DIR = COMPLIANCE_DIR / "review"
 RULES_DIR = COMPLIANCE_DIR / "rules"
@@ -18,6 +31,27 @@ SME_REVIEW_PATH = REVIEW_DIR / "sme_review_checklist.csv"
 LEGAL_REVIEW_PATH = REVIEW_DIR / "legal_review_checklist.csv"
 TRACEABILITY_PATH = COMPLIANCE_DIR / "traceability_index.csv"
 BACKLOG_PATH = COMPLIANCE_DIR / "IMPLEMENTATION_BACKLOG.md"
+CHANGE_MANIFEST_PATH = COMPLIANCE_DIR / RULE_CHANGE_MANIFEST_NAME
+CHANGE_MANIFEST_VERSION = 1
+
+DRAFT_STATE = "draft"
+# Rule fields derived from the matrix row; approval metadata, version and notes belong to reviewers.
+GENERATED_RULE_FIELDS = (
+    "rule_id",
+    "source_file",
+    "source_section",
+    "source_page",
+    "effective_from",
+    "rule_type",
+    "severity",
+    "condition",
+    "action",
+    "error_message",
+    "app_module",
+    "test_case_id",
+)
+SME_REVIEWER_FIELDS = ("reviewer_decision", "reviewer_comment", "reviewed_at")
+LEGAL_REVIEWER_FIELDS = ("legal_decision", "legal_comment", "effective_from_confirmed", "reviewed_at")
 
 
 def read_matrix_rows(path: Path) -> list[dict[str, str]]:
@@ -25,12 +59,47 @@ def read_matrix_rows(path: Path) -> list[dict[str, str]]:
         return list(csv.DictReader(handle))
 
 
-def write_csv(path: Path, fieldnames: list[str], rows: list[dict[str, str]]) -> None:
+def write_if_changed(path: Path, content: str) -> bool:
+    """Atomically replace ``path`` with ``content`` unless it already holds exactly that; True if written."""
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_csv(path: Path, fieldnames: list[str], rows: list[dict[str, str]]) -> bool:
+    # Compared by content: a file re-saved with a BOM or different quoting is not stale.
+    if path.exists():
+        with path.open("r", encoding="utf-8-sig", newline="") as handle:
+            reader = csv.DictReader(handle)
+            if reader.fieldnames == fieldnames and list(reader) == rows:
+                return False
+    buffer = io.StringIO(newline="")
+    writer = csv.DictWriter(buffer, fieldnames=fieldnames)
+    writer.writeheader()
+    writer.writerows(rows)
+    return write_if_changed(path, buffer.getvalue())
+
+
+def row_hash(row: dict[str, str]) -> str:
+    return hashlib.sha256(json.dumps(row, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def keep_reviewer_fields(path: Path, rows: list[dict[str, str]], reviewer_fields: tuple[str, ...]) -> list[dict[str, str]]:
+    """Carry reviewer decisions already recorded in ``path`` over to the regenerated rows."""
+    previous = {row.get("requirement_id", ""): row for row in read_matrix_rows(path)} if path.exists() else {}
+    for row in rows:
+        prior = previous.get(row["requirement_id"], {})
+        for field in reviewer_fields:
+            row[field] = prior.get(field) or ""
+    return rows
 
 
 def infer_rule_type(app_module: str) -> str:
@@ -106,21 +175,59 @@ def build_rule(row: dict[str, str]) -> dict[str, object]:
     }
 
 
-def write_rule_files(rows: list[dict[str, str]]) -> None:
+def rule_file_name(requirement_id: str) -> str:
+    return f"{requirement_id.lower()}.json"
+
+
+def write_rule_files(
+    rows: list[dict[str, str]],
+    previous_hashes: dict[str, str],
+) -> tuple[dict[str, list[str]], dict[str, str], dict[str, str]]:
+    """
+    Write draft rules for new matrix rows and rows whose content changed.
+
+    A rule that has left the draft state belongs to its reviewers and is
+    never rewritten; if its row now generates different fields it is listed
+    under ``held_for_review`` (and keeps being listed until reconciled).
+    Returns the per-outcome rule file names, each requirement's current
+    approval state and the row hashes to remember.
+    """
     RULES_DIR.mkdir(parents=True, exist_ok=True)
+    changes: dict[str, list[str]] = {"added": [], "updated": [], "held_for_review": []}
+    states: dict[str, str] = {}
+    hashes: dict[str, str] = {}
     for row in rows:
-        rule = build_rule(row)
-        file_name = f"{row['requirement_id'].lower()}.json"
-        out_path = RULES_DIR / file_name
-        out_path.write_text(json.dumps(rule, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-
+        requirement_id = row["requirement_id"]
+        out_path = RULES_DIR / rule_file_name(requirement_id)
+        existing = read_rule_file(out_path) if out_path.exists() else None
+        state = str((existing or {}).get("approval_state") or DRAFT_STATE)
+        states[requirement_id] = state
+        current_hash = row_hash(row)
+        hashes[requirement_id] = current_hash
+        if existing is not None and previous_hashes.get(requirement_id) == current_hash:
+            continue
 
-def write_test_scaffolding(rows: list[dict[str, str]]) -> None:
+        rule = build_rule(row)
+        if existing is not None and state != DRAFT_STATE:
+            if any(existing.get(field) != rule[field] for field in GENERATED_RULE_FIELDS):
+                changes["held_for_review"].append(out_path.name)
+                if requirement_id in previous_hashes:
+                    hashes[requirement_id] = previous_hashes[requirement_id]
+                else:
+                    del hashes[requirement_id]
+            continue
+        if write_if_changed(out_path, json.dumps(rule, ensure_ascii=False, indent=2) + "\n"):
+            changes["added" if existing is None else "updated"].append(out_path.name)
+    return changes, states, hashes
+
+
+def write_test_scaffolding(rows: list[dict[str, str]]) -> list[Path]:
     TESTS_DIR.mkdir(parents=True, exist_ok=True)
     init_path = TESTS_DIR / "__init__.py"
     if not init_path.exists():
         init_path.write_text("", encoding="utf-8")
 
+    written: list[Path] = []
     for row in rows:
         req_id = row["requirement_id"]
         tc_id = row["test_case_id"]
@@ -141,10 +248,12 @@ def test_{tc_id.lower().replace('-', '_')}_approval_gate() -> None:
         rule["approval_state"] == "approved"
     ), "Fail-safe gate: non-approved rules must stay inactive until SME+legal approval."
 """
-        file_path.write_text(content, encoding="utf-8")
+        if write_if_changed(file_path, content):
+            written.append(file_path)
+    return written
 
 
-def write_backlog(rows: list[dict[str, str]]) -> None:
+def write_backlog(rows: list[dict[str, str]], states: dict[str, str]) -> bool:
     date_label = datetime.now(timezone.utc).date().isoformat()
     lines = [
         "# Compliance Implementation Backlog",
@@ -159,7 +268,7 @@ def write_backlog(rows: list[dict[str, str]]) -> None:
         row = next(r for r in rows if r["requirement_id"] == req_id)
         lines.append(
             f"- `{req_id}` ({row['test_case_id']}): {row['requirement_text']} "
-            f"[module={row['app_module']}, approval_state=draft]"
+            f"[module={row['app_module']}, approval_state={states[req_id]}]"
         )
 
     lines.extend(
@@ -181,7 +290,51 @@ def write_backlog(rows: list[dict[str, str]]) -> None:
             "",
         ]
     )
-    BACKLOG_PATH.write_text("\n".join(lines), encoding="utf-8")
+    # The date line alone does not make the backlog stale.
+    if BACKLOG_PATH.exists():
+        previous = BACKLOG_PATH.read_text(encoding="utf-8-sig").split("\n")
+        if [line for line in previous if not line.startswith("Updated: ")] == [
+            line for line in lines if not line.startswith("Updated: ")
+        ]:
+            return False
+    return write_if_changed(BACKLOG_PATH, "\n".join(lines))
+
+
+def orphaned_rule_files(rows: list[dict[str, str]]) -> list[str]:
+    """Rule files without a matrix row; they are reported, never deleted."""
+    expected = {rule_file_name(row["requirement_id"]) for row in rows}
+    return sorted(path.name for path in RULES_DIR.glob("*.json") if path.name not in expected)
+
+
+def write_change_manifest(
+    previous: dict[str, object],
+    generated_at: str,
+    row_hashes: dict[str, str],
+    rule_changes: dict[str, list[str]],
+    orphaned: list[str],
+    written: list[Path],
+) -> dict[str, object]:
+    """
+    Record what this run changed for RuntimePolicyRegistry.apply_change_manifest.
+
+    ``sequence`` only advances when rule files were added or updated, and the
+    previous reload set is kept otherwise, so a registry that has not polled
+    yet still sees the last real change.
+    """
+    reload_set = {"added": rule_changes["added"], "updated": rule_changes["updated"]}
+    rules_changed = bool(reload_set["added"] or reload_set["updated"])
+    manifest = {
+        "version": CHANGE_MANIFEST_VERSION,
+        "generated_at": generated_at,
+        "sequence": int(previous.get("sequence", 0)) + 1 if rules_changed else int(previous.get("sequence", 0)),
+        "rules": reload_set if rules_changed else previous.get("rules", {}),
+        "held_for_review": rule_changes["held_for_review"],
+        "orphaned_rules": orphaned,
+        "artifacts_written": [path.relative_to(ROOT).as_posix() for path in written],
+        "row_hashes": dict(sorted(row_hashes.items())),
+    }
+    write_if_changed(CHANGE_MANIFEST_PATH, json.dumps(manifest, ensure_ascii=False, indent=2) + "\n")
+    return manifest
 
 
 def main() -> None:
@@ -190,8 +343,11 @@ def main() -> None:
     _ = json.loads(RULE_SCHEMA_PATH.read_text(encoding="utf-8-sig"))
 
     now = datetime.now(timezone.utc).isoformat()
+    previous_manifest = load_rule_change_manifest(CHANGE_MANIFEST_PATH)
+    previous_hashes = dict(previous_manifest.get("row_hashes") or {})
+    written: list[Path] = []
 
-    write_csv(
+    if write_csv(
         SME_REVIEW_PATH,
         [
             "requirement_id",
@@ -201,20 +357,22 @@ def main() -> None:
             "reviewer_comment",
             "reviewed_at",
         ],
-        [
-            {
-                "requirement_id": row["requirement_id"],
-                "source_file": row["source_file"],
-                "draft_source_section": row["source_section"],
-                "reviewer_decision": "",
-                "reviewer_comment": "",
-                "reviewed_at": "",
-            }
-            for row in rows
-        ],
-    )
+        keep_reviewer_fields(
+            SME_REVIEW_PATH,
+            [
+                {
+                    "requirement_id": row["requirement_id"],
+                    "source_file": row["source_file"],
+                    "draft_source_section": row["source_section"],
+                }
+                for row in rows
+            ],
+            SME_REVIEWER_FIELDS,
+        ),
+    ):
+        written.append(SME_REVIEW_PATH)
 
-    write_csv(
+    if write_csv(
         LEGAL_REVIEW_PATH,
         [
             "requirement_id",
@@ -223,21 +381,18 @@ def main() -> None:
             "effective_from_confirmed",
             "reviewed_at",
         ],
-        [
-            {
-                "requirement_id": row["requirement_id"],
-                "legal_decision": "",
-                "legal_comment": "",
-                "effective_from_confirmed": "",
-                "reviewed_at": "",
-            }
-            for row in rows
-        ],
-    )
+        keep_reviewer_fields(
+            LEGAL_REVIEW_PATH,
+            [{"requirement_id": row["requirement_id"]} for row in rows],
+            LEGAL_REVIEWER_FIELDS,
+        ),
+    ):
+        written.append(LEGAL_REVIEW_PATH)
 
-    write_rule_files(rows)
+    rule_changes, rule_states, row_hashes = write_rule_files(rows, previous_hashes)
+    written.extend(RULES_DIR / name for name in rule_changes["added"] + rule_changes["updated"])
 
-    write_csv(
+    if write_csv(
         TRACEABILITY_PATH,
         [
             "requirement_id",
@@ -256,14 +411,22 @@ def main() -> None:
                 "source_section": row["source_section"],
                 "app_module": row["app_module"],
                 "test_case_id": row["test_case_id"],
-                "approval_state": "draft",
+                "approval_state": rule_states[row["requirement_id"]],
             }
             for row in rows
         ],
-    )
+    ):
+        written.append(TRACEABILITY_PATH)
 
-    write_test_scaffolding(rows)
-    write_backlog(rows)
+    written.extend(write_test_scaffolding(rows))
+    # The backlog is curated by hand after generation; it is only regenerated when the matrix changed.
+    matrix_changed = bool(previous_hashes) and previous_hashes != row_hashes
+    if (not BACKLOG_PATH.exists() or matrix_changed) and write_backlog(rows, rule_states):
+        written.append(BACKLOG_PATH)
+
+    manifest = write_change_manifest(
+        previous_manifest, now, row_hashes, rule_changes, orphaned_rule_files(rows), written
+    )
 
     summary = {
         "generated_at": now,
@@ -273,6 +436,12 @@ def main() -> None:
         "traceability_index": str(TRACEABILITY_PATH),
         "tests_dir": str(TESTS_DIR),
         "backlog": str(BACKLOG_PATH),
+        "change_manifest": str(CHANGE_MANIFEST_PATH),
+        "change_sequence": manifest["sequence"],
+        "rules_added": rule_changes["added"],
+        "rules_updated": rule_changes["updated"],
+        "rules_held_for_review": rule_changes["held_for_review"],
+        "artifacts_written": len(written),
     }
     print(json.dumps(summary, ensure_ascii=False, indent=2))
 
@@ -2,13 +2,24 @@
 from __future__ import annotations
 
 import csv
-import re
+import os
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.services.document_library import infer_risk, infer_tags  # noqa: E402
+from app.services.pdf_metadata import PdfDateCache  # noqa: E402
+
 ROOT = Path(r"C:\Users\rabota\Desktop\App for public procurements")
 OUT_DIR = ROOT / "task_force" / "out"
+METADATA_CACHE = OUT_DIR / ".manual_metadata_cache.json"
+# Directories whose files can never be manuals (see is_manual_file); not descended into.
+PRUNED_DIRS = {"task_force", "__pycache__", "node_modules", "venv"}
 
 MANUAL_HINTS = [
     "upatstvo",
@@ -50,77 +61,41 @@ def is_manual_file(path: Path) -> bool:
     return any(h in name for h in MANUAL_HINTS)
 
 
-def pdf_embedded_dates(path: Path) -> tuple[str, str]:
-    if path.suffix.lower() != ".pdf":
-        return "", ""
-    try:
-        raw = path.read_bytes().decode("latin-1", errors="ignore")
-    except Exception:
-        return "", ""
-    c = re.search(r"/CreationDate\s*\(D:(\d{4})(\d{2})(\d{2})", raw)
-    m = re.search(r"/ModDate\s*\(D:(\d{4})(\d{2})(\d{2})", raw)
-    creation = f"{c.group(1)}-{c.group(2)}-{c.group(3)}" if c else ""
-    mod = f"{m.group(1)}-{m.group(2)}-{m.group(3)}" if m else ""
-    return creation, mod
-
-
-def infer_risk(path: Path, creation_date: str) -> str:
-    name = path.name.lower()
-    year = None
-    m = re.search(r"(20\d{2})", name)
-    if m:
-        year = int(m.group(1))
-    elif creation_date:
-        year = int(creation_date[:4])
-
-    if any(x in name for x in ["nov2021", "2021"]):
-        return "High"
-    if year is not None:
-        if year <= 2022:
-            return "High"
-        if year <= 2024:
-            return "Medium"
-    return "Low"
-
-
-def infer_tags(path: Path) -> str:
-    name = path.name.lower()
-    tags: list[str] = []
-    if "esjn" in name or "e-nabavki" in name:
-        tags.append("esjn")
-    if "епазар" in name or "epazar" in name:
-        tags.append("epazar")
-    if "digital" in name or "потпис" in name:
-        tags.append("digital-signing")
-    if "финанс" in name or "finans" in name:
-        tags.append("financial-form")
-    if "тендер" in name or "tender" in name:
-        tags.append("tender-doc")
-    if "закон" in name:
-        tags.append("law")
-    return ",".join(tags)
+def iter_candidate_files(root: Path):
+    for dirpath, dirnames, filenames in os.walk(root):
+        in_review = Path(dirpath).name.lower() == "review"
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if not d.startswith(".")
+            and d not in PRUNED_DIRS
+            and not (in_review and d.lower().startswith("archive_before_"))
+        ]
+        for name in filenames:
+            yield Path(dirpath) / name
 
 
 def build_records() -> list[ManualRecord]:
     records: list[ManualRecord] = []
-    for p in ROOT.rglob("*"):
-        if not p.is_file():
-            continue
+    date_cache = PdfDateCache(METADATA_CACHE)
+    for p in iter_candidate_files(ROOT):
         if not is_manual_file(p):
             continue
-        cdate, mdate = pdf_embedded_dates(p)
+        stat_result = p.stat()
+        cdate, mdate = date_cache.get(p) if p.suffix.lower() == ".pdf" else ("", "")
         records.append(
             ManualRecord(
                 path=p,
                 ext=p.suffix.lower().lstrip("."),
-                size_kb=round(p.stat().st_size / 1024, 2),
-                modified=datetime.fromtimestamp(p.stat().st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
+                size_kb=round(stat_result.st_size / 1024, 2),
+                modified=datetime.fromtimestamp(stat_result.st_mtime).strftime("%Y-%m-%d %H:%M:%S"),
                 embedded_creation=cdate,
                 embedded_mod=mdate,
                 risk=infer_risk(p, cdate),
                 tags=infer_tags(p),
             )
         )
+    date_cache.save()
     records.sort(key=lambda r: str(r.path).lower())
     return records
 
@@ -3,17 +3,22 @@ from __future__ import annotations
 
 import csv
 import re
-import zipfile
+import sys
 from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable
-import xml.etree.ElementTree as ET
 
 from openpyxl import Workbook
 
 
 ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services.hint_store import HINT_STORE_NAME, HintStore, RequirementHints  # noqa: E402
+from app.services.model_corpus import MODEL_CORPUS_NAME, ModelCorpus  # noqa: E402
+from app.services.near_duplicates import NearDuplicateIndex  # noqa: E402
+
 OUT_DIR = ROOT / "task_force" / "out" / "tender_context"
 MODEL_DIR = ROOT / "\u043c\u043e\u0434\u0435\u043b\u0438 \u043d\u0430 \u0442\u0435\u043d\u0434\u0435\u0440\u0441\u043a\u0430 \u0434\u043e\u043a\u0443\u043c\u0435\u043d\u0442\u0430\u0446\u0438\u0458\u0430"
 
@@ -61,6 +66,7 @@ class Requirement:
     source_files: set[str] = field(default_factory=set)
     source_sections: set[str] = field(default_factory=set)
     runtime_hits: int = 0
+    runtime_distinct_evidence: int = 0
     runtime_files: set[str] = field(default_factory=set)
     rule_test_linkage: str = (
         "task_force/scripts/extract_tender_context.py:build_upload_hints; "
@@ -97,19 +103,9 @@ def collect_model_doc_files() -> list[Path]:
     return files
 
 
-def extract_docx_text(path: Path) -> str:
-    chunks: list[str] = []
-    with zipfile.ZipFile(path, "r") as zf:
-        xml_names = [n for n in zf.namelist() if n.startswith("word/") and n.endswith(".xml")]
-        for name in xml_names:
-            if not any(k in name for k in ("document.xml", "header", "footer")):
-                continue
-            root = ET.fromstring(zf.read(name))
-            vals = [node.text or "" for node in root.findall(".//{*}t")]
-            vals = [v.strip() for v in vals if v and v.strip()]
-            if vals:
-                chunks.append(" ".join(vals))
-    return normalize_space(" ".join(chunks))
+# Bump whenever classify_runtime_hint or the keywords it uses change: the hint store
+# re-classifies every row for a new version and keeps stored results otherwise.
+CLASSIFIER_VERSION = "1"
 
 
 def classify_runtime_hint(row: dict[str, str]) -> str | None:
@@ -568,28 +564,34 @@ def apply_baseline_traceability(reqs: dict[str, Requirement]) -> None:
         reqs["TRUEDOC-EXCL-004"].source_sections.add("baseline:5.2.7")
 
 
-def apply_runtime_traceability(reqs: dict[str, Requirement], hint_rows: Iterable[dict[str, str]]) -> None:
-    runtime_csv_by_req: dict[str, set[str]] = defaultdict(set)
-    for row in hint_rows:
-        req_id = classify_runtime_hint(row)
-        if not req_id or req_id not in reqs:
+def load_runtime_hint_summary() -> dict[str, RequirementHints]:
+    with HintStore(OUT_DIR / HINT_STORE_NAME) as store:
+        store.sync_csv_files(sorted(OUT_DIR.glob("upload_hints_*.csv")))
+        store.classify(classify_runtime_hint, CLASSIFIER_VERSION)
+        return store.requirement_summary()
+
+
+def count_distinct_evidence(snippets: set[str]) -> int:
+    """Snippets left after folding near-duplicates (re-extracted pages, repeated runs of one tender)."""
+    index = NearDuplicateIndex()
+    for snippet in sorted(snippets):
+        fingerprint = normalize_space(snippet.lower())
+        if fingerprint and not index.is_duplicate(fingerprint):
+            index.add(fingerprint)
+    return len(index)
+
+
+def apply_runtime_traceability(reqs: dict[str, Requirement], summary: dict[str, RequirementHints]) -> None:
+    for req_id, hints in summary.items():
+        if req_id not in reqs:
             continue
         req = reqs[req_id]
-        req.runtime_hits += 1
-        src_file = (row.get("file") or "").strip()
-        if src_file:
-            req.runtime_files.add(src_file)
-            req.source_files.add(f"downloads/{src_file}")
-        src_page = (row.get("source_page") or "").strip()
-        if src_page:
-            req.source_sections.add(f"runtime:page {src_page}")
-        csv_name = (row.get("_from_csv") or "").strip()
-        if csv_name:
-            runtime_csv_by_req[req_id].add(csv_name)
-
-    for req_id, csv_files in runtime_csv_by_req.items():
-        for runtime_file in sorted(csv_files):
-            reqs[req_id].source_files.add(f"task_force/out/tender_context/{runtime_file}")
+        req.runtime_hits += hints.hits
+        req.runtime_distinct_evidence += count_distinct_evidence(hints.snippets)
+        req.runtime_files.update(hints.files)
+        req.source_files.update(f"downloads/{src_file}" for src_file in hints.files)
+        req.source_sections.update(f"runtime:page {src_page}" for src_page in hints.pages)
+        req.source_files.update(f"task_force/out/tender_context/{runtime_file}" for runtime_file in hints.csv_names)
 
 
 def apply_model_traceability(reqs: dict[str, Requirement]) -> tuple[list[Path], list[Path]]:
@@ -613,19 +615,18 @@ def apply_model_traceability(reqs: dict[str, Requirement]) -> tuple[list[Path],
         "\u0434\u043e\u043a\u0430\u0437": "TRUEDOC-COND-001",
     }
 
-    for path in model_docx:
-        text = extract_docx_text(path).lower()
-        if not text:
-            continue
-        rel = str(path.relative_to(ROOT))
-        for kw, req_id in keyword_to_req.items():
-            if kw in text:
-                req = reqs[req_id]
-                req.source_files.add(rel)
-                req.source_sections.add(f"model:{kw}")
-
-        if "feb-25" in path.name.lower():
-            reqs["TRUEDOC-OFFER-003"].source_files.add(rel)
+    corpus = ModelCorpus(ROOT, OUT_DIR / MODEL_CORPUS_NAME)
+    corpus.refresh(model_docx)
+    for kw, req_id in keyword_to_req.items():
+        for doc in corpus.documents_with(kw):
+            req = reqs[req_id]
+            req.source_files.add(str(Path(doc)))
+            req.source_sections.add(f"model:{kw}")
+    corpus.save()
+
+    for doc in corpus.documents:
+        if corpus.text(doc) and "feb-25" in Path(doc).name.lower():
+            reqs["TRUEDOC-OFFER-003"].source_files.add(str(Path(doc)))
             reqs["TRUEDOC-OFFER-003"].source_sections.add("model:prilog-3")
 
     return (model_docx, model_doc)
@@ -650,6 +651,7 @@ def to_row(req: Requirement) -> dict[str, str]:
         "rule_test_linkage": req.rule_test_linkage,
         "normalized_from_tags": req.normalized_from_tags,
         "runtime_hits": str(req.runtime_hits),
+        "runtime_distinct_evidence": str(req.runtime_distinct_evidence),
         "runtime_source_files": "; ".join(sorted(req.runtime_files)),
         "notes": req.notes,
     }
@@ -674,6 +676,7 @@ def write_csv(rows: list[dict[str, str]]) -> None:
         "rule_test_linkage",
         "normalized_from_tags",
         "runtime_hits",
+        "runtime_distinct_evidence",
         "runtime_source_files",
         "notes",
     ]
@@ -794,16 +797,8 @@ def main() -> int:
     OUT_DIR.mkdir(parents=True, exist_ok=True)
 
     reqs = build_requirements()
-    tagged_rows: list[dict[str, str]] = []
-    for p in sorted(OUT_DIR.glob("upload_hints_*.csv")):
-        rows = read_csv_rows(p)
-        for row in rows:
-            tagged = dict(row)
-            tagged["_from_csv"] = p.name
-            tagged_rows.append(tagged)
-
     apply_baseline_traceability(reqs)
-    apply_runtime_traceability(reqs, tagged_rows)
+    apply_runtime_traceability(reqs, load_runtime_hint_summary())
     _model_docx_files, model_doc_files = apply_model_traceability(reqs)
 
     rows = [to_row(reqs[k]) for k in sorted(reqs.keys(), key=slug_sort_key)]
@@ -4,14 +4,17 @@ from __future__ import annotations
 import argparse
 import csv
 import json
+import os
 import re
+import sys
 import zipfile
-from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any
-import xml.etree.ElementTree as ET
+from typing import Any, Callable, Iterable, Iterator
 from xml.sax.saxutils import escape
 
 from openpyxl import Workbook
@@ -21,6 +24,35 @@ try:
 except Exception:  # pragma: no cover
     PdfReader = None  # type: ignore
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from app.services import docx_xml  # noqa: E402
+from app.services.artifact_registry import (  # noqa: E402
+    ARTIFACT_FILE_PATTERNS,
+    REGISTRY_NAME,
+    load_artifact_registry,
+    prune_artifact_runs,
+    register_artifacts,
+    save_artifact_registry,
+)
+from app.services.docx_text import load_docx_text  # noqa: E402
+from app.services.extraction_manifest import (  # noqa: E402
+    current_group_outputs,
+    forget_missing_files,
+    group_inputs_signature,
+    load_extraction_manifest,
+    missing_group_outputs,
+    record_file,
+    resolve_file_hash,
+    save_extraction_manifest,
+)
+from app.services.hint_store import HINT_STORE_NAME, HintStore  # noqa: E402
+from app.services.near_duplicates import NearDuplicateIndex  # noqa: E402
+from app.services.tender_grouping import group_files_by_tender, is_tech_spec, is_tender_document  # noqa: E402
+from app.services.tracing import TRACE_FILE_NAME, span, trace, traced  # noqa: E402
+from app.services.zip_stream import copy_zip_entry  # noqa: E402
 
 DOC_EXTENSIONS = {".pdf", ".docx"}
 EXCLUDE_DIR_TOKENS = {"debug"}
@@ -77,6 +109,7 @@ TARGET_SECTIONS = [
 
 MANUAL_REVIEW_FLAG = "\u041f\u0440\u043e\u0432\u0435\u0440\u0438 \u0440\u0430\u0447\u043d\u043e"
 MAX_HIDDEN_TECH_SPEC_ITEMS = 10
+TECH_SPEC_SIMILARITY_THRESHOLD = 0.88
 INSTITUTION_BLOCKLIST = (
     "\u043c\u0438\u043d\u0438\u0441\u0442\u0435\u0440\u0441\u0442\u0432\u043e\u0442\u043e \u0437\u0430 \u0444\u0438\u043d\u0430\u043d\u0441\u0438\u0438",
     "\u0443\u0458\u043f",
@@ -84,6 +117,46 @@ INSTITUTION_BLOCKLIST = (
     "\u0434\u0430\u043d\u043e\u0446\u0438",
 )
 W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MANIFEST_NAME = "extraction_manifest.json"
+PARSE_CACHE_DIRNAME = ".parse_cache"
+# detect_tender_id only looks at the head of the text.
+HEAD_TEXT_CHARS = 3000
+# The header detectors in build_context_fields read at most this much normalized text.
+FULL_TEXT_HEAD_CHARS = 16000
+SECTION_TEXT_CHARS = 6000
+# Lines read after a heading to tell a table-of-contents entry from the section itself.
+TOC_WINDOW_LINES = 4
+MAX_STORED_HITS = 120
+
+OUTPUT_FILE_PATTERNS = ARTIFACT_FILE_PATTERNS
+OUTPUT_FORMATS = tuple(OUTPUT_FILE_PATTERNS)
+OUTPUT_LABELS = {
+    "json": "JSON: ",
+    "md": "MD:   ",
+    "context_docx": "CONTEXT DOCX: ",
+    "csv": "CSV:  ",
+    "xlsx": "XLSX: ",
+    "req": "REQ:  ",
+    "checklist": "CHECKLIST: ",
+    "checklist_docx": "CHECKLIST DOCX: ",
+    "form_docx": "FORM DOCX: ",
+}
+OUTPUT_WORKERS = 4
+UPLOAD_HINT_FIELDS = ["file", "tag", "term", "source_page", "snippet"]
+REQUIREMENT_FIELDS = [
+    "requirement_id",
+    "source_file",
+    "category",
+    "hint_tag",
+    "section_code",
+    "section_heading",
+    "requirement_text",
+    "evidence_expected",
+    "mandatory",
+    "source_pages",
+    "snippet",
+    "status",
+]
 
 
 @dataclass
@@ -96,6 +169,15 @@ class ParsedFile:
     hit_count: int
     hits: list[dict[str, Any]]
     upload_hints: list[dict[str, str]]
+    # False when only the head of the text was kept; the rest lives in the page cache.
+    text_complete: bool = True
+    error: str = ""
+
+    @property
+    def cacheable(self) -> bool:
+        # Failed parses (no pypdf, a broken file) are retried on the next run; a scanned
+        # PDF without a text layer parses fine and is cached like any other file.
+        return not self.error
 
 
 def normalize_text(text: str) -> str:
@@ -106,28 +188,29 @@ def normalize_text(text: str) -> str:
 
 
 def extract_docx_text(path: Path) -> str:
-    chunks: list[str] = []
-    with zipfile.ZipFile(path, "r") as zf:
-        xml_names = [n for n in zf.namelist() if n.startswith("word/") and n.endswith(".xml")]
-        for name in xml_names:
-            if not any(k in name for k in ("document.xml", "header", "footer")):
-                continue
-            root = ET.fromstring(zf.read(name))
-            texts = [node.text or "" for node in root.findall(".//{*}t")]
-            merged = " ".join(t.strip() for t in texts if t and t.strip())
-            if merged:
-                chunks.append(merged)
-    return normalize_text("\n\n".join(chunks))
+    return normalize_text(load_docx_text(path).flat_text("\n\n"))
 
 
-def extract_pdf_text(path: Path) -> tuple[str, list[str]]:
+def iter_pdf_pages(path: Path, max_pages: int = 0) -> Iterator[str]:
+    """Yield normalized page texts one at a time; ``max_pages`` > 0 stops early."""
     if PdfReader is None:
-        return "", []
-    reader = PdfReader(str(path))
-    pages: list[str] = []
-    for page in reader.pages:
-        pages.append(normalize_text(page.extract_text() or ""))
-    return normalize_text("\n\n".join(pages)), pages
+        return
+    # Passing an open handle keeps pypdf from reading the whole file into memory.
+    with path.open("rb") as fh:
+        reader = PdfReader(fh)
+        for idx, page in enumerate(reader.pages):
+            if max_pages and idx >= max_pages:
+                break
+            yield normalize_text(page.extract_text() or "")
+
+
+def join_pages(pages: Iterable[str]) -> str:
+    return normalize_text("\n\n".join(pages))
+
+
+def extract_pdf_text(path: Path) -> tuple[str, list[str]]:
+    pages = list(iter_pdf_pages(path))
+    return join_pages(pages), pages
 
 
 def split_paragraphs(text: str) -> list[str]:
@@ -152,20 +235,34 @@ def score_filename(path: Path) -> int:
     return score
 
 
-def collect_candidates(input_dir: Path) -> list[Path]:
-    files: list[Path] = []
-    for p in input_dir.rglob("*"):
-        if not p.is_file():
-            continue
-        if p.suffix.lower() not in DOC_EXTENSIONS:
-            continue
-        if any(tok in {part.lower() for part in p.parts} for tok in EXCLUDE_DIR_TOKENS):
-            continue
-        files.append(p)
-    files.sort(key=lambda x: (score_filename(x), x.stat().st_mtime), reverse=True)
+def _walk_doc_files(directory: Path):
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name.lower() in EXCLUDE_DIR_TOKENS:
+                continue
+            yield from _walk_doc_files(Path(entry.path))
+        elif entry.is_file() and Path(entry.name).suffix.lower() in DOC_EXTENSIONS:
+            try:
+                yield Path(entry.path), entry.stat()
+            except OSError:
+                continue
+
+
+@traced()
+def collect_candidate_stats(input_dir: Path) -> list[tuple[Path, os.stat_result]]:
+    files = list(_walk_doc_files(input_dir))
+    files.sort(key=lambda item: (score_filename(item[0]), item[1].st_mtime), reverse=True)
     return files
 
 
+def collect_candidates(input_dir: Path) -> list[Path]:
+    return [path for path, _ in collect_candidate_stats(input_dir)]
+
+
 def find_hits(paragraphs: list[str], pages: list[str] | None = None) -> list[dict[str, Any]]:
     hits: list[dict[str, Any]] = []
     for para in paragraphs:
@@ -183,6 +280,14 @@ def find_hits(paragraphs: list[str], pages: list[str] | None = None) -> list[dic
     return hits
 
 
+def find_hits_in_pages(pages: Iterable[str]) -> Iterator[dict[str, Any]]:
+    """Streaming variant of ``find_hits``; each hit carries the page it came from."""
+    for page_no, page in enumerate(pages, start=1):
+        for hit in find_hits(split_paragraphs(page)):
+            hit["page"] = page_no
+            yield hit
+
+
 def build_upload_hints(hits: list[dict[str, Any]]) -> list[dict[str, str]]:
     out: list[dict[str, str]] = []
     for hit in hits:
@@ -224,58 +329,80 @@ def is_toc_like_line(line: str) -> bool:
     return False
 
 
-def extract_target_sections(text: str) -> dict[str, dict[str, str]]:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    headings: list[tuple[int, str, str]] = []
-    for idx, line in enumerate(lines):
-        m = HEADING_LINE_RE.match(line)
-        if not m:
-            continue
-        sec = m.group(1)
-        rest = m.group(2).strip()
-        headings.append((idx, sec, rest))
-
-    by_sec: dict[str, list[int]] = {}
-    for idx, sec, _ in headings:
-        if sec in TARGET_SECTIONS:
-            by_sec.setdefault(sec, []).append(idx)
-
-    chosen_idx_by_sec: dict[str, int] = {}
-    for sec in TARGET_SECTIONS:
-        candidates = by_sec.get(sec, [])
-        if not candidates:
-            continue
-        chosen: int | None = None
-        for idx in candidates:
-            line = lines[idx]
-            if is_toc_like_line(line):
+class _SectionCandidate:
+    """One target heading and the bounded start of the block that follows it."""
+
+    def __init__(self, position: int, heading: str):
+        self.position = position
+        self.heading = heading
+        self.window = [heading]
+        self.body: list[str] = []
+        self.body_len = 0
+
+    def add_body(self, line: str) -> None:
+        if self.body_len < SECTION_TEXT_CHARS:
+            self.body.append(line)
+            self.body_len += len(line) + 1
+
+    def is_toc_like(self) -> bool:
+        return is_toc_like_line(self.heading) or is_toc_like_line(" ".join(self.window).lower())
+
+    def payload(self) -> dict[str, str]:
+        body = "\n".join(self.body) if self.body else self.heading
+        return {"heading": self.heading, "text": body[:SECTION_TEXT_CHARS]}
+
+
+@traced()
+def extract_target_sections(source: str | Iterable[str]) -> dict[str, dict[str, str]]:
+    """
+    Accepts the full text or a stream of page texts and reads it line by line.
+    Only the candidate blocks for ``TARGET_SECTIONS`` are held, each capped at
+    ``SECTION_TEXT_CHARS``, so memory does not grow with the document.
+    """
+    chunks = [source] if isinstance(source, str) else source
+    chosen: dict[str, _SectionCandidate] = {}
+    first_seen: dict[str, _SectionCandidate] = {}
+    # Candidates whose table-of-contents window is still being filled.
+    pending: list[tuple[str, _SectionCandidate]] = []
+    current: _SectionCandidate | None = None
+    position = 0
+
+    def settle(sec: str, candidate: _SectionCandidate) -> None:
+        if sec not in chosen and not candidate.is_toc_like():
+            chosen[sec] = candidate
+
+    for chunk in chunks:
+        for raw in chunk.splitlines():
+            line = raw.strip()
+            if not line:
                 continue
-            window = " ".join(lines[idx : min(len(lines), idx + 4)]).lower()
-            if is_toc_like_line(window):
+            position += 1
+            still_pending: list[tuple[str, _SectionCandidate]] = []
+            for sec, candidate in pending:
+                candidate.window.append(line)
+                if len(candidate.window) < TOC_WINDOW_LINES:
+                    still_pending.append((sec, candidate))
+                else:
+                    settle(sec, candidate)
+            pending = still_pending
+
+            m = HEADING_LINE_RE.match(line)
+            if not m:
+                if current is not None:
+                    current.add_body(line)
                 continue
-            chosen = idx
-            break
-        if chosen is None:
-            chosen = candidates[0]
-        chosen_idx_by_sec[sec] = chosen
-
-    heading_idx_lookup = {idx: sec for idx, sec, _ in headings}
-    sorted_targets = sorted(((idx, sec) for sec, idx in chosen_idx_by_sec.items()), key=lambda x: x[0])
-    out: dict[str, dict[str, str]] = {}
-    for idx, sec in sorted_targets:
-        next_idx = len(lines)
-        for probe in range(idx + 1, len(lines)):
-            if probe in heading_idx_lookup:
-                next_idx = probe
-                break
-        block = lines[idx:next_idx]
-        if not block:
-            continue
-        heading = block[0]
-        body_lines = block[1:] if len(block) > 1 else block
-        body = "\n".join(body_lines) if body_lines else heading
-        out[sec] = {"heading": heading, "text": body[:6000]}
-    return out
+            # Any numbered heading ends the block before it.
+            current = None
+            sec = m.group(1)
+            if sec in TARGET_SECTIONS and sec not in chosen:
+                current = _SectionCandidate(position, line)
+                first_seen.setdefault(sec, current)
+                pending.append((sec, current))
+    for sec, candidate in pending:
+        settle(sec, candidate)
+
+    picked = {sec: chosen.get(sec, candidate) for sec, candidate in first_seen.items()}
+    return {sec: candidate.payload() for sec, candidate in sorted(picked.items(), key=lambda kv: kv[1].position)}
 
 
 def extract_bullet_documents(section_text: str) -> list[str]:
@@ -303,6 +430,7 @@ def extract_bullet_documents(section_text: str) -> list[str]:
     return cleaned
 
 
+@traced()
 def build_requirements_template_rows(
     source_file: str,
     upload_rows: list[dict[str, str]],
@@ -389,19 +517,17 @@ def build_requirements_template_rows(
 
 
 def write_upload_hints_xlsx(rows: list[dict[str, str]], path: Path) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "upload_hints"
-    ws.append(["file", "tag", "term", "source_page", "snippet"])
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("upload_hints")
+    ws.append(UPLOAD_HINT_FIELDS)
     for row in rows:
         ws.append([row["file"], row["tag"], row["term"], row["source_page"], row["snippet"]])
     wb.save(path)
 
 
 def write_rows_xlsx(rows: list[dict[str, str]], path: Path, sheet_name: str) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = sheet_name[:31]
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(sheet_name[:31])
     headers = list(rows[0].keys()) if rows else []
     ws.append(headers)
     for row in rows:
@@ -918,30 +1044,27 @@ def score_tech_spec_hit(hit: dict[str, Any]) -> int:
     return score
 
 
+@traced()
 def dedupe_top_tech_spec_hits(
     tech_spec_hits: list[dict[str, Any]], max_items: int = MAX_HIDDEN_TECH_SPEC_ITEMS
 ) -> list[dict[str, Any]]:
     ranked = sorted(tech_spec_hits, key=score_tech_spec_hit, reverse=True)
     kept: list[dict[str, Any]] = []
-    fingerprints: list[str] = []
+    fingerprints = NearDuplicateIndex(threshold=TECH_SPEC_SIMILARITY_THRESHOLD)
     for hit in ranked:
         fp = normalize_for_similarity(str(hit.get("snippet", "")))
         if len(fp) < 24:
             continue
-        is_duplicate = False
-        for seen in fingerprints:
-            if fp == seen or SequenceMatcher(None, fp, seen).ratio() >= 0.88:
-                is_duplicate = True
-                break
-        if is_duplicate:
+        if fingerprints.is_duplicate(fp):
             continue
         kept.append(hit)
-        fingerprints.append(fp)
+        fingerprints.add(fp)
         if len(kept) >= max_items:
             break
     return kept
 
 
+@traced()
 def build_context_fields(
     full_text: str,
     sections: dict[str, dict[str, str]],
@@ -1157,35 +1280,346 @@ def write_context_docx_from_template(
     with zipfile.ZipFile(template_path, "r") as zin:
         with zipfile.ZipFile(output_path, "w", compression=zipfile.ZIP_DEFLATED) as zout:
             for item in zin.infolist():
-                data = zin.read(item.filename)
-                if item.filename == "word/document.xml":
-                    root = ET.fromstring(data)
-                    rows = root.findall(f".//{W_NS}tr")
-                    for idx, tr in enumerate(rows):
-                        if idx >= len(ordered_fields):
-                            break
-                        tcs = tr.findall(f"{W_NS}tc")
-                        if len(tcs) < 2:
-                            continue
-                        field_key = ordered_fields[idx]
-                        value = normalize_csv_cell(
-                            context_fields.get(field_key, {}).get("value", MANUAL_REVIEW_FLAG), max_len=520
-                        )
-                        right_tc = tcs[1]
-                        paragraph = right_tc.find(f"{W_NS}p")
-                        if paragraph is None:
-                            paragraph = ET.SubElement(right_tc, f"{W_NS}p")
-                        for node in list(paragraph):
-                            paragraph.remove(node)
-                        run = ET.SubElement(paragraph, f"{W_NS}r")
-                        text = ET.SubElement(run, f"{W_NS}t")
-                        text.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-                        text.text = value
-                    data = ET.tostring(root, encoding="utf-8", xml_declaration=True)
+                if item.filename != "word/document.xml":
+                    copy_zip_entry(zin, zout, item)
+                    continue
+                root = docx_xml.fromstring(zin.read(item.filename))
+                rows = root.findall(f".//{W_NS}tr")
+                for idx, tr in enumerate(rows):
+                    if idx >= len(ordered_fields):
+                        break
+                    tcs = tr.findall(f"{W_NS}tc")
+                    if len(tcs) < 2:
+                        continue
+                    field_key = ordered_fields[idx]
+                    value = normalize_csv_cell(
+                        context_fields.get(field_key, {}).get("value", MANUAL_REVIEW_FLAG), max_len=520
+                    )
+                    right_tc = tcs[1]
+                    paragraph = right_tc.find(f"{W_NS}p")
+                    if paragraph is None:
+                        paragraph = docx_xml.sub_element(right_tc, f"{W_NS}p")
+                    for node in list(paragraph):
+                        paragraph.remove(node)
+                    run = docx_xml.sub_element(paragraph, f"{W_NS}r")
+                    text = docx_xml.sub_element(run, f"{W_NS}t")
+                    text.set(docx_xml.XML_SPACE, "preserve")
+                    text.text = value
+                data = docx_xml.tostring(root)
                 zout.writestr(item, data)
     return True
 
 
+def write_context_docx(
+    template_path: Path,
+    context_fields: dict[str, dict[str, str]],
+    context_lines: list[str],
+    path: Path,
+) -> None:
+    if not write_context_docx_from_template(template_path, path, context_fields):
+        write_simple_checklist_docx(context_lines, path)
+
+
+def write_json_file(payload: dict[str, Any], path: Path) -> None:
+    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+def write_text_lines(lines: list[str], path: Path) -> None:
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def write_csv_rows(fieldnames: list[str], rows: list[dict[str, str]], path: Path) -> None:
+    with path.open("w", encoding="utf-8-sig", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+@contextmanager
+def atomic_output_path(path: Path) -> Iterator[Path]:
+    """Yield a hidden temp path next to ``path``; it replaces ``path`` only if the writer succeeds."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+@traced()
+def run_output_stage(
+    jobs: dict[str, tuple[Callable[[Path], Any], Path]],
+    max_workers: int = OUTPUT_WORKERS,
+) -> dict[str, str]:
+    """
+    Write the requested outputs concurrently.
+
+    ``jobs`` maps an output kind to ``(writer, final_path)``; each writer gets a
+    temp path and the result is renamed into place, so readers never see a
+    half-written file. Returns ``{kind: final_path}`` in ``OUTPUT_FORMATS`` order.
+    """
+
+    def run(kind: str) -> tuple[str, str]:
+        writer, path = jobs[kind]
+        with atomic_output_path(path) as tmp_path:
+            writer(tmp_path)
+        return kind, str(path)
+
+    if not jobs:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as pool:
+        written = dict(pool.map(run, jobs))
+    return {kind: written[kind] for kind in OUTPUT_FORMATS if kind in written}
+
+
+def parse_formats(value: str) -> list[str]:
+    requested = [part.strip() for part in (value or "").split(",") if part.strip()]
+    if not requested or "all" in requested:
+        return list(OUTPUT_FORMATS)
+    unknown = [kind for kind in requested if kind not in OUTPUT_FILE_PATTERNS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown format(s): {', '.join(unknown)}; choose from {', '.join(OUTPUT_FORMATS)} or all"
+        )
+    return [kind for kind in OUTPUT_FORMATS if kind in requested]
+
+
+def _parse_pdf_stream(
+    path: Path,
+    page_sink: Callable[[str], Any] | None,
+    max_pages: int,
+    keep_text: bool,
+) -> ParsedFile:
+    if PdfReader is None:
+        raise RuntimeError("pypdf is not installed")
+    kept_pages: list[str] = []
+    head_len = 0
+
+    def pages() -> Iterator[str]:
+        nonlocal head_len
+        for page in iter_pdf_pages(path, max_pages):
+            if page_sink is not None:
+                page_sink(page)
+            if keep_text or head_len <= HEAD_TEXT_CHARS:
+                kept_pages.append(page)
+                head_len += len(page) + 2
+            yield page
+
+    hits: list[dict[str, Any]] = []
+    hit_count = 0
+    unique_hints: dict[tuple[str, str], dict[str, str]] = {}
+    for hit in find_hits_in_pages(pages()):
+        hit_count += 1
+        if len(hits) < MAX_STORED_HITS:
+            hits.append(hit)
+        for hint in build_upload_hints([hit]):
+            unique_hints[(hint["tag"], hint["snippet"])] = hint
+
+    text = join_pages(kept_pages)
+    if not keep_text:
+        text = text[:HEAD_TEXT_CHARS]
+    return ParsedFile(
+        path=path,
+        kind="pdf",
+        text=text,
+        pages=[],
+        tender_id=detect_tender_id(path, text),
+        hit_count=hit_count,
+        hits=hits,
+        upload_hints=list(unique_hints.values())[:MAX_STORED_HITS],
+        text_complete=keep_text,
+    )
+
+
+@traced()
+def parse_document(
+    path: Path,
+    page_sink: Callable[[str], Any] | None = None,
+    max_pages: int = 0,
+    keep_text: bool = True,
+) -> ParsedFile:
+    """
+    Parse one tender document.
+
+    PDFs are streamed page by page: each page is handed to ``page_sink`` and
+    scanned for hits before the next one is extracted. With ``keep_text=False``
+    only the head of the text is retained (enough for tender id detection).
+    """
+    kind = path.suffix.lower().lstrip(".")
+    try:
+        if path.suffix.lower() == ".pdf":
+            return _parse_pdf_stream(path, page_sink, max_pages, keep_text)
+        text = extract_docx_text(path)
+        hits = find_hits(split_paragraphs(text))
+        hints = build_upload_hints(hits)
+        return ParsedFile(
+            path=path,
+            kind=kind,
+            text=text,
+            pages=[],
+            tender_id=detect_tender_id(path, text),
+            hit_count=len(hits),
+            hits=hits[:MAX_STORED_HITS],
+            upload_hints=hints[:MAX_STORED_HITS],
+        )
+    except Exception as exc:
+        return ParsedFile(
+            path=path,
+            kind=kind,
+            text="",
+            pages=[],
+            tender_id=None,
+            hit_count=0,
+            hits=[],
+            upload_hints=[],
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+
+def _page_cache_path(cache_dir: Path, sha256: str) -> Path:
+    return cache_dir / f"{sha256}.pages.jsonl"
+
+
+class PageCacheWriter:
+    """Pages appended while a PDF is parsed; nothing is published unless ``commit`` is called."""
+
+    def __init__(self, handle: Any):
+        self._handle = handle
+        self.committed = False
+
+    def write(self, page: str) -> None:
+        self._handle.write(json.dumps(page, ensure_ascii=False) + "\n")
+
+    def commit(self) -> None:
+        self.committed = True
+
+
+@contextmanager
+def page_cache_writer(cache_dir: Path, sha256: str) -> Iterator[PageCacheWriter]:
+    """
+    Append pages to a temp file as they are extracted. The page cache is
+    renamed into place on exit only if the writer was committed, i.e. the
+    whole document parsed; otherwise the temp file is removed.
+    """
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    final_path = _page_cache_path(cache_dir, sha256)
+    tmp_path = final_path.with_name(final_path.name + ".tmp")
+    try:
+        with tmp_path.open("w", encoding="utf-8") as fh:
+            writer = PageCacheWriter(fh)
+            yield writer
+        if writer.committed:
+            os.replace(tmp_path, final_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def iter_cached_pages(cache_dir: Path, sha256: str) -> Iterator[str]:
+    pages_path = _page_cache_path(cache_dir, sha256)
+    if not pages_path.exists():
+        return
+    with pages_path.open("r", encoding="utf-8") as fh:
+        for line in fh:
+            if line.strip():
+                yield json.loads(line)
+
+
+def iter_document_pages(item: ParsedFile, cache_dir: Path, sha256: str) -> Iterator[str]:
+    """The whole text of a parsed file: from memory when complete, else page by page from the page cache."""
+    if item.text_complete or not _page_cache_path(cache_dir, sha256).exists():
+        yield item.text
+        return
+    yield from iter_cached_pages(cache_dir, sha256)
+
+
+@traced()
+def read_main_document(item: ParsedFile, cache_dir: Path, sha256: str) -> tuple[dict[str, dict[str, str]], str]:
+    """
+    Stream the main document once. Target sections are cut from its pages as
+    they are read and only the first ``FULL_TEXT_HEAD_CHARS`` are kept for the
+    header detectors, so the joined text of a long tender never exists in memory.
+    """
+    head_pages: list[str] = []
+    head_len = 0
+
+    def pages() -> Iterator[str]:
+        nonlocal head_len
+        for page in iter_document_pages(item, cache_dir, sha256):
+            if head_len < FULL_TEXT_HEAD_CHARS:
+                head_pages.append(page)
+                head_len += len(page) + 2
+            yield page
+
+    sections = extract_target_sections(pages())
+    return sections, join_pages(head_pages)[:FULL_TEXT_HEAD_CHARS]
+
+
+@traced()
+def load_parse_cache(cache_dir: Path, sha256: str, path: Path) -> ParsedFile | None:
+    cache_path = cache_dir / f"{sha256}.json"
+    if not cache_path.exists():
+        return None
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not data.get("parsed_ok") and not (data.get("text") or data.get("head")):
+        # An empty entry from before failed parses stopped being cached; it may be a failure.
+        return None
+    # PDF text is not duplicated into the JSON; it is rebuilt from the page cache on demand.
+    has_text = "text" in data
+    return ParsedFile(
+        path=path,
+        kind=data.get("kind", path.suffix.lower().lstrip(".")),
+        text=data.get("text", data.get("head", "")),
+        pages=[],
+        tender_id=data.get("tender_id"),
+        hit_count=int(data.get("hit_count", 0)),
+        hits=data.get("hits", []),
+        upload_hints=data.get("upload_hints", []),
+        text_complete=has_text,
+    )
+
+
+@traced()
+def write_parse_cache(cache_dir: Path, sha256: str, item: ParsedFile) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    payload: dict[str, Any] = {
+        "parsed_ok": True,
+        "kind": item.kind,
+        "tender_id": item.tender_id,
+        "hit_count": item.hit_count,
+        "hits": item.hits,
+        "upload_hints": item.upload_hints,
+    }
+    if _page_cache_path(cache_dir, sha256).exists():
+        payload["head"] = item.text[:HEAD_TEXT_CHARS]
+    else:
+        payload["text"] = item.text
+    tmp_path = cache_dir / f"{sha256}.json.tmp"
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, cache_dir / f"{sha256}.json")
+
+
+def discard_parse_cache(cache_dir: Path, sha256: str) -> None:
+    for cache_path in (cache_dir / f"{sha256}.json", _page_cache_path(cache_dir, sha256)):
+        cache_path.unlink(missing_ok=True)
+
+
+def prune_parse_cache(cache_dir: Path, manifest: dict[str, Any]) -> int:
+    """Remove cache entries (and leftover temp files) whose hash no manifest file references."""
+    if not cache_dir.is_dir():
+        return 0
+    referenced = {entry.get("sha256") for entry in manifest.get("files", {}).values()}
+    removed = 0
+    for cache_path in cache_dir.iterdir():
+        if cache_path.is_file() and cache_path.name.split(".", 1)[0] not in referenced:
+            cache_path.unlink(missing_ok=True)
+            removed += 1
+    return removed
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Extract per-tender context and upload template rows from tender documents."
@@ -1199,8 +1633,45 @@ def main() -> int:
         default="task_force/templates/context_template_v2.docx",
         help="DOCX template used for tender context export.",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse cached parses for unchanged files and skip tender groups whose inputs did not change.",
+    )
+    parser.add_argument(
+        "--annex-page-cap",
+        type=int,
+        default=0,
+        help="Max PDF pages scanned per annex (files other than the tender documentation); 0 = no cap.",
+    )
+    parser.add_argument(
+        "--formats",
+        type=parse_formats,
+        default="all",
+        help=f"Comma-separated outputs to write ({','.join(OUTPUT_FORMATS)}) or 'all'.",
+    )
+    parser.add_argument(
+        "--keep-runs",
+        type=int,
+        default=0,
+        help=(
+            "Delete artifacts of all but the newest N runs per tender (latest artifacts are never removed). "
+            "Default: 0, keep all."
+        ),
+    )
+    parser.add_argument(
+        "--trace-file",
+        default=f"task_force/out/{TRACE_FILE_NAME}",
+        help="JSONL file that receives per-stage timing spans of this run; empty to disable.",
+    )
     args = parser.parse_args()
 
+    trace_path = (Path.cwd() / args.trace_file).resolve() if args.trace_file else None
+    with trace("extract_tender_context", export_path=trace_path, log=print, tender_id=args.tender_id or "all"):
+        return run_extraction(args)
+
+
+def run_extraction(args: argparse.Namespace) -> int:
     root = Path.cwd()
     input_dir = (root / args.input_dir).resolve()
     out_dir = (root / args.out_dir).resolve()
@@ -1208,212 +1679,179 @@ def main() -> int:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     stamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%SZ")
-    files = collect_candidates(input_dir)[: max(1, args.max_files)]
+    manifest_path = out_dir / MANIFEST_NAME
+    cache_dir = out_dir / PARSE_CACHE_DIRNAME
+    manifest = load_extraction_manifest(manifest_path)
+    registry_path = out_dir / REGISTRY_NAME
+    registry = load_artifact_registry(registry_path)
+    hint_store = HintStore(out_dir / HINT_STORE_NAME)
+    candidates = collect_candidate_stats(input_dir)[: max(1, args.max_files)]
 
     parsed: list[ParsedFile] = []
-    for path in files:
-        kind = path.suffix.lower().lstrip(".")
-        try:
+    file_hashes: dict[Path, str] = {}
+    reused = 0
+    for path, stat_result in candidates:
+        sha, changed = resolve_file_hash(manifest, path, stat_result)
+        item = load_parse_cache(cache_dir, sha, path) if args.incremental and not changed else None
+        if item is None:
             if path.suffix.lower() == ".pdf":
-                text, pages = extract_pdf_text(path)
+                # PDF text stays on disk in the page cache; only its head is kept in memory.
+                # Annexes may be page-capped, tender documentation is always read in full.
+                tender_doc = is_tender_document(path)
+                with page_cache_writer(cache_dir, sha) as page_cache:
+                    item = parse_document(
+                        path,
+                        page_sink=page_cache.write,
+                        max_pages=0 if tender_doc else max(0, args.annex_page_cap),
+                        keep_text=False,
+                    )
+                    if item.cacheable:
+                        page_cache.commit()
             else:
-                text = extract_docx_text(path)
-                pages = []
-            paragraphs = split_paragraphs(text)
-            hits = find_hits(paragraphs, pages if pages else None)
-            hints = build_upload_hints(hits)
-            tender_id = detect_tender_id(path, text)
-            parsed.append(
-                ParsedFile(
-                    path=path,
-                    kind=kind,
-                    text=text,
-                    pages=pages,
-                    tender_id=tender_id,
-                    hit_count=len(hits),
-                    hits=hits[:120],
-                    upload_hints=hints[:120],
-                )
-            )
-        except Exception:
-            parsed.append(
-                ParsedFile(
-                    path=path,
-                    kind=kind,
-                    text="",
-                    pages=[],
-                    tender_id=None,
-                    hit_count=0,
-                    hits=[],
-                    upload_hints=[],
-                )
-            )
-
-    grouped: dict[str, list[ParsedFile]] = {}
-    tender_docs = [
-        p
-        for p in parsed
-        if p.tender_id and "\u0442\u0435\u043d\u0434\u0435\u0440\u0441\u043a\u0430_\u0434\u043e\u043a\u0443\u043c\u0435\u043d\u0442\u0430\u0446" in p.path.name.lower()
-    ]
-    for item in parsed:
-        if item.tender_id:
-            continue
-        is_tech_spec = "\u0442\u0435\u0445\u043d\u0438\u0447\u043a\u0430 \u0441\u043f\u0435\u0446\u0438\u0444\u0438\u043a\u0430\u0446" in item.path.name.lower()
-        if not is_tech_spec:
-            continue
-        if args.tender_id:
-            item.tender_id = args.tender_id
-            continue
-        if not tender_docs:
-            continue
-        nearest = min(
-            tender_docs,
-            key=lambda td: abs(td.path.stat().st_mtime - item.path.stat().st_mtime),
+                item = parse_document(path)
+            if item.cacheable:
+                write_parse_cache(cache_dir, sha, item)
+            else:
+                discard_parse_cache(cache_dir, sha)
+        else:
+            reused += 1
+        record_file(
+            manifest,
+            path,
+            stat_result,
+            sha,
+            item.tender_id,
+            "ok" if item.text else "error_or_empty",
         )
-        # Keep assignment conservative for files downloaded in the same window.
-        if abs(nearest.path.stat().st_mtime - item.path.stat().st_mtime) <= 12 * 3600:
-            item.tender_id = nearest.tender_id
+        file_hashes[path] = sha
+        parsed.append(item)
 
-    for item in parsed:
-        if not item.tender_id:
-            continue
-        if args.tender_id and item.tender_id != args.tender_id:
-            continue
-        grouped.setdefault(item.tender_id, []).append(item)
+    mtimes = {path: stat_result.st_mtime for path, stat_result in candidates}
+    grouped = group_files_by_tender(parsed, mtimes=mtimes, tender_id_filter=args.tender_id)
 
     outputs: list[dict[str, str]] = []
     for tender_id, group_files in sorted(grouped.items()):
-        group_files.sort(key=lambda x: (score_filename(x.path), x.path.stat().st_mtime), reverse=True)
-        main_doc = group_files[0]
-
-        sections = extract_target_sections(main_doc.text)
-        tech_spec_hits: list[dict[str, Any]] = []
-        upload_rows: list[dict[str, str]] = []
-        file_records: list[dict[str, Any]] = []
-
-        for item in group_files:
-            is_tech_spec = "\u0442\u0435\u0445\u043d\u0438\u0447\u043a\u0430 \u0441\u043f\u0435\u0446\u0438\u0444\u0438\u043a\u0430\u0446" in item.path.name.lower()
-            if is_tech_spec:
-                tech_spec_hits.extend(item.hits[:40])
-            for hint in item.upload_hints:
-                upload_rows.append(
+        with span("tender_group", tender_id=tender_id, files=len(group_files)):
+            signature = group_inputs_signature([(str(item.path), file_hashes[item.path]) for item in group_files])
+            pending_formats = list(args.formats)
+            if args.incremental:
+                pending_formats = missing_group_outputs(manifest, tender_id, signature, args.formats)
+                if not pending_formats:
+                    outputs.append(
+                        {"tender_id": tender_id, "status": "unchanged", **current_group_outputs(manifest, tender_id, signature)}
+                    )
+                    continue
+
+            group_files.sort(key=lambda x: (score_filename(x.path), mtimes[x.path]), reverse=True)
+            main_doc = group_files[0]
+            sections, main_head = read_main_document(main_doc, cache_dir, file_hashes[main_doc.path])
+            tech_spec_hits: list[dict[str, Any]] = []
+            upload_rows: list[dict[str, str]] = []
+            file_records: list[dict[str, Any]] = []
+
+            for item in group_files:
+                if is_tech_spec(item.path):
+                    tech_spec_hits.extend(item.hits[:40])
+                for hint in item.upload_hints:
+                    upload_rows.append(
+                        {
+                            "file": item.path.name,
+                            "tag": hint["tag"],
+                            "term": hint["term"],
+                            "source_page": hint["source_page"],
+                            "snippet": hint["snippet"],
+                        }
+                    )
+                file_records.append(
                     {
-                        "file": item.path.name,
-                        "tag": hint["tag"],
-                        "term": hint["term"],
-                        "source_page": hint["source_page"],
-                        "snippet": hint["snippet"],
+                        "file": str(item.path),
+                        "kind": item.kind,
+                        "status": "ok" if item.text else "error_or_empty",
+                        "hit_count": item.hit_count,
+                        "upload_hints": item.upload_hints,
                     }
                 )
-            file_records.append(
-                {
-                    "file": str(item.path),
-                    "kind": item.kind,
-                    "status": "ok" if item.text else "error_or_empty",
-                    "hit_count": item.hit_count,
-                    "upload_hints": item.upload_hints,
-                }
-            )
 
-        deduped_tech_spec_hits = dedupe_top_tech_spec_hits(tech_spec_hits, MAX_HIDDEN_TECH_SPEC_ITEMS)
-        context_fields = build_context_fields(
-            full_text=main_doc.text,
-            sections=sections,
-            tech_spec_hits=deduped_tech_spec_hits,
-        )
-        payload = {
-            "generated_at_utc": stamp,
-            "tender_id": tender_id,
-            "main_source_file": str(main_doc.path),
-            "processed_files": len(group_files),
-            "pdf_reader_available": PdfReader is not None,
-            "target_sections": sections,
-            "context_fields": context_fields,
-            "confidence_summary": {
-                level: sum(1 for item in context_fields.values() if item.get("confidence") == level)
-                for level in ("high", "medium", "low")
-            },
-            "files": file_records,
-        }
-
-        tender_slug = tender_id.replace("-", "_")
-        json_path = out_dir / f"tender_context_{tender_slug}_{stamp}.json"
-        md_path = out_dir / f"tender_context_{tender_slug}_{stamp}.md"
-        context_docx_path = out_dir / f"tender_context_{tender_slug}_{stamp}.docx"
-        csv_path = out_dir / f"upload_hints_{tender_slug}_{stamp}.csv"
-        xlsx_path = out_dir / f"upload_hints_{tender_slug}_{stamp}.xlsx"
-        requirements_path = out_dir / f"upload_requirements_template_{tender_slug}_{stamp}.csv"
-        checklist_path = out_dir / f"simple_checklist_{tender_slug}_{stamp}.md"
-        checklist_docx_path = out_dir / f"simple_checklist_{tender_slug}_{stamp}.docx"
-        form_docx_path = out_dir / f"simple_form_{tender_slug}_{stamp}.docx"
-
-        safe_upload_rows = sanitize_rows_for_csv(upload_rows, max_len=600)
-        json_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-        with csv_path.open("w", encoding="utf-8-sig", newline="") as fh:
-            writer = csv.DictWriter(fh, fieldnames=["file", "tag", "term", "source_page", "snippet"])
-            writer.writeheader()
-            writer.writerows(safe_upload_rows)
-        write_upload_hints_xlsx(upload_rows, xlsx_path)
-
-        req_rows = build_requirements_template_rows(main_doc.path.name, upload_rows, sections, deduped_tech_spec_hits)
-        safe_req_rows = sanitize_rows_for_csv(req_rows, max_len=2400)
-        with requirements_path.open("w", encoding="utf-8-sig", newline="") as fh:
-            writer = csv.DictWriter(
-                fh,
-                fieldnames=[
-                    "requirement_id",
-                    "source_file",
-                    "category",
-                    "hint_tag",
-                    "section_code",
-                    "section_heading",
-                    "requirement_text",
-                    "evidence_expected",
-                    "mandatory",
-                    "source_pages",
-                    "snippet",
-                    "status",
-                ],
+            deduped_tech_spec_hits = dedupe_top_tech_spec_hits(tech_spec_hits, MAX_HIDDEN_TECH_SPEC_ITEMS)
+            context_fields = build_context_fields(
+                full_text=main_head,
+                sections=sections,
+                tech_spec_hits=deduped_tech_spec_hits,
             )
-            writer.writeheader()
-            writer.writerows(safe_req_rows)
-
-        checklist_lines = build_simple_checklist_lines(
-            tender_id=tender_id,
-            main_source_file=main_doc.path.name,
-            sections=sections,
-            req_rows=req_rows,
-        )
-        checklist_path.write_text("\n".join(checklist_lines), encoding="utf-8")
-        write_simple_checklist_docx(checklist_lines, checklist_docx_path)
-
-        form_rows = build_simple_form_rows(req_rows)
-        write_simple_form_docx(form_rows, tender_id, form_docx_path)
+            payload = {
+                "generated_at_utc": stamp,
+                "tender_id": tender_id,
+                "main_source_file": str(main_doc.path),
+                "processed_files": len(group_files),
+                "pdf_reader_available": PdfReader is not None,
+                "target_sections": sections,
+                "context_fields": context_fields,
+                "confidence_summary": {
+                    level: sum(1 for item in context_fields.values() if item.get("confidence") == level)
+                    for level in ("high", "medium", "low")
+                },
+                "files": file_records,
+            }
 
-        context_lines = build_elegant_context_lines_v2(
-            tender_id=tender_id,
-            main_source_file=main_doc.path.name,
-            context_fields=context_fields,
-            tech_spec_hits=deduped_tech_spec_hits,
-        )
-        md_path.write_text("\n".join(context_lines), encoding="utf-8")
-        if not write_context_docx_from_template(context_template_path, context_docx_path, context_fields):
-            write_simple_checklist_docx(context_lines, context_docx_path)
+            tender_slug = tender_id.replace("-", "_")
+            output_paths = {
+                kind: out_dir / pattern.format(slug=tender_slug, stamp=stamp)
+                for kind, pattern in OUTPUT_FILE_PATTERNS.items()
+            }
 
-        outputs.append(
-            {
-                "tender_id": tender_id,
-                "json": str(json_path),
-                "md": str(md_path),
-                "context_docx": str(context_docx_path),
-                "csv": str(csv_path),
-                "xlsx": str(xlsx_path),
-                "req": str(requirements_path),
-                "checklist": str(checklist_path),
-                "checklist_docx": str(checklist_docx_path),
-                "form_docx": str(form_docx_path),
+            req_rows = build_requirements_template_rows(main_doc.path.name, upload_rows, sections, deduped_tech_spec_hits)
+            checklist_lines = build_simple_checklist_lines(
+                tender_id=tender_id,
+                main_source_file=main_doc.path.name,
+                sections=sections,
+                req_rows=req_rows,
+            )
+            context_lines = build_elegant_context_lines_v2(
+                tender_id=tender_id,
+                main_source_file=main_doc.path.name,
+                context_fields=context_fields,
+                tech_spec_hits=deduped_tech_spec_hits,
+            )
+            upload_csv_rows = sanitize_rows_for_csv(upload_rows, max_len=600)
+            writers: dict[str, Callable[[Path], Any]] = {
+                "json": partial(write_json_file, payload),
+                "md": partial(write_text_lines, context_lines),
+                "context_docx": partial(write_context_docx, context_template_path, context_fields, context_lines),
+                "csv": partial(write_csv_rows, UPLOAD_HINT_FIELDS, upload_csv_rows),
+                "xlsx": partial(write_upload_hints_xlsx, upload_rows),
+                "req": partial(write_csv_rows, REQUIREMENT_FIELDS, sanitize_rows_for_csv(req_rows, max_len=2400)),
+                "checklist": partial(write_text_lines, checklist_lines),
+                "checklist_docx": partial(write_simple_checklist_docx, checklist_lines),
+                "form_docx": partial(write_simple_form_docx, build_simple_form_rows(req_rows), tender_id),
             }
-        )
+            written = run_output_stage({kind: (writers[kind], output_paths[kind]) for kind in pending_formats})
+            if "csv" in written:
+                # build_true_upload_requirements.py reads runtime hints from the store, not from every CSV.
+                hint_store.record_csv(written["csv"], upload_csv_rows)
+            # Outputs of other formats generated earlier from the same inputs stay valid.
+            merged = {**current_group_outputs(manifest, tender_id, signature), **written}
+            group_outputs = {kind: merged[kind] for kind in OUTPUT_FORMATS if kind in merged}
+            manifest["groups"][tender_id] = {
+                "inputs_signature": signature,
+                "generated_at_utc": stamp,
+                "outputs": group_outputs,
+            }
+            register_artifacts(registry, tender_id, stamp, written)
+            outputs.append({"tender_id": tender_id, "status": "generated", **group_outputs})
+
+    with span("save_state"):
+        forget_missing_files(manifest)
+        pruned_cache = prune_parse_cache(cache_dir, manifest)
+        save_extraction_manifest(manifest_path, manifest)
+        hint_store.close()
+        pruned = prune_artifact_runs(registry, args.keep_runs)
+        save_artifact_registry(registry_path, registry)
+    if pruned:
+        print(f"PRUNED: {len(pruned)} artifact(s) from older runs")
+    if args.incremental:
+        print(f"INCREMENTAL: reused_parses={reused} parsed={len(parsed) - reused}")
+    if pruned_cache:
+        print(f"PRUNED: {pruned_cache} stale parse cache file(s)")
 
     if not outputs:
         print("No tender groups detected with tender-id signature.")
@@ -1421,15 +1859,11 @@ def main() -> int:
 
     for item in outputs:
         print(f"TENDER: {item['tender_id']}")
-        print(f"  JSON: {item['json']}")
-        print(f"  MD:   {item['md']}")
-        print(f"  CONTEXT DOCX: {item['context_docx']}")
-        print(f"  CSV:  {item['csv']}")
-        print(f"  XLSX: {item['xlsx']}")
-        print(f"  REQ:  {item['req']}")
-        print(f"  CHECKLIST: {item['checklist']}")
-        print(f"  CHECKLIST DOCX: {item['checklist_docx']}")
-        print(f"  FORM DOCX: {item['form_docx']}")
+        if item["status"] == "unchanged":
+            print("  STATUS: unchanged (inputs match manifest; outputs reused)")
+        for kind in OUTPUT_FORMATS:
+            if kind in item:
+                print(f"  {OUTPUT_LABELS[kind]}{item[kind]}")
     return 0
 
 
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+from app.services import artifact_registry
+from app.services.artifact_registry import (
+    REGISTRY_NAME,
+    RUNS_NAME,
+    find_latest_artifact,
+    load_artifact_registry,
+    load_latest_pointers,
+    prune_artifact_runs,
+    register_artifacts,
+    save_artifact_registry,
+)
+
+
+class ArtifactRegistryTests(unittest.TestCase):
+    def _make_case_dir(self) -> Path:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_artifact_registry"
+        case_dir = root / str(uuid.uuid4())
+        case_dir.mkdir(parents=True, exist_ok=True)
+        return case_dir
+
+    def _touch(self, root: Path, name: str) -> str:
+        path = root / name
+        path.write_bytes(b"x")
+        return str(path)
+
+    def test_latest_pointer_prefers_tender_then_falls_back_to_any(self) -> None:
+        root = self._make_case_dir()
+        try:
+            registry = load_artifact_registry(root / REGISTRY_NAME)
+            a_docx = self._touch(root, "tender_context_01234_2026_20260101_000000Z.docx")
+            b_docx = self._touch(root, "tender_context_05678_2026_20260102_000000Z.docx")
+            b_csv = self._touch(root, "upload_hints_05678_2026_20260102_000000Z.csv")
+            register_artifacts(registry, "01234-2026", "20260101_000000Z", {"context_docx": a_docx})
+            register_artifacts(registry, "05678-2026", "20260102_000000Z", {"context_docx": b_docx, "csv": b_csv})
+            save_artifact_registry(root / REGISTRY_NAME, registry)
+
+            self.assertEqual(find_latest_artifact(root, ("context_docx",), "01234-2026"), Path(a_docx))
+            self.assertEqual(find_latest_artifact(root, ("context_docx",), "09999-2026"), Path(b_docx))
+            unregistered = self._touch(root, "tender_context_09999_2026_20251201_000000Z.docx")
+            self.assertEqual(find_latest_artifact(root, ("context_docx",), "09999-2026"), Path(unregistered))
+            self.assertEqual(find_latest_artifact(root, ("xlsx", "csv"), "01234-2026"), Path(b_csv))
+            self.assertIsNone(find_latest_artifact(root, ("req",), "01234-2026"))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_scan_fallback_without_registry(self) -> None:
+        root = self._make_case_dir()
+        try:
+            req = self._touch(root, "upload_requirements_template_01234_2026_20260101_000000Z.csv")
+            self.assertEqual(find_latest_artifact(root, ("req",), "01234-2026"), Path(req))
+            self.assertEqual(find_latest_artifact(root, ("req",)), Path(req))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_prune_keeps_newest_runs_and_latest_pointers(self) -> None:
+        root = self._make_case_dir()
+        try:
+            registry = load_artifact_registry(root / REGISTRY_NAME)
+            old_json = self._touch(root, "old.json")
+            old_docx = self._touch(root, "old.docx")
+            mid_json = self._touch(root, "mid.json")
+            new_json = self._touch(root, "new.json")
+            register_artifacts(registry, "01234-2026", "1", {"json": old_json, "context_docx": old_docx})
+            register_artifacts(registry, "01234-2026", "2", {"json": mid_json})
+            register_artifacts(registry, "01234-2026", "3", {"json": new_json})
+
+            removed = prune_artifact_runs(registry, keep_runs=1)
+
+            self.assertEqual(set(removed), {Path(old_json), Path(mid_json)})
+            # The only context DOCX is still the latest one, so it survives.
+            self.assertTrue(Path(old_docx).exists())
+            self.assertTrue(Path(new_json).exists())
+            self.assertEqual([run["stamp"] for run in registry["runs"]], ["1", "3"])
+            self.assertEqual(registry["runs"][0]["artifacts"], {"context_docx": old_docx})
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_run_history_is_stored_apart_from_the_latest_pointers(self) -> None:
+        root = self._make_case_dir()
+        try:
+            registry = load_artifact_registry(root / REGISTRY_NAME)
+            docx = self._touch(root, "tender_context_01234_2026_20260101_000000Z.docx")
+            register_artifacts(registry, "01234-2026", "20260101_000000Z", {"context_docx": docx})
+            save_artifact_registry(root / REGISTRY_NAME, registry)
+
+            pointers = json.loads((root / REGISTRY_NAME).read_text(encoding="utf-8"))
+            self.assertNotIn("runs", pointers)
+            self.assertEqual(pointers["latest"], {"01234-2026": {"context_docx": docx}})
+            runs = json.loads((root / RUNS_NAME).read_text(encoding="utf-8"))
+            self.assertEqual([run["stamp"] for run in runs], ["20260101_000000Z"])
+            self.assertEqual(load_artifact_registry(root / REGISTRY_NAME), registry)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_version_1_registry_with_inline_runs_still_loads(self) -> None:
+        root = self._make_case_dir()
+        try:
+            docx = self._touch(root, "old.docx")
+            legacy = {
+                "version": 1,
+                "latest": {"01234-2026": {"context_docx": docx}},
+                "latest_any": {"context_docx": {"tender_id": "01234-2026", "path": docx}},
+                "runs": [{"tender_id": "01234-2026", "stamp": "1", "artifacts": {"context_docx": docx}}],
+            }
+            (root / REGISTRY_NAME).write_text(json.dumps(legacy), encoding="utf-8")
+            registry = load_artifact_registry(root / REGISTRY_NAME)
+            self.assertEqual(registry["runs"], legacy["runs"])
+            self.assertEqual(find_latest_artifact(root, ("context_docx",), "01234-2026"), Path(docx))
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_pointers_are_parsed_once_per_registry_version(self) -> None:
+        root = self._make_case_dir()
+        try:
+            registry = load_artifact_registry(root / REGISTRY_NAME)
+            first = self._touch(root, "first.docx")
+            register_artifacts(registry, "01234-2026", "1", {"context_docx": first})
+            save_artifact_registry(root / REGISTRY_NAME, registry)
+
+            with mock.patch.object(artifact_registry, "_read_json", wraps=artifact_registry._read_json) as read:
+                for _ in range(3):
+                    self.assertEqual(find_latest_artifact(root, ("context_docx",), "01234-2026"), Path(first))
+                self.assertEqual(read.call_count, 1)
+
+                second = self._touch(root, "second_with_a_longer_name.docx")
+                register_artifacts(registry, "01234-2026", "2", {"context_docx": second})
+                save_artifact_registry(root / REGISTRY_NAME, registry)
+                pointers = load_latest_pointers(root / REGISTRY_NAME)
+                self.assertEqual(pointers["latest"]["01234-2026"]["context_docx"], second)
+                self.assertEqual(read.call_count, 2)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
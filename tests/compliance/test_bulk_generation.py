@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import csv
+import json
+import shutil
+import unittest
+import uuid
+import zipfile
+from pathlib import Path
+
+from app.services.bulk_generation import generate_documents_bulk, load_value_rows
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body><w:p><w:r><w:t>{{ORG_NAME}} / {{TENDER_ID}}</w:t></w:r></w:p></w:body>
+</w:document>
+"""
+
+
+class BulkGenerationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_bulk_generation"
+        self.case_dir = root / str(uuid.uuid4())
+        self.case_dir.mkdir(parents=True, exist_ok=True)
+        self.template = self.case_dir / "lot-template.docx"
+        with zipfile.ZipFile(self.template, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("word/document.xml", DOCUMENT)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.case_dir, ignore_errors=True)
+
+    def _write_rows(self, rows: list[dict[str, str]]) -> Path:
+        path = self.case_dir / "rows.csv"
+        with path.open("w", encoding="utf-8-sig", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=["ORG_NAME", "TENDER_ID"])
+            writer.writeheader()
+            writer.writerows(rows)
+        return path
+
+    def test_rows_render_into_separate_workspaces_with_summary(self) -> None:
+        rows_path = self._write_rows(
+            [
+                {"ORG_NAME": "Lot A", "TENDER_ID": "01234-2026"},
+                {"ORG_NAME": "Lot B", "TENDER_ID": "01234-2026"},
+                {"ORG_NAME": "Lot C", "TENDER_ID": ""},
+            ]
+        )
+        out_dir = self.case_dir / "out"
+
+        summary = generate_documents_bulk(self.template, load_value_rows(rows_path), out_dir, max_workers=1)
+
+        self.assertEqual((summary["generated"], summary["failed"]), (2, 1))
+        refs = [row["dossier_ref"] for row in summary["rows"]]
+        self.assertEqual(refs[:2], ["01234-2026", "01234-2026-002"])
+        self.assertIn("TENDER_ID", summary["rows"][2]["error"])
+        for row in summary["rows"][:2]:
+            self.assertTrue((Path(row["workspace_dir"]) / "manifest.json").exists())
+        with zipfile.ZipFile(summary["rows"][1]["output_path"]) as zf:
+            self.assertIn("Lot B / 01234-2026", zf.read("word/document.xml").decode("utf-8"))
+        manifest = json.loads(Path(summary["manifest_path"]).read_text(encoding="utf-8"))
+        self.assertEqual(manifest["rows_total"], 3)
+
+    def test_refs_differing_only_in_punctuation_get_separate_workspaces(self) -> None:
+        rows = [{"ORG_NAME": f"Lot {i}", "TENDER_ID": ref} for i, ref in enumerate(["A/1", "A-1", "A 1"])]
+        summary = generate_documents_bulk(self.template, rows, self.case_dir / "out", max_workers=1)
+
+        self.assertEqual(summary["generated"], 3)
+        self.assertEqual([row["dossier_ref"] for row in summary["rows"]], ["A/1", "A-1-002", "A 1-003"])
+        self.assertEqual(len({row["workspace_dir"] for row in summary["rows"]}), 3)
+
+    def test_process_pool_matches_inline_rendering(self) -> None:
+        rows = [{"ORG_NAME": f"Org {i}", "TENDER_ID": f"{i:05d}-2026"} for i in range(4)]
+        summary = generate_documents_bulk(self.template, rows, self.case_dir / "pool", max_workers=2)
+        self.assertEqual(summary["generated"], 4)
+        for row, values in zip(summary["rows"], rows):
+            with zipfile.ZipFile(row["output_path"]) as zf:
+                self.assertIn(f"{values['ORG_NAME']} / {values['TENDER_ID']}", zf.read("word/document.xml").decode())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+from app.services import pdf_page_index
+from app.services.citation_batch import CitationCache, CitationRequest, run_citation_batch
+from app.services.pdf_page_index import PdfPageIndex
+
+from .pdf_fixtures import write_pdf
+
+
+@unittest.skipIf(pdf_page_index.PdfReader is None, "pypdf is not installed")
+class CitationBatchTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_citation_batch"
+        self.root = root / str(uuid.uuid4())
+        manuals = self.root / "Упатства"
+        manuals.mkdir(parents=True)
+        write_pdf(manuals / "esjn.pdf", ["Login with username and password", "Upload each document", "Submit the notice"])
+        write_pdf(manuals / "epazar.pdf", ["Catalog workflow", "Required field error"])
+        (manuals / "broken.pdf").write_bytes(b"not a pdf")
+        self.index = PdfPageIndex(self.root, self.root / "index.json")
+        self.cache_path = self.root / "citations.json"
+        self.requests = [
+            CitationRequest("esjn-login", "Упатства/esjn.pdf", ("login", "password")),
+            CitationRequest("esjn-upload", "Упатства\\esjn.pdf", ("upload", "document", "notice")),
+            CitationRequest("epazar-error", "Упатства/epazar.pdf", ("error", "field", "missing")),
+            CitationRequest("broken", "Упатства/broken.pdf", ("login",)),
+        ]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_batch_matches_single_document_lookups(self) -> None:
+        results = run_citation_batch(self.index, self.requests, cache=CitationCache(self.cache_path), workers=2)
+
+        self.assertEqual(results["esjn-login"].pages, [1])
+        self.assertEqual(results["esjn-upload"].pages, [2, 3])
+        self.assertEqual(results["epazar-error"].keywords, ["error", "field"])
+        for request in self.requests[:3]:
+            self.assertEqual(results[request.key], self.index.match_keywords(request.document, list(request.keywords)))
+        self.assertIsInstance(results["broken"], Exception)
+
+    def test_cached_results_skip_matching_until_the_pdf_changes(self) -> None:
+        first = run_citation_batch(self.index, self.requests[:3], cache=CitationCache(self.cache_path))
+
+        reloaded = PdfPageIndex(self.root, self.root / "index.json")
+        with mock.patch.object(PdfPageIndex, "match_keyword_sets", side_effect=AssertionError("recomputed")):
+            self.assertEqual(run_citation_batch(reloaded, self.requests[:3], cache=CitationCache(self.cache_path)), first)
+
+        write_pdf(self.root / "Упатства" / "epazar.pdf", ["Error page", "Required field"])
+        results = run_citation_batch(reloaded, self.requests[:3], cache=CitationCache(self.cache_path))
+        self.assertEqual(results["epazar-error"].pages, [1, 2])
+        self.assertEqual(results["esjn-login"], first["esjn-login"])
+
+
+if __name__ == "__main__":
+    unittest.main()
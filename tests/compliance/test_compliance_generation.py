@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import csv
+import importlib.util
+import json
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+MATRIX_FIELDS = [
+    "requirement_id",
+    "source_file",
+    "source_section",
+    "source_date",
+    "app_module",
+    "requirement_text",
+    "test_case_id",
+]
+
+
+def _load_generator():
+    spec = importlib.util.spec_from_file_location(
+        "generate_compliance_artifacts", REPO_ROOT / "compliance" / "generate_compliance_artifacts.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _matrix_row(number: int, module: str, section: str) -> dict[str, str]:
+    return {
+        "requirement_id": f"REQ-ESJN-2021-00{number}",
+        "source_file": "Упатства/esjn.pdf",
+        "source_section": section,
+        "source_date": "2021-01-08",
+        "app_module": module,
+        "requirement_text": f"Requirement {number}",
+        "test_case_id": f"TC-REQ-00{number}",
+    }
+
+
+class ComplianceGenerationTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = REPO_ROOT / "downloads" / "test_compliance_generation"
+        self.root = root / str(uuid.uuid4())
+        compliance = self.root / "compliance"
+        (compliance / "review").mkdir(parents=True)
+        (compliance / "rule_schema.json").write_text("{}", encoding="utf-8")
+        self.gen = _load_generator()
+        paths = {
+            "ROOT": self.root,
+            "RULES_DIR": compliance / "rules",
+            "TESTS_DIR": self.root / "tests" / "compliance",
+            "MATRIX_PATH": compliance / "matrix.csv",
+            "RULE_SCHEMA_PATH": compliance / "rule_schema.json",
+            "SME_REVIEW_PATH": compliance / "review" / "sme_review_checklist.csv",
+            "LEGAL_REVIEW_PATH": compliance / "review" / "legal_review_checklist.csv",
+            "TRACEABILITY_PATH": compliance / "traceability_index.csv",
+            "BACKLOG_PATH": compliance / "IMPLEMENTATION_BACKLOG.md",
+            "CHANGE_MANIFEST_PATH": compliance / "rule_changes.json",
+        }
+        for name, value in paths.items():
+            patcher = mock.patch.object(self.gen, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.rows = [_matrix_row(n, "download", f"Draft citation: pages {n}") for n in (2, 4, 5)]
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _run(self, rows: list[dict[str, str]]) -> dict:
+        with self.gen.MATRIX_PATH.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=MATRIX_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        with mock.patch("builtins.print"):
+            self.gen.main()
+        return json.loads(self.gen.CHANGE_MANIFEST_PATH.read_text(encoding="utf-8"))
+
+    def _rule(self, name: str) -> dict:
+        return json.loads((self.gen.RULES_DIR / name).read_text(encoding="utf-8-sig"))
+
+    def test_unchanged_rows_write_nothing(self) -> None:
+        first = self._run(self.rows)
+        self.assertEqual(first["sequence"], 1)
+        self.assertEqual(len(first["rules"]["added"]), 3)
+
+        second = self._run(self.rows)
+        self.assertEqual(second["sequence"], 1)
+        self.assertEqual(second["rules"], first["rules"])
+        self.assertEqual(second["artifacts_written"], [])
+
+    def test_changed_row_updates_only_its_draft_rule(self) -> None:
+        self._run(self.rows)
+        self.rows[1]["source_section"] = "Draft citation: pages 40"
+        manifest = self._run(self.rows)
+        self.assertEqual(manifest["sequence"], 2)
+        self.assertEqual(manifest["rules"], {"added": [], "updated": ["req-esjn-2021-004.json"]})
+        self.assertEqual(self._rule("req-esjn-2021-004.json")["source_page"], 40)
+
+    def test_approved_rules_and_review_decisions_are_kept(self) -> None:
+        self._run(self.rows)
+        approved = {**self._rule("req-esjn-2021-002.json"), "approval_state": "approved", "approved_by": "SME"}
+        (self.gen.RULES_DIR / "req-esjn-2021-002.json").write_text(json.dumps(approved), encoding="utf-8-sig")
+        sme_path = self.gen.SME_REVIEW_PATH
+        text = sme_path.read_text(encoding="utf-8").replace(
+            "Draft citation: pages 2,,,", "Draft citation: pages 2,approved,ok,2026-02-20"
+        )
+        sme_path.write_text(text, encoding="utf-8")
+
+        self.rows[0]["requirement_text"] = "Changed after approval"
+        manifest = self._run(self.rows)
+        self.assertEqual(self._rule("req-esjn-2021-002.json"), approved)
+        self.assertEqual(manifest["held_for_review"], ["req-esjn-2021-002.json"])
+        self.assertEqual(manifest["sequence"], 1)
+        # Still held on the next run until someone reconciles the rule.
+        self.assertEqual(self._run(self.rows)["held_for_review"], ["req-esjn-2021-002.json"])
+
+        with sme_path.open("r", encoding="utf-8-sig", newline="") as handle:
+            decisions = {row["requirement_id"]: row["reviewer_decision"] for row in csv.DictReader(handle)}
+        self.assertEqual(decisions["REQ-ESJN-2021-002"], "approved")
+        with self.gen.TRACEABILITY_PATH.open("r", encoding="utf-8-sig", newline="") as handle:
+            states = {row["requirement_id"]: row["approval_state"] for row in csv.DictReader(handle)}
+        self.assertEqual(states["REQ-ESJN-2021-002"], "approved")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+
+from app.services.document_library import DocumentLibrary
+
+
+class DocumentLibraryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_document_library"
+        self.root = root / str(uuid.uuid4())
+        manuals = self.root / "Упатства"
+        models = self.root / "модели на тендерска документација" / "модел на договор"
+        manuals.mkdir(parents=True)
+        models.mkdir(parents=True)
+        (manuals / "Priracnik-ESJN-nov2021.pdf").write_bytes(b"%PDF-1.4 /CreationDate (D:20210108120000)")
+        (manuals / "Upatstvo-digitalno-potpisuvanje-2026.pdf").write_bytes(b"%PDF-1.4 /CreationDate (D:20260213)")
+        (models / "Model-na-dogovor-2023.docx").write_bytes(b"PK")
+        (models / "notes.txt").write_text("ignored", encoding="utf-8")
+        review = self.root / "review"
+        review.mkdir()
+        (review / "index.csv").write_text(
+            '"current_path","canonical_name","document_type","year_tag","status"\n'
+            '"модели на тендерска документација\\модел на договор\\Model-na-dogovor-2023.docx",'
+            '"Model na dogovor 2023","docx","2023","active"\n',
+            encoding="utf-8-sig",
+        )
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_index_builds_queries_and_persists(self) -> None:
+        library = DocumentLibrary(self.root)
+        self.assertEqual(library.refresh()["added"], 3)
+
+        outdated = library.query(freshness_status="Likely Outdated")
+        self.assertEqual([e.relative_path for e in outdated], ["Упатства/Priracnik-ESJN-nov2021.pdf"])
+        self.assertEqual(outdated[0].embedded_creation_date, "2021-01-08")
+        self.assertEqual(outdated[0].tags, "esjn")
+
+        model = library.query(category="tender_model")[0]
+        self.assertEqual((model.display_name, model.subcategory, model.year_tag), ("Model na dogovor 2023", "модел на договор", "2023"))
+        self.assertEqual(model.freshness_status, "Review")
+        self.assertEqual([e.doc_type for e in library.query(text="potpisuvanje")], ["pdf"])
+        self.assertEqual(library.facets()["category"], ["manual", "tender_model"])
+
+        reloaded = DocumentLibrary(self.root)
+        self.assertEqual(len(reloaded.entries), 3)
+        self.assertEqual(reloaded.refresh()["unchanged"], 3)
+
+    def test_refresh_only_rereads_changed_files(self) -> None:
+        library = DocumentLibrary(self.root)
+        library.refresh()
+        changed = self.root / "Упатства" / "Upatstvo-digitalno-potpisuvanje-2026.pdf"
+        changed.write_bytes(b"%PDF-1.4 /CreationDate (D:20260301) /ModDate (D:20260302)")
+        stat_result = changed.stat()
+        os.utime(changed, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+        (self.root / "Упатства" / "Priracnik-ESJN-nov2021.pdf").unlink()
+
+        stats = library.refresh()
+        self.assertEqual((stats["updated"], stats["removed"], stats["unchanged"]), (1, 1, 1))
+        entry = library.entries["Упатства/Upatstvo-digitalno-potpisuvanje-2026.pdf"]
+        self.assertEqual(entry.embedded_mod_date, "2026-03-02")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+import shutil
+import unittest
+import uuid
+import zipfile
+from pathlib import Path
+
+from app.services.docx_text import clear_docx_text_cache, load_docx_text
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+DOCUMENT = (
+    f'<w:document xmlns:w="{W}" xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"><w:body>'
+    "<w:p><w:r><w:t>Тендер </w:t></w:r><w:r><w:t>бр. 12</w:t></w:r></w:p>"
+    "<w:p><w:r><w:t>  </w:t></w:r></w:p>"
+    "<w:p><w:r><a:t>drawing</a:t></w:r></w:p>"
+    "</w:body></w:document>"
+)
+HEADER = f'<w:hdr xmlns:w="{W}"><w:p><w:r><w:t>Заглавие</w:t></w:r></w:p></w:hdr>'
+
+
+class DocxTextTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_docx_text_cache()
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_docx_text"
+        self.case_dir = root / str(uuid.uuid4())
+        self.case_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.case_dir / "model.docx"
+        with zipfile.ZipFile(self.path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("word/document.xml", DOCUMENT)
+            zf.writestr("word/header1.xml", HEADER)
+            zf.writestr("word/styles.xml", f'<w:styles xmlns:w="{W}"><w:t>ignored</w:t></w:styles>')
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.case_dir, ignore_errors=True)
+
+    def test_views_share_one_parse(self) -> None:
+        text = load_docx_text(self.path)
+        self.assertEqual(text.paragraphs(), ["Тендер бр. 12", "  ", "", "Заглавие"])
+        self.assertEqual(text.flat_text(), "Тендер бр. 12 drawing\n\nЗаглавие")
+        self.assertEqual(text.flat_text(" "), "Тендер бр. 12 drawing Заглавие")
+        first, second = text.runs()[:2]
+        self.assertEqual((first.part, first.paragraph, first.start, first.end), ("word/document.xml", 0, 0, 7))
+        self.assertEqual(text.paragraphs()[0][second.start : second.end], second.text)
+
+    def test_cache_is_reused_until_the_file_changes(self) -> None:
+        first = load_docx_text(self.path)
+        self.assertIs(load_docx_text(self.path), first)
+
+        with zipfile.ZipFile(self.path, "w") as zf:
+            zf.writestr("word/document.xml", f'<w:document xmlns:w="{W}"><w:p><w:r><w:t>ново</w:t></w:r></w:p></w:document>')
+        stat_result = self.path.stat()
+        os.utime(self.path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+        self.assertEqual(load_docx_text(self.path).paragraphs(), ["ново"])
+
+
+if __name__ == "__main__":
+    unittest.main()
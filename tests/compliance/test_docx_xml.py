@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import unittest
+import xml.etree.ElementTree as ET
+from typing import Any, ContextManager, Iterator
+from unittest import mock
+
+from app.services import docx_text, docx_xml
+
+DOCUMENT = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    f'<w:document xmlns:w="{docx_xml.W_NS}" '
+    'xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main"><w:body>'
+    "<w:p><w:r><w:t>Прв </w:t></w:r><w:r><w:t/></w:r><w:r><w:t>пасус</w:t></w:r></w:p>"
+    "<w:p><w:r><w:txbxContent><w:p><w:r><w:t>во рамка</w:t></w:r></w:p></w:txbxContent></w:r>"
+    "<w:r><w:t>по рамка</w:t></w:r></w:p>"
+    "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>ќелија</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+    "<a:p><a:r><a:t>drawing</a:t></a:r></a:p>"
+    "</w:body></w:document>"
+).encode("utf-8")
+
+
+class DocxXmlTests(unittest.TestCase):
+    def expected(self) -> list[str]:
+        return [node.text or "" for node in ET.fromstring(DOCUMENT).findall(".//{*}t")]
+
+    def _backends(self) -> Iterator[tuple[str, ContextManager[Any]]]:
+        if docx_xml._lxml_etree is not None:
+            yield "lxml", contextlib.nullcontext()
+        yield "etree", mock.patch.object(docx_xml, "_lxml_etree", None)
+
+    def test_text_runs_match_findall_without_building_the_tree(self) -> None:
+        for name, patch in self._backends():
+            with self.subTest(backend=name), patch:
+                with mock.patch.object(docx_xml, "fromstring", side_effect=AssertionError("tree built")):
+                    self.assertEqual(list(docx_xml.iter_text_runs(DOCUMENT)), self.expected())
+                    self.assertEqual(
+                        list(docx_xml.iter_text_runs(io.BytesIO(DOCUMENT), tag=f"{{{docx_xml.W_NS}}}t")),
+                        ["Прв ", "", "пасус", "во рамка", "по рамка", "ќелија"],
+                    )
+
+    def test_streamed_paragraphs_match_the_parsed_tree(self) -> None:
+        root = ET.fromstring(DOCUMENT)
+        expected = ["".join(n.text or "" for n in nodes) for _, nodes in docx_text.iter_paragraph_nodes(root)]
+        for name, patch in self._backends():
+            with self.subTest(backend=name), patch:
+                part = docx_text._read_part("word/document.xml", io.BytesIO(DOCUMENT))
+                self.assertEqual(list(part.paragraphs), expected)
+                self.assertEqual(list(part.text_runs), self.expected())
+                self.assertEqual(
+                    [(run.paragraph, run.start, run.end) for run in part.runs if run.text == "по рамка"], [(1, 8, 16)]
+                )
+
+    def test_round_trip_keeps_text_and_namespace(self) -> None:
+        root = docx_xml.fromstring(DOCUMENT)
+        node = docx_xml.sub_element(root.find(f"{{{docx_xml.W_NS}}}body"), f"{{{docx_xml.W_NS}}}p")
+        node.set(docx_xml.XML_SPACE, "preserve")
+        data = docx_xml.tostring(root)
+        self.assertTrue(data.startswith(b"<?xml"))
+        reparsed = ET.fromstring(data)
+        self.assertEqual(reparsed.tag, f"{{{docx_xml.W_NS}}}document")
+        self.assertEqual([n.text or "" for n in reparsed.findall(".//{*}t")], self.expected())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import shutil
+import sys
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+from app.services.extraction_manifest import file_sha256
+
+from .pdf_fixtures import write_pdf
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+TEMPLATE_PATH = REPO_ROOT / "task_force" / "templates" / "context_template_v2.docx"
+
+
+def _load_extractor():
+    spec = importlib.util.spec_from_file_location(
+        "extract_tender_context", REPO_ROOT / "task_force" / "scripts" / "extract_tender_context.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses resolve their module through sys.modules.
+    sys.modules.setdefault(spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+etc = _load_extractor()
+
+
+class ExtractTenderContextTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = REPO_ROOT / "downloads" / "test_extract_tender_context"
+        self.root = root / str(uuid.uuid4())
+        self.input_dir = self.root / "input"
+        self.out_dir = self.root / "out"
+        self.input_dir.mkdir(parents=True)
+        self.cache_dir = self.out_dir / etc.PARSE_CACHE_DIRNAME
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _run(self, *extra: str) -> list[str]:
+        argv = [
+            "extract_tender_context.py",
+            "--input-dir",
+            str(self.input_dir),
+            "--out-dir",
+            str(self.out_dir),
+            "--context-template",
+            str(TEMPLATE_PATH),
+            "--trace-file",
+            "",
+            *extra,
+        ]
+        with mock.patch.object(sys, "argv", argv), mock.patch("builtins.print") as printed:
+            self.assertEqual(etc.main(), 0)
+        return [" ".join(str(arg) for arg in call.args) for call in printed.call_args_list]
+
+    def test_failed_parses_are_not_cached_and_stale_entries_are_pruned(self) -> None:
+        docx = self.input_dir / "12345-2025 тендерска документација.docx"
+        shutil.copyfile(TEMPLATE_PATH, docx)
+        broken = self.input_dir / "12345-2025 прилог.pdf"
+        broken.write_bytes(b"not a pdf")
+
+        self._run("--incremental")
+        docx_sha = file_sha256(docx)
+        broken_sha = file_sha256(broken)
+        self.assertTrue((self.cache_dir / f"{docx_sha}.json").exists())
+        self.assertEqual(list(self.cache_dir.glob(f"{broken_sha}*")), [])
+
+        lines = self._run("--incremental")
+        self.assertIn("INCREMENTAL: reused_parses=1 parsed=1", lines)
+
+        docx.unlink()
+        lines = self._run("--incremental")
+        self.assertFalse((self.cache_dir / f"{docx_sha}.json").exists())
+        self.assertIn("PRUNED: 1 stale parse cache file(s)", lines)
+
+    @unittest.skipIf(etc.PdfReader is None, "pypdf is not installed")
+    def test_scanned_pdfs_are_cached_but_runs_without_pypdf_are_not(self) -> None:
+        scanned = self.input_dir / "12345-2025 скениран прилог.pdf"
+        write_pdf(scanned, ["", ""])
+        sha = file_sha256(scanned)
+
+        with mock.patch.object(etc, "PdfReader", None):
+            self._run("--incremental")
+        self.assertEqual(list(self.cache_dir.glob(f"{sha}*")), [])
+
+        self.assertIn("INCREMENTAL: reused_parses=0 parsed=1", self._run("--incremental"))
+        self.assertTrue((self.cache_dir / f"{sha}.json").exists())
+        self.assertIn("INCREMENTAL: reused_parses=1 parsed=0", self._run("--incremental"))
+
+    def test_hits_carry_the_page_they_were_found_on(self) -> None:
+        pages = ["Вовед без клучни зборови.", "Прв пасус.\n\nУслови за учество.", "Гаранција на понудата."]
+        hits = list(etc.find_hits_in_pages(iter(pages)))
+        self.assertEqual([(hit["keyword"], hit["page"]) for hit in hits], [("услов", 2), ("гаранција", 3)])
+        self.assertEqual(hits[0]["snippet"], "Услови за учество.")
+
+    @unittest.skipIf(etc.PdfReader is None, "pypdf is not installed")
+    def test_pdf_pages_are_yielded_in_order_up_to_the_cap(self) -> None:
+        pdf = self.input_dir / "annex.pdf"
+        write_pdf(pdf, ["first page", "second page", "third page"])
+        self.assertEqual(list(etc.iter_pdf_pages(pdf)), ["first page", "second page", "third page"])
+        self.assertEqual(list(etc.iter_pdf_pages(pdf, max_pages=2)), ["first page", "second page"])
+
+    def test_page_cache_writer_publishes_only_committed_pages(self) -> None:
+        with self.assertRaises(KeyboardInterrupt):
+            with etc.page_cache_writer(self.cache_dir, "a" * 64) as page_cache:
+                page_cache.write("first page")
+                raise KeyboardInterrupt
+        with etc.page_cache_writer(self.cache_dir, "b" * 64) as page_cache:
+            page_cache.write("first page")
+        self.assertEqual(list(self.cache_dir.iterdir()), [])
+
+        with etc.page_cache_writer(self.cache_dir, "c" * 64) as page_cache:
+            page_cache.write("first page")
+            page_cache.commit()
+        self.assertEqual([path.name for path in self.cache_dir.iterdir()], ["c" * 64 + ".pages.jsonl"])
+        self.assertEqual(list(etc.iter_cached_pages(self.cache_dir, "c" * 64)), ["first page"])
+
+    @unittest.skipIf(etc.PdfReader is None, "pypdf is not installed")
+    def test_page_cache_is_published_only_after_the_last_page(self) -> None:
+        pdf = self.input_dir / "12345-2025 прилог.pdf"
+        write_pdf(pdf, ["first page", "second page"])
+        sha = file_sha256(pdf)
+
+        def failing_pages(path, max_pages=0):
+            yield "first page"
+            raise ValueError("broken page stream")
+
+        with mock.patch.object(etc, "iter_pdf_pages", failing_pages):
+            self._run("--incremental")
+        self.assertEqual(list(self.cache_dir.glob(f"{sha}*")), [])
+
+        self._run("--incremental")
+        cached = etc._page_cache_path(self.cache_dir, sha)
+        self.assertEqual(list(etc.iter_cached_pages(self.cache_dir, sha)), ["first page", "second page"])
+        self.assertEqual(sorted(path.name for path in self.cache_dir.glob(f"{sha}*")), [f"{sha}.json", cached.name])
+
+    def test_target_sections_are_cut_from_a_page_stream_with_bounded_blocks(self) -> None:
+        pages = [
+            "Содржина\n1.3 Предмет на набавка ........ 2\n4.2 Услови ........ 7",
+            "1.3 Предмет на набавка\nНабавка на канцелариски материјал.",
+            "4.2 Услови\n" + "\n".join(f"Ред {i} " + "x" * 80 for i in range(200)),
+            "7 Друго\nНе е целен дел.",
+        ]
+        sections = etc.extract_target_sections(iter(pages))
+        self.assertEqual(sections, etc.extract_target_sections("\n\n".join(pages)))
+        self.assertEqual(list(sections), ["1.3", "4.2"])
+        self.assertEqual(sections["1.3"]["text"], "Набавка на канцелариски материјал.")
+        self.assertEqual(len(sections["4.2"]["text"]), etc.SECTION_TEXT_CHARS)
+        self.assertNotIn("Не е целен дел.", sections["4.2"]["text"])
+
+    def test_main_document_is_streamed_from_the_page_cache(self) -> None:
+        sha = "d" * 64
+        pages = ["1.3 Предмет\nПрв пасус.", "Втор пасус " + "y" * 400, "4.2 Услови\nДокази."]
+        with etc.page_cache_writer(self.cache_dir, sha) as page_cache:
+            for page in pages:
+                page_cache.write(page)
+            page_cache.commit()
+        item = etc.ParsedFile(
+            path=self.input_dir / "12345-2025 тендерска документација.pdf",
+            kind="pdf",
+            text=pages[0],
+            pages=[],
+            tender_id="12345-2025",
+            hit_count=0,
+            hits=[],
+            upload_hints=[],
+            text_complete=False,
+        )
+        with mock.patch.object(etc, "FULL_TEXT_HEAD_CHARS", 100):
+            sections, head = etc.read_main_document(item, self.cache_dir, sha)
+        self.assertEqual(list(sections), ["1.3", "4.2"])
+        self.assertIn("Втор пасус", sections["1.3"]["text"])
+        self.assertEqual(sections["4.2"]["text"], "Докази.")
+        self.assertEqual(len(head), 100)
+        self.assertFalse(item.text_complete)
+
+    def test_parse_formats_orders_known_kinds_and_rejects_unknown_ones(self) -> None:
+        self.assertEqual(etc.parse_formats("md, json"), ["json", "md"])
+        self.assertEqual(etc.parse_formats("all"), list(etc.OUTPUT_FORMATS))
+        self.assertEqual(etc.parse_formats(""), list(etc.OUTPUT_FORMATS))
+        with self.assertRaises(argparse.ArgumentTypeError) as ctx:
+            etc.parse_formats("json,pdf")
+        self.assertIn("pdf", str(ctx.exception))
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            self._run("--formats", "pdf")
+
+    def test_failed_writer_leaves_no_temp_file_and_keeps_the_previous_output(self) -> None:
+        self.out_dir.mkdir(parents=True)
+        previous = self.out_dir / "context.md"
+        previous.write_text("previous", encoding="utf-8")
+
+        def broken(tmp_path: Path) -> None:
+            tmp_path.write_text("half", encoding="utf-8")
+            raise OSError("disk full")
+
+        def write_json(tmp_path: Path) -> None:
+            tmp_path.write_text("{}", encoding="utf-8")
+
+        with self.assertRaises(OSError):
+            etc.run_output_stage({"md": (broken, previous), "json": (write_json, self.out_dir / "context.json")})
+        self.assertEqual(previous.read_text(encoding="utf-8"), "previous")
+        self.assertEqual([path for path in self.out_dir.iterdir() if path.name.endswith(".tmp")], [])
+
+    def test_partial_formats_run_leaves_other_outputs_untouched(self) -> None:
+        shutil.copyfile(TEMPLATE_PATH, self.input_dir / "12345-2025 тендерска документација.docx")
+        self._run("--incremental", "--formats", "json")
+        first = {path.name: path.read_bytes() for path in self.out_dir.glob("tender_context_12345_2025_*")}
+        self.assertEqual([name.rsplit(".", 1)[1] for name in first], ["json"])
+
+        self._run("--incremental", "--formats", "md")
+        outputs = {path.name: path for path in self.out_dir.glob("tender_context_12345_2025_*")}
+        self.assertEqual(sorted(name.rsplit(".", 1)[1] for name in outputs), ["json", "md"])
+        for name, data in first.items():
+            self.assertEqual(outputs[name].read_bytes(), data)
+        manifest = json.loads((self.out_dir / etc.MANIFEST_NAME).read_text(encoding="utf-8"))
+        self.assertEqual(sorted(manifest["groups"]["12345-2025"]["outputs"]), ["json", "md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+
+from app.services.extraction_manifest import (
+    current_group_outputs,
+    forget_missing_files,
+    group_inputs_signature,
+    load_extraction_manifest,
+    missing_group_outputs,
+    record_file,
+    resolve_file_hash,
+    save_extraction_manifest,
+)
+
+
+class ExtractionManifestTests(unittest.TestCase):
+    def _make_case_dir(self) -> Path:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_extraction_manifest"
+        case_dir = root / str(uuid.uuid4())
+        case_dir.mkdir(parents=True, exist_ok=True)
+        return case_dir
+
+    def test_unchanged_file_is_not_reported_as_changed(self) -> None:
+        root = self._make_case_dir()
+        try:
+            doc = root / "tender.docx"
+            doc.write_bytes(b"tender")
+            manifest_path = root / "extraction_manifest.json"
+            manifest = load_extraction_manifest(manifest_path)
+
+            sha, changed = resolve_file_hash(manifest, doc, doc.stat())
+            self.assertTrue(changed)
+            record_file(manifest, doc, doc.stat(), sha, "01234-2026", "ok")
+            save_extraction_manifest(manifest_path, manifest)
+
+            reloaded = load_extraction_manifest(manifest_path)
+            sha_again, changed_again = resolve_file_hash(reloaded, doc, doc.stat())
+            self.assertEqual(sha, sha_again)
+            self.assertFalse(changed_again)
+            self.assertEqual(reloaded["files"][str(doc)]["tender_id"], "01234-2026")
+
+            doc.write_bytes(b"tender v2")
+            _, changed_content = resolve_file_hash(reloaded, doc, doc.stat())
+            self.assertTrue(changed_content)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_current_group_outputs_requires_same_signature_and_existing_outputs(self) -> None:
+        root = self._make_case_dir()
+        try:
+            output = root / "tender_context.json"
+            output.write_text("{}", encoding="utf-8")
+            signature = group_inputs_signature([("b.pdf", "2"), ("a.docx", "1")])
+            self.assertEqual(signature, group_inputs_signature([("a.docx", "1"), ("b.pdf", "2")]))
+
+            manifest = load_extraction_manifest(root / "missing.json")
+            manifest["groups"]["01234-2026"] = {"inputs_signature": signature, "outputs": {"json": str(output)}}
+            self.assertEqual(current_group_outputs(manifest, "01234-2026", signature), {"json": str(output)})
+            self.assertEqual(current_group_outputs(manifest, "01234-2026", "other"), {})
+
+            output.unlink()
+            self.assertEqual(current_group_outputs(manifest, "01234-2026", signature), {})
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_missing_group_outputs_lists_only_absent_formats_for_same_inputs(self) -> None:
+        root = self._make_case_dir()
+        try:
+            context_docx = root / "tender_context.docx"
+            context_docx.write_bytes(b"docx")
+            manifest = load_extraction_manifest(root / "missing.json")
+            manifest["groups"]["01234-2026"] = {
+                "inputs_signature": "sig",
+                "outputs": {"context_docx": str(context_docx)},
+            }
+            formats = ["json", "context_docx", "xlsx"]
+            self.assertEqual(missing_group_outputs(manifest, "01234-2026", "sig", formats), ["json", "xlsx"])
+            self.assertEqual(missing_group_outputs(manifest, "01234-2026", "sig", ["context_docx"]), [])
+            self.assertEqual(missing_group_outputs(manifest, "01234-2026", "changed", formats), formats)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_forget_missing_files_drops_deleted_inputs(self) -> None:
+        root = self._make_case_dir()
+        try:
+            kept = root / "kept.pdf"
+            kept.write_bytes(b"pdf")
+            manifest = load_extraction_manifest(root / "missing.json")
+            record_file(manifest, kept, kept.stat(), "a" * 64, None, "ok")
+            manifest["files"][str(root / "gone.pdf")] = {"sha256": "b" * 64}
+            self.assertEqual(forget_missing_files(manifest), [str(root / "gone.pdf")])
+            self.assertEqual(list(manifest["files"]), [str(kept)])
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
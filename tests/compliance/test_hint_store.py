@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import csv
+import shutil
+import sqlite3
+import unittest
+import uuid
+from pathlib import Path
+
+from app.services.hint_store import HintStore
+
+FIELDS = ["file", "tag", "term", "source_page", "snippet"]
+
+
+def _write_hints(path: Path, rows: list[dict[str, str]]) -> None:
+    with path.open("w", encoding="utf-8-sig", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def _row(file: str, tag: str, page: str, snippet: str) -> dict[str, str]:
+    return {"file": file, "tag": tag, "term": tag, "source_page": page, "snippet": snippet}
+
+
+class HintStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_hint_store"
+        self.case_dir = root / str(uuid.uuid4())
+        self.case_dir.mkdir(parents=True, exist_ok=True)
+        self.store = HintStore(self.case_dir / "upload_hints.sqlite3")
+        self.calls: list[dict[str, str]] = []
+
+    def tearDown(self) -> None:
+        self.store.close()
+        shutil.rmtree(self.case_dir, ignore_errors=True)
+
+    def classifier(self, row: dict[str, str]) -> str | None:
+        self.calls.append(row)
+        return {"license": "REQ-LIC", "certificate": "REQ-CERT"}.get(row["tag"])
+
+    def test_summary_aggregates_classified_rows(self) -> None:
+        first = self.case_dir / "upload_hints_a.csv"
+        _write_hints(first, [_row("a.pdf", "license", "3", "лиценца"), _row("a.pdf", "other", "4", "x")])
+        second = self.case_dir / "upload_hints_b.csv"
+        _write_hints(second, [_row(" b.pdf ", "license", "", "лиценца"), _row("b.pdf", "certificate", "7", "ISO")])
+
+        self.assertEqual(self.store.sync_csv_files([first, second])["ingested"], 2)
+        self.assertEqual(self.store.classify(self.classifier, "v1"), 4)
+        # The repeated (tag, snippet) pair is classified once.
+        self.assertEqual(len(self.calls), 3)
+
+        summary = self.store.requirement_summary()
+        self.assertEqual(sorted(summary), ["REQ-CERT", "REQ-LIC"])
+        lic = summary["REQ-LIC"]
+        self.assertEqual(lic.hits, 2)
+        self.assertEqual(lic.files, {"a.pdf", "b.pdf"})
+        self.assertEqual(lic.pages, {"3"})
+        self.assertEqual(lic.csv_names, {"upload_hints_a.csv", "upload_hints_b.csv"})
+        self.assertEqual(lic.snippets, {"лиценца"})
+
+    def test_only_new_rows_are_classified(self) -> None:
+        first = self.case_dir / "upload_hints_a.csv"
+        _write_hints(first, [_row("a.pdf", "license", "3", "лиценца")])
+        self.store.sync_csv_files([first])
+        self.store.classify(self.classifier, "v1")
+
+        second = self.case_dir / "upload_hints_b.csv"
+        rows = [_row("b.pdf", "certificate", "1", "ISO 27001")]
+        _write_hints(second, rows)
+        self.store.record_csv(second, rows)
+        self.assertEqual(self.store.sync_csv_files([first, second]), {"ingested": 0, "unchanged": 2, "removed": 0})
+        self.assertEqual(self.store.classify(self.classifier, "v1"), 1)
+        self.assertEqual(self.store.classify(self.classifier, "v1"), 0)
+        # A new classifier version re-runs over everything.
+        self.assertEqual(self.store.classify(self.classifier, "v2"), 2)
+
+    def test_changed_and_deleted_csvs_are_resynced(self) -> None:
+        first = self.case_dir / "upload_hints_a.csv"
+        second = self.case_dir / "upload_hints_b.csv"
+        _write_hints(first, [_row("a.pdf", "license", "3", "лиценца")])
+        _write_hints(second, [_row("b.pdf", "license", "5", "лиценца")])
+        self.store.sync_csv_files([first, second])
+
+        _write_hints(first, [_row("a.pdf", "certificate", "9", "ISO"), _row("a.pdf", "certificate", "10", "ISO 2")])
+        second.unlink()
+        self.assertEqual(self.store.sync_csv_files([first]), {"ingested": 1, "unchanged": 0, "removed": 1})
+        self.store.classify(self.classifier, "v1")
+        summary = self.store.requirement_summary()
+        self.assertEqual(sorted(summary), ["REQ-CERT"])
+        self.assertEqual(summary["REQ-CERT"].pages, {"9", "10"})
+
+        # The deleted CSV's rows are tombstoned, not dropped, and count again once it is back.
+        with sqlite3.connect(self.store.path) as conn:
+            kept = conn.execute("SELECT COUNT(*) FROM hints WHERE csv_name = ?", (second.name,)).fetchone()[0]
+        self.assertEqual(kept, 1)
+        self.assertEqual(self.store.sync_csv_files([first]), {"ingested": 0, "unchanged": 1, "removed": 0})
+        _write_hints(second, [_row("b.pdf", "license", "5", "лиценца")])
+        self.assertEqual(self.store.sync_csv_files([first, second]), {"ingested": 1, "unchanged": 1, "removed": 0})
+        self.store.classify(self.classifier, "v1")
+        self.assertEqual(sorted(self.store.requirement_summary()), ["REQ-CERT", "REQ-LIC"])
+
+    def test_stores_without_tombstones_are_upgraded(self) -> None:
+        self.store.close()
+        path = self.case_dir / "old.sqlite3"
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "CREATE TABLE hint_sources (csv_name TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                "mtime_ns INTEGER NOT NULL, row_count INTEGER NOT NULL)"
+            )
+            conn.execute("INSERT INTO hint_sources VALUES ('upload_hints_old.csv', 1, 1, 0)")
+        self.store = HintStore(path)
+        self.assertEqual(self.store.sync_csv_files([]), {"ingested": 0, "unchanged": 0, "removed": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
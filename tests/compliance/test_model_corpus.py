@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import shutil
+import unittest
+import uuid
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from app.services import model_corpus
+from app.services.docx_text import clear_docx_text_cache
+from app.services.model_corpus import ModelCorpus
+
+W = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _write_docx(path: Path, *paragraphs: str) -> None:
+    body = "".join(f"<w:p><w:r><w:t>{text}</w:t></w:r></w:p>" for text in paragraphs)
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("word/document.xml", f'<w:document xmlns:w="{W}"><w:body>{body}</w:body></w:document>')
+
+
+def _bump_mtime(path: Path) -> None:
+    stat_result = path.stat()
+    os.utime(path, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+
+class ModelCorpusTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_docx_text_cache()
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_model_corpus"
+        self.case_dir = root / str(uuid.uuid4())
+        self.models = self.case_dir / "models"
+        self.models.mkdir(parents=True, exist_ok=True)
+        self.cache_path = self.case_dir / "out" / ".model_corpus.json"
+        self.guarantee = self.models / "guarantee.docx"
+        self.offer = self.models / "offer.docx"
+        _write_docx(self.guarantee, "Изјава за СЕРИОЗНОСТ", "на   понудата")
+        _write_docx(self.offer, "Техничка понуда")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.case_dir, ignore_errors=True)
+
+    def _corpus(self) -> ModelCorpus:
+        return ModelCorpus(self.case_dir, self.cache_path)
+
+    def test_lookups_match_substring_checks(self) -> None:
+        corpus = self._corpus()
+        stats = corpus.refresh([self.guarantee, self.offer])
+        self.assertEqual(stats["extracted"], 2)
+        self.assertEqual(corpus.text("models/guarantee.docx"), "изјава за сериозност на понудата")
+        self.assertEqual(corpus.documents_with("сериозност на"), ["models/guarantee.docx"])
+        self.assertEqual(corpus.documents_with("понуда"), ["models/guarantee.docx", "models/offer.docx"])
+        self.assertEqual(corpus.documents_with("гаранција"), [])
+
+    def test_reload_answers_without_extracting(self) -> None:
+        corpus = self._corpus()
+        corpus.refresh([self.guarantee, self.offer])
+        corpus.documents_with("понуда")
+        corpus.save()
+
+        with mock.patch.object(model_corpus, "corpus_text", side_effect=AssertionError("re-extracted")):
+            reloaded = self._corpus()
+            stats = reloaded.refresh([self.guarantee, self.offer])
+            self.assertEqual(stats["unchanged"], 2)
+            with mock.patch.object(reloaded, "_documents", {}):
+                # Served from the persisted posting list, not by scanning texts.
+                self.assertEqual(reloaded.documents_with("понуда"), ["models/guarantee.docx", "models/offer.docx"])
+
+    def test_touched_file_is_revalidated_by_hash(self) -> None:
+        corpus = self._corpus()
+        corpus.refresh([self.guarantee, self.offer])
+        _bump_mtime(self.offer)
+        with mock.patch.object(model_corpus, "corpus_text", side_effect=AssertionError("re-extracted")):
+            stats = corpus.refresh([self.guarantee, self.offer])
+        self.assertEqual(stats["revalidated"], 1)
+
+    def test_changed_and_removed_files_invalidate_postings(self) -> None:
+        corpus = self._corpus()
+        corpus.refresh([self.guarantee, self.offer])
+        self.assertEqual(corpus.documents_with("гаранција"), [])
+
+        _write_docx(self.offer, "Банкарска гаранција")
+        _bump_mtime(self.offer)
+        stats = corpus.refresh([self.offer])
+        self.assertEqual((stats["extracted"], stats["removed"]), (1, 1))
+        self.assertEqual(corpus.documents, ["models/offer.docx"])
+        self.assertEqual(corpus.documents_with("гаранција"), ["models/offer.docx"])
+        self.assertEqual(self._corpus().documents_with("гаранција"), ["models/offer.docx"])
+
+
+if __name__ == "__main__":
+    unittest.main()
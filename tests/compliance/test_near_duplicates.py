@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import importlib.util
+import random
+import sys
+import unittest
+from difflib import SequenceMatcher
+from pathlib import Path
+
+from app.services.near_duplicates import NearDuplicateIndex
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _load_requirements_builder():
+    spec = importlib.util.spec_from_file_location(
+        "build_true_upload_requirements", REPO_ROOT / "task_force" / "scripts" / "build_true_upload_requirements.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses resolve their module through sys.modules.
+    sys.modules.setdefault(spec.name, module)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _pairwise_keep(fingerprints: list[str], threshold: float) -> list[str]:
+    kept: list[str] = []
+    for fp in fingerprints:
+        if any(fp == seen or SequenceMatcher(None, fp, seen).ratio() >= threshold for seen in kept):
+            continue
+        kept.append(fp)
+    return kept
+
+
+class NearDuplicateIndexTests(unittest.TestCase):
+    def test_exact_and_near_duplicates_are_detected(self) -> None:
+        index = NearDuplicateIndex(threshold=0.88)
+        base = "понудувачот мора да достави важечки сертификат iso 27001 издаден од акредитирано тело"
+        index.add(base)
+        self.assertTrue(index.is_duplicate(base))
+        self.assertTrue(index.is_duplicate(base.replace("важечки", "важечко")))
+        self.assertFalse(index.is_duplicate("рокот за испорака на опремата е најмногу 30 дена од склучување"))
+
+    def test_matches_pairwise_sequence_matcher_semantics(self) -> None:
+        rng = random.Random(7)
+        words = [
+            "понудувач", "мора", "достави", "сертификат", "гаранција", "рок",
+            "испорака", "банкарска", "изјава", "техничка", "спецификација", "услови",
+        ]
+        fingerprints: list[str] = []
+        for _ in range(60):
+            base = " ".join(rng.choice(words) for _ in range(14))
+            fingerprints.append(base)
+            if rng.random() < 0.5:
+                fingerprints.append(base[:-3] + "ата")
+
+        index = NearDuplicateIndex(threshold=0.88)
+        kept: list[str] = []
+        for fp in fingerprints:
+            if index.is_duplicate(fp):
+                continue
+            kept.append(fp)
+            index.add(fp)
+
+        self.assertEqual(kept, _pairwise_keep(fingerprints, 0.88))
+
+    def test_pairs_missed_by_lsh_are_still_found(self) -> None:
+        rng = random.Random(1)
+        words = ["понудувач", "мора", "достави", "сертификат", "гаранција", "рок", "испорака", "изјава", "услови"]
+        checked = 0
+        for _ in range(600):
+            base = " ".join(rng.choice(words) for _ in range(rng.randint(4, 16)))
+            edited = list(base)
+            for _ in range(rng.randint(1, max(2, len(base) // 8))):
+                pos = rng.randrange(len(edited))
+                op = rng.random()
+                if op < 0.4 and len(edited) > 1:
+                    del edited[pos]
+                elif op < 0.7:
+                    edited.insert(pos, rng.choice("абвгд "))
+                else:
+                    edited[pos] = rng.choice("абвгд ")
+            variant = "".join(edited)
+            expected = SequenceMatcher(None, variant, base).ratio() >= 0.88
+            index = NearDuplicateIndex(threshold=0.88)
+            index.add(base)
+            self.assertEqual(index.is_duplicate(variant), expected, (base, variant))
+            checked += expected
+        self.assertGreater(checked, 400)
+
+    def test_requirements_builder_folds_near_duplicate_evidence(self) -> None:
+        builder = _load_requirements_builder()
+        snippet = "Понудувачот доставува потврда дека не е отворена постапка за стечај, издадена од Централен регистар."
+        snippets = {
+            snippet,
+            snippet.replace(" дека", "  дека") + " ",
+            snippet[:-12],
+            "Понудувачот доставува важечка лиценца за вршење на дејноста.",
+        }
+        self.assertEqual(builder.count_distinct_evidence(snippets), 2)
+        self.assertEqual(builder.count_distinct_evidence(set()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+
+from app.services import pdf_metadata
+from app.services.pdf_metadata import PdfDateCache, pdf_embedded_dates
+
+
+def _pdf_with_info(info: bytes, padding: int = 0) -> bytes:
+    """Classic-xref PDF whose Info dictionary (object 4) sits between two ``padding``-byte filler streams."""
+    filler = b"<< /Length %d >>\nstream\n" % padding + b"x" * padding + b"\nendstream"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [] /Count 0 >>",
+        filler,
+        info,
+        filler,
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R /Info 4 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+class PdfMetadataTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_pdf_metadata"
+        self.case_dir = root / str(uuid.uuid4())
+        self.case_dir.mkdir(parents=True, exist_ok=True)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.case_dir, ignore_errors=True)
+
+    def test_info_dictionary_is_read_through_the_xref_table(self) -> None:
+        path = self.case_dir / "manual.pdf"
+        # The Info object sits in the middle of a large file, outside the head and tail windows.
+        filler = 3 * pdf_metadata.WINDOW_BYTES
+        path.write_bytes(_pdf_with_info(b"<< /CreationDate (D:20210108120000) /ModDate (D:20230404) >>", filler))
+        data = path.read_bytes()
+        self.assertNotIn(b"/CreationDate", data[: pdf_metadata.WINDOW_BYTES] + data[-pdf_metadata.WINDOW_BYTES :])
+        original = pdf_metadata._scan_dates
+        pdf_metadata._scan_dates = lambda *_args: self.fail("the file should not be scanned")
+        try:
+            self.assertEqual(pdf_embedded_dates(path), ("2021-01-08", "2023-04-04"))
+        finally:
+            pdf_metadata._scan_dates = original
+
+    def test_xmp_and_window_fallbacks(self) -> None:
+        xmp = self.case_dir / "xmp.pdf"
+        xmp.write_bytes(
+            b"%PDF-1.7\n<x:xmpmeta><xmp:CreateDate>2025-04-01T15:29:15+02:00</xmp:CreateDate>"
+            b'<rdf:Description xmp:ModifyDate="2025-04-09T10:00:00Z"/></x:xmpmeta>\n%%EOF\n'
+        )
+        self.assertEqual(pdf_embedded_dates(xmp), ("2025-04-01", "2025-04-09"))
+        self.assertEqual(pdf_embedded_dates(self.case_dir / "notes.docx"), ("", ""))
+
+    def test_cache_reuses_results_until_file_changes(self) -> None:
+        path = self.case_dir / "manual.pdf"
+        path.write_bytes(_pdf_with_info(b"<< /CreationDate (D:20220221) /ModDate (D:20220222) >>"))
+        cache_path = self.case_dir / "cache.json"
+        cache = PdfDateCache(cache_path)
+        self.assertEqual(cache.get(path), ("2022-02-21", "2022-02-22"))
+        cache.save()
+
+        reloaded = PdfDateCache(cache_path)
+        original = pdf_metadata.pdf_embedded_dates
+        pdf_metadata.pdf_embedded_dates = lambda _path: self.fail("cached entry should be used")
+        try:
+            self.assertEqual(reloaded.get(path), ("2022-02-21", "2022-02-22"))
+        finally:
+            pdf_metadata.pdf_embedded_dates = original
+
+        path.write_bytes(_pdf_with_info(b"<< /CreationDate (D:20260213) /ModDate (D:20260214) >>", 10))
+        self.assertEqual(reloaded.get(path), ("2026-02-13", "2026-02-14"))
+
+
+if __name__ == "__main__":
+    unittest.main()
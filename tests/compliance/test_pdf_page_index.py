@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+
+from app.services import pdf_page_index
+from app.services.pdf_page_index import PdfPageIndex, normalize_page_text, normalize_query
+
+from .pdf_fixtures import write_pdf
+
+
+@unittest.skipIf(pdf_page_index.PdfReader is None, "pypdf is not installed")
+class PdfPageIndexTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_pdf_page_index"
+        self.root = root / str(uuid.uuid4())
+        manuals = self.root / "Упатства"
+        manuals.mkdir(parents=True)
+        self.manual = manuals / "Priracnik-ESJN.pdf"
+        write_pdf(
+            self.manual,
+            ["Login with username and password", "Upload each document and attach files", "Submit the notice document"],
+        )
+        self.index_path = self.root / "index.json"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_keyword_matches_and_persistence(self) -> None:
+        index = PdfPageIndex(self.root, self.index_path)
+        self.assertEqual(index.refresh(), {"indexed": 1, "unchanged": 0, "removed": 0, "failed": 0})
+        rel = "Упатства/Priracnik-ESJN.pdf"
+
+        self.assertEqual(index.keyword_pages(rel, "DOCUMENT"), [2, 3])
+        match = index.match_keywords(rel, ["upload", "document", "notice"])
+        self.assertEqual(match.pages, [2, 3])
+        self.assertEqual(match.keywords, ["upload", "document", "notice"])
+        self.assertTrue(match.snippet.startswith("Upload each document"))
+        self.assertEqual([(h.document, h.page) for h in index.search("notice document")], [(rel, 3)])
+
+        reloaded = PdfPageIndex(self.root, self.index_path)
+        self.assertEqual(reloaded.refresh()["unchanged"], 1)
+        self.assertEqual(reloaded.keyword_pages(rel, "password"), [1])
+
+        self.manual.unlink()
+        self.assertEqual(reloaded.refresh()["removed"], 1)
+        self.assertEqual(reloaded.documents, [])
+
+
+class NormalizationTests(unittest.TestCase):
+    def test_macedonian_normalization(self) -> None:
+        # "ѓ" extracted as г + combining acute, soft hyphen inside a word.
+        self.assertEqual(normalize_page_text("Доку\u00adмент  за\nнабавка г\u0301еограф"), "Документ за набавка ѓеограф")
+        # Latin a/e/o typed into a Cyrillic keyword still finds the Cyrillic page text.
+        self.assertEqual(normalize_query("Понуда"), normalize_query("Пoнудa"))
+        self.assertEqual(len(normalize_query("ПоднесуваЊе")), len("ПоднесуваЊе"))
+
+
+if __name__ == "__main__":
+    unittest.main()
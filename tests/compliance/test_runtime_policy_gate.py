@@ -6,7 +6,7 @@ import unittest
 import uuid
 from pathlib import Path
 
-from app.services.runtime_policy import load_runtime_policy_gate
+from app.services.runtime_policy import RuntimePolicyRegistry, load_runtime_policy_gate
 
 
 class RuntimePolicyGateTests(unittest.TestCase):
@@ -63,6 +63,42 @@ class RuntimePolicyGateTests(unittest.TestCase):
         self.assertFalse(decision.allowed)
         self.assertEqual(decision.module, "unknown")
 
+    def test_registry_reloads_only_rules_listed_in_change_manifest(self) -> None:
+        root = self._make_case_dir()
+        try:
+            rules_dir = root / "rules"
+            rules_dir.mkdir(parents=True, exist_ok=True)
+            manifest_path = root / "rule_changes.json"
+            search_rule = {"rule_id": "RULE-SEARCH", "app_module": "search", "approval_state": "draft"}
+            self._write_rule(rules_dir, "search.json", search_rule)
+            self._write_rule(
+                rules_dir,
+                "download.json",
+                {"rule_id": "RULE-DOWNLOAD", "app_module": "download", "approval_state": "approved"},
+            )
+            registry = RuntimePolicyRegistry(rules_dir, manifest_path)
+            self.assertFalse(registry.decide("search").allowed)
+            self.assertTrue(registry.decide("download_selected").allowed)
+            self.assertEqual(registry.apply_change_manifest(), [])
+
+            self._write_rule(rules_dir, "search.json", {**search_rule, "approval_state": "approved"})
+            # Not listed in the manifest, so not re-read.
+            self._write_rule(rules_dir, "download.json", {"rule_id": "RULE-DOWNLOAD", "app_module": "download"})
+            manifest_path.write_text(
+                json.dumps({"sequence": 1, "rules": {"added": [], "updated": ["search.json"]}}), encoding="utf-8"
+            )
+            self.assertEqual(registry.apply_change_manifest(), ["search.json"])
+            self.assertEqual(registry.decide("search").active_rule_ids, ("RULE-SEARCH",))
+            self.assertTrue(registry.decide("download_selected").allowed)
+            self.assertEqual(registry.apply_change_manifest(), [])
+
+            # A skipped sequence means runs were missed: everything is reloaded.
+            manifest_path.write_text(json.dumps({"sequence": 3, "rules": {"updated": []}}), encoding="utf-8")
+            self.assertEqual(registry.apply_change_manifest(), ["download.json", "search.json"])
+            self.assertFalse(registry.decide("download_selected").allowed)
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import shutil
+import threading
+import time
+import unittest
+import uuid
+from pathlib import Path
+
+from app.services.search_backends import (
+    CompositeSearchBackend,
+    HttpSearchBackend,
+    LocalCacheBackend,
+    SearchQuery,
+    parse_notice_rows,
+)
+from app.services.tender_search import TenderRow
+
+NOTICE_PAGE = """
+<table><tbody>
+  <tr><td>1</td><td>Набавка на  интернет услуги</td><td>Општина Охрид</td><td>01.03.2026</td>
+      <td><a class="btn show-documents" data-rel="21-0001">Прикажи</a></td></tr>
+  <tr><td>2</td><td>Сервис на возила</td><td>ЈП Водовод</td><td>05.03.2026</td>
+      <td><a class="show-documents" data-rel="21-0002">Прикажи</a></td></tr>
+</tbody></table>
+"""
+
+
+def _row(dossier: str, title: str = "Интернет") -> TenderRow:
+    return TenderRow(index=1, title=title, institution="Општина", deadline="01.03.2026", dossier_id=dossier)
+
+
+class _FakeBackend:
+    def __init__(self, name: str, rows=(), delay: float = 0.0, error: Exception | None = None, fallback=False):
+        self.name = name
+        self.rows = list(rows)
+        self.delay = delay
+        self.error = error
+        self.fallback = fallback
+        self.last_used_fallback = False
+        self.calls = 0
+
+    def search(self, query: SearchQuery):
+        self.calls += 1
+        self.last_used_fallback = self.fallback
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        yield from self.rows
+
+
+class SearchBackendTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_search_backends"
+        self.root = root / str(uuid.uuid4())
+        self.root.mkdir(parents=True)
+        self.query = SearchQuery(keyword="интернет")
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def test_parse_notice_rows_reads_dossier_links_and_bare_rows(self) -> None:
+        rows = parse_notice_rows(NOTICE_PAGE, source_page=2)
+        self.assertEqual([r.dossier_id for r in rows], ["21-0001", "21-0002"])
+        self.assertEqual(rows[0].title, "Набавка на интернет услуги")
+        self.assertEqual(rows[1].institution, "ЈП Водовод")
+        self.assertEqual({r.source_page for r in rows}, {2})
+
+        bare = parse_notice_rows('<table><tr data-rel="x-1"><td>1</td><td>Title</td><td>Inst</td></tr><tr><td>x</td></tr></table>')
+        self.assertEqual([(r.dossier_id, r.title, r.institution) for r in bare], [("x-1", "Title", "Inst")])
+
+    def test_http_backend_pages_until_a_page_repeats(self) -> None:
+        urls: list[str] = []
+
+        def fetch(url: str, timeout: float) -> str:
+            urls.append(url)
+            return NOTICE_PAGE
+
+        backend = HttpSearchBackend("https://portal.test/notices?q={keyword}&page={page}", fetch=fetch)
+        rows = list(backend.search(SearchQuery(keyword="интернет услуги", collect_all_pages=True, max_pages=5)))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(len(urls), 2)
+        self.assertIn("q=%D0%B8%D0%BD", urls[0])
+
+    def test_chain_falls_through_to_the_next_backend(self) -> None:
+        cache = _FakeBackend("cache")
+        failing = _FakeBackend("http", error=OSError("offline"))
+        live = _FakeBackend("selenium", rows=[_row("21-0001")])
+        composite = CompositeSearchBackend([cache, failing, live])
+
+        outcome = composite.run(self.query)
+        self.assertEqual(outcome.backend, "selenium")
+        self.assertEqual([r.dossier_id for r in outcome.rows], ["21-0001"])
+        self.assertEqual(list(outcome.failures), ["http"])
+        self.assertEqual(live.calls, 1)
+
+    def test_race_takes_the_fastest_non_empty_answer(self) -> None:
+        slow = _FakeBackend("selenium", rows=[_row("slow")], delay=0.5)
+        fast = _FakeBackend("http", rows=[_row("fast")], delay=0.01)
+        composite = CompositeSearchBackend([slow, fast], mode="race")
+
+        outcome = composite.run(self.query)
+        self.assertEqual(outcome.backend, "http")
+        self.assertLess(outcome.elapsed_sec, 0.4)
+
+    def test_latency_budget_and_health_cooldown(self) -> None:
+        release = threading.Event()
+
+        class _Hanging(_FakeBackend):
+            def search(self, query):
+                self.calls += 1
+                release.wait(2)
+                yield from ()
+
+        hanging = _Hanging("http")
+        live = _FakeBackend("selenium", rows=[_row("21-0001")])
+        composite = CompositeSearchBackend(
+            [hanging, live], mode="race", latency_budget_sec=0.2, failure_threshold=1, cooldown_sec=60
+        )
+        self.assertEqual(composite.run(self.query).backend, "selenium")
+
+        chain = CompositeSearchBackend([hanging, live], latency_budget_sec=0.1, failure_threshold=1, cooldown_sec=60)
+        with self.assertRaises(TimeoutError):
+            chain.run(self.query)
+        self.assertEqual([b.name for b in chain.ordered_backends()], ["selenium"])
+        self.assertEqual(chain.run(self.query).backend, "selenium")
+        self.assertEqual(hanging.calls, 2)
+        release.set()
+
+    def test_overrunning_backend_is_not_started_again_until_it_finishes(self) -> None:
+        release = threading.Event()
+
+        class _Browser(_FakeBackend):
+            def search(self, query):
+                self.calls += 1
+                release.wait(2)
+                yield from self.rows
+
+        browser = _Browser("selenium", rows=[_row("21-0001")])
+        composite = CompositeSearchBackend([browser], latency_budget_sec=0.05, failure_threshold=3)
+        with self.assertRaises(TimeoutError):
+            composite.run(self.query)
+        with self.assertRaisesRegex(RuntimeError, "still running"):
+            composite.run(self.query)
+        self.assertEqual(browser.calls, 1)
+
+        release.set()
+        composite._running["selenium"].result(timeout=2)
+        self.assertEqual(composite.run(self.query).backend, "selenium")
+        self.assertEqual(browser.calls, 2)
+
+    def test_every_backend_failing_raises(self) -> None:
+        composite = CompositeSearchBackend(
+            [_FakeBackend("http", error=OSError("offline")), _FakeBackend("selenium", error=ValueError("stale"))]
+        )
+        with self.assertRaisesRegex(RuntimeError, "http: OSError: offline; selenium: ValueError: stale"):
+            composite.run(self.query)
+
+    def test_cache_miss_does_not_hide_a_live_failure(self) -> None:
+        cache = LocalCacheBackend(self.root / "search_cache.json", max_age_sec=60)
+        composite = CompositeSearchBackend([cache, _FakeBackend("selenium", error=ValueError("stale"))], cache=cache)
+        with self.assertRaisesRegex(ValueError, "stale"):
+            composite.run(self.query)
+
+        # A live backend that answers with no rows is an answer, not a failure.
+        empty = CompositeSearchBackend([cache, _FakeBackend("selenium")], cache=cache).run(self.query)
+        self.assertEqual((empty.rows, empty.failures), ([], {}))
+
+    def test_local_cache_answers_repeat_searches_but_not_fallback_rows(self) -> None:
+        cache = LocalCacheBackend(self.root / "search_cache.json", max_age_sec=60)
+        live = _FakeBackend("selenium", rows=[_row("21-0001")])
+        composite = CompositeSearchBackend([cache, live], cache=cache)
+
+        self.assertEqual(composite.run(self.query).backend, "selenium")
+        reloaded = LocalCacheBackend(self.root / "search_cache.json", max_age_sec=60)
+        self.assertEqual(list(reloaded.search(SearchQuery(keyword=" ИНТЕРНЕТ "))), [_row("21-0001")])
+        self.assertEqual(composite.run(self.query).backend, "local_cache")
+        self.assertEqual(live.calls, 1)
+
+        baseline = _FakeBackend("selenium", rows=[_row("any")], fallback=True)
+        other = SearchQuery(keyword="возила")
+        outcome = CompositeSearchBackend([cache, baseline], cache=cache).run(other)
+        self.assertTrue(outcome.used_fallback)
+        self.assertEqual(list(cache.search(other)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
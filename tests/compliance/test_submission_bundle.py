@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import shutil
+import unittest
+import uuid
+import zipfile
+from pathlib import Path
+
+from app.services.submission_bundle import build_submission_bundle, size_limit
+from app.services.workspace_pack import create_workspace_pack
+
+
+class SubmissionBundleTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_submission_bundle"
+        self.case_dir = root / str(uuid.uuid4())
+        self.case_dir.mkdir(parents=True, exist_ok=True)
+        primary = self.case_dir / "Offer.docx"
+        primary.write_bytes(b"PK docx")
+        scan = self.case_dir / "Bank Guarantee.pdf"
+        scan.write_bytes(b"%PDF" + b"\x00" * 50_000)
+        pack = create_workspace_pack(
+            base_output_dir=self.case_dir / "out",
+            dossier_ref="TENDER-7",
+            primary_document_path=primary,
+            required_attachment_paths=[str(scan)],
+        )
+        self.ws_dir = Path(pack["workspace_dir"])
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.case_dir, ignore_errors=True)
+
+    def test_bundle_streams_pack_with_per_file_compression(self) -> None:
+        progress: list[dict] = []
+        summary = build_submission_bundle(self.ws_dir, on_progress=progress.append)
+
+        bundle = Path(summary["bundle_path"])
+        self.assertEqual(bundle, self.ws_dir.with_name("workspace-tender-7.zip"))
+        with zipfile.ZipFile(bundle) as zf:
+            self.assertIsNone(zf.testzip())
+            infos = {info.filename: info for info in zf.infolist()}
+            self.assertEqual(
+                list(infos),
+                ["00-primary-offer.docx", "01-attachment-bank-guarantee.pdf", "checklist.csv", "manifest.json"],
+            )
+            self.assertEqual(infos["01-attachment-bank-guarantee.pdf"].compress_type, zipfile.ZIP_STORED)
+            self.assertEqual(infos["checklist.csv"].compress_type, zipfile.ZIP_DEFLATED)
+            self.assertEqual(zf.read("01-attachment-bank-guarantee.pdf"), (self.ws_dir / "01-attachment-bank-guarantee.pdf").read_bytes())
+        self.assertEqual(progress[-1]["files_done"], 4)
+        self.assertEqual(progress[-1]["bytes_done"], progress[-1]["bytes_total"])
+
+    def test_portal_limits_block_bundle(self) -> None:
+        with self.assertRaises(ValueError) as ctx:
+            build_submission_bundle(self.ws_dir, max_file_bytes=10_000)
+        self.assertIn("01-attachment-bank-guarantee.pdf", str(ctx.exception))
+
+        target = self.case_dir / "bundle.zip"
+        with self.assertRaises(ValueError):
+            build_submission_bundle(self.ws_dir, output_path=target, max_bundle_bytes=1_000)
+        self.assertFalse(target.exists())
+        self.assertEqual([p.name for p in self.case_dir.iterdir() if p.name.endswith(".tmp")], [])
+
+
+    def test_size_limits_come_from_configuration_and_default_to_none(self) -> None:
+        for unset in (None, "", 0, "0"):
+            self.assertIsNone(size_limit(unset))
+        self.assertEqual(size_limit(20_971_520), 20_971_520)
+        self.assertEqual(size_limit("1048576"), 1_048_576)
+        for bad in (-1, "20 MB", True, 1.5j):
+            with self.assertRaises(ValueError):
+                size_limit(bad)
+
+        summary = build_submission_bundle(self.ws_dir, max_file_bytes=size_limit(None), max_bundle_bytes=size_limit(""))
+        self.assertTrue(Path(summary["bundle_path"]).exists())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import os
+import shutil
+import unittest
+import uuid
+import zipfile
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from unittest import mock
+
+from app.services import docx_xml
+from app.services.template_builder import (
+    clear_template_cache,
+    compile_docx_template,
+    extract_placeholders_from_docx,
+    render_docx_template,
+)
+
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
+  <w:body>
+    <w:p><w:r><w:t>Org: {{ORG_</w:t></w:r><w:r><w:t>NAME}}</w:t></w:r></w:p>
+    <w:p><w:r><w:t>Static paragraph</w:t></w:r></w:p>
+  </w:body>
+</w:document>
+"""
+HEADER = """<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:hdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:p><w:r><w:t>Header</w:t></w:r></w:p></w:hdr>
+"""
+
+
+def _write_docx(path: Path, document: str = DOCUMENT) -> None:
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+        zf.writestr("word/document.xml", document)
+        zf.writestr("word/header1.xml", HEADER)
+
+
+def _paragraph_texts(path: Path, name: str = "word/document.xml") -> list[str]:
+    ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+    with zipfile.ZipFile(path) as zf:
+        root = ET.fromstring(zf.read(name))
+    return ["".join(t.text or "" for t in p.findall(".//w:t", ns)) for p in root.findall(".//w:p", ns)]
+
+
+class CompiledTemplateTests(unittest.TestCase):
+    def setUp(self) -> None:
+        clear_template_cache()
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_template_builder"
+        self.case_dir = root / str(uuid.uuid4())
+        self.case_dir.mkdir(parents=True, exist_ok=True)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.case_dir, ignore_errors=True)
+
+    def test_repeated_renders_reuse_compiled_template_and_do_not_leak_values(self) -> None:
+        template = self.case_dir / "template.docx"
+        _write_docx(template)
+
+        first = self.case_dir / "first.docx"
+        second = self.case_dir / "second.docx"
+        render_docx_template(str(template), str(first), {"ORG_NAME": "Alpha"})
+        render_docx_template(str(template), str(second), {"ORG_NAME": "Beta"})
+
+        self.assertIs(compile_docx_template(template), compile_docx_template(template))
+        self.assertEqual(_paragraph_texts(first), ["Org: Alpha", "Static paragraph"])
+        self.assertEqual(_paragraph_texts(second), ["Org: Beta", "Static paragraph"])
+        with zipfile.ZipFile(template) as src, zipfile.ZipFile(second) as out:
+            self.assertEqual(src.read("word/header1.xml"), out.read("word/header1.xml"))
+
+    def test_cache_is_invalidated_when_template_changes(self) -> None:
+        template = self.case_dir / "template.docx"
+        _write_docx(template)
+        self.assertEqual(extract_placeholders_from_docx(str(template)), ["ORG_NAME"])
+
+        _write_docx(template, DOCUMENT.replace("Static paragraph", "{{TENDER_ID}}"))
+        stat_result = template.stat()
+        os.utime(template, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000_000))
+        self.assertEqual(extract_placeholders_from_docx(str(template)), ["ORG_NAME", "TENDER_ID"])
+
+    def test_only_runs_spanned_by_placeholders_are_rewritten(self) -> None:
+        document = DOCUMENT.replace(
+            "<w:p><w:r><w:t>Static paragraph</w:t></w:r></w:p>",
+            "<w:p><w:r><w:rPr><w:b/></w:rPr><w:t>Bold label </w:t></w:r>"
+            "<w:r><w:t>{{TENDER_</w:t></w:r><w:r><w:t>ID}} tail {{UNKNOWN}}</w:t></w:r></w:p>",
+        )
+        template = self.case_dir / "template.docx"
+        output = self.case_dir / "out.docx"
+        _write_docx(template, document)
+
+        compile_docx_template(template).render(output, {"ORG_NAME": "Alpha", "TENDER_ID": "01234-2026"})
+
+        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+        with zipfile.ZipFile(output) as zf:
+            root = ET.fromstring(zf.read("word/document.xml"))
+        runs = [[t.text or "" for t in p.findall(".//w:t", ns)] for p in root.findall(".//w:p", ns)]
+        self.assertEqual(runs[0], ["Org: Alpha", ""])
+        self.assertEqual(runs[1], ["Bold label ", "01234-2026", " tail {{UNKNOWN}}"])
+
+
+    def test_parts_without_placeholders_are_scanned_but_never_parsed(self) -> None:
+        template = self.case_dir / "template.docx"
+        _write_docx(template, DOCUMENT.replace("{{ORG_</w:t></w:r><w:r><w:t>NAME}}", "{</w:t></w:r><w:r><w:t>{ORG_NAME}}"))
+        parsed: list[bytes] = []
+
+        def tracking_fromstring(xml_bytes: bytes):
+            parsed.append(xml_bytes)
+            return real_fromstring(xml_bytes)
+
+        real_fromstring = docx_xml.fromstring
+        with mock.patch.object(docx_xml, "fromstring", tracking_fromstring):
+            compiled = compile_docx_template(template)
+        self.assertEqual(compiled.placeholders, ["ORG_NAME"])
+        self.assertEqual(list(compiled.parts), ["word/document.xml"])
+        self.assertEqual(len(parsed), 1)
+        self.assertIn(b"ORG_NAME", parsed[0])
+
+if __name__ == "__main__":
+    unittest.main()
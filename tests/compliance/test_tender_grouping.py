@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import random
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.services.tender_grouping import ORPHAN_WINDOW_SEC, group_files_by_tender, is_tech_spec, is_tender_document
+
+TENDER_DOC = "тендерска_документација_{}.pdf"
+TECH_SPEC = "техничка спецификација {}.pdf"
+
+
+@dataclass
+class _File:
+    path: Path
+    tender_id: str | None
+
+
+def _nearest_by_scan(items: list[_File], mtimes: dict[Path, float]) -> dict[Path, str | None]:
+    tender_docs = [i for i in items if i.tender_id and "тендерска_документац" in i.path.name]
+    out: dict[Path, str | None] = {}
+    for item in items:
+        if item.tender_id or "техничка спецификац" not in item.path.name:
+            continue
+        out[item.path] = None
+        if not tender_docs:
+            continue
+        nearest = min(tender_docs, key=lambda td: abs(mtimes[td.path] - mtimes[item.path]))
+        if abs(mtimes[nearest.path] - mtimes[item.path]) <= ORPHAN_WINDOW_SEC:
+            out[item.path] = nearest.tender_id
+    return out
+
+
+class TenderGroupingTests(unittest.TestCase):
+    def test_orphan_tech_spec_joins_nearest_tender_within_window(self) -> None:
+        items = [
+            _File(Path(TENDER_DOC.format("01234-2026")), "01234-2026"),
+            _File(Path(TENDER_DOC.format("05678-2026")), "05678-2026"),
+            _File(Path(TECH_SPEC.format("a")), None),
+            _File(Path(TECH_SPEC.format("b")), None),
+            _File(Path("прилог.pdf"), None),
+        ]
+        mtimes = {
+            items[0].path: 1_000.0,
+            items[1].path: 50_000.0,
+            items[2].path: 48_000.0,
+            items[3].path: 50_000.0 + ORPHAN_WINDOW_SEC + 1,
+            items[4].path: 1_000.0,
+        }
+
+        grouped = group_files_by_tender(items, mtimes=mtimes)
+
+        self.assertEqual([i.path for i in grouped["05678-2026"]], [items[1].path, items[2].path])
+        self.assertEqual([i.path for i in grouped["01234-2026"]], [items[0].path])
+        self.assertIsNone(items[3].tender_id)
+        self.assertIsNone(items[4].tender_id)
+
+    def test_tender_filter_claims_orphans_and_drops_other_groups(self) -> None:
+        items = [
+            _File(Path(TENDER_DOC.format("01234-2026")), "01234-2026"),
+            _File(Path(TECH_SPEC.format("a")), None),
+        ]
+        mtimes = {items[0].path: 0.0, items[1].path: 10 * ORPHAN_WINDOW_SEC}
+        grouped = group_files_by_tender(items, mtimes=mtimes, tender_id_filter="09362-2025")
+        self.assertEqual(list(grouped), ["09362-2025"])
+        self.assertEqual(grouped["09362-2025"][0].path, items[1].path)
+
+    def test_document_names_match_with_any_word_separator(self) -> None:
+        for sep in (" ", "_", "-", " - "):
+            self.assertTrue(is_tender_document(Path(f"12345-2025 Тендерска{sep}документација.pdf")))
+            self.assertTrue(is_tech_spec(Path(f"Техничка{sep}спецификација.pdf")))
+        self.assertFalse(is_tender_document(Path("12345-2025 тендерска понуда.pdf")))
+
+    def test_bisect_assignment_matches_linear_scan(self) -> None:
+        rng = random.Random(3)
+        items: list[_File] = []
+        mtimes: dict[Path, float] = {}
+        for i in range(400):
+            if rng.random() < 0.3:
+                item = _File(Path(TENDER_DOC.format(f"{i:05d}-2026")), f"{i:05d}-2026")
+            else:
+                item = _File(Path(TECH_SPEC.format(i)), None)
+            items.append(item)
+            # Coarse timestamps force equal-distance ties.
+            mtimes[item.path] = float(rng.randint(0, 40) * 3600)
+
+        expected = _nearest_by_scan(items, mtimes)
+        group_files_by_tender(items, mtimes=mtimes)
+        for item in items:
+            if item.path in expected:
+                self.assertEqual(item.tender_id, expected[item.path], item.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import json
+import shutil
+import unittest
+import uuid
+from pathlib import Path
+
+from app.services.search_backends import CompositeSearchBackend, SearchQuery
+from app.services.tender_search import TenderRow
+from app.services.tracing import current_span, span, trace, traced
+
+
+@traced()
+def _stage(fail: bool = False) -> int:
+    with span("inner", step=1):
+        if fail:
+            raise ValueError("boom")
+    return 7
+
+
+class _Backend:
+    name = "selenium"
+    last_used_fallback = False
+
+    def search(self, query):
+        _stage()
+        yield TenderRow(index=1, title="Интернет", institution="Општина", deadline="", dossier_id="21-0001")
+
+
+class TracingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_tracing"
+        self.root = root / str(uuid.uuid4())
+        self.trace_path = self.root / "traces.jsonl"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _spans(self) -> list[dict]:
+        return [json.loads(line) for line in self.trace_path.read_text(encoding="utf-8").splitlines()]
+
+    def test_spans_nest_and_export_with_a_summary(self) -> None:
+        logged: list[str] = []
+        with trace("search", export_path=self.trace_path, log=logged.append, keyword="интернет"):
+            self.assertEqual(_stage(), 7)
+            self.assertEqual(_stage(), 7)
+
+        spans = self._spans()
+        by_id = {s["span_id"]: s for s in spans}
+        root = next(s for s in spans if s["parent_id"] is None)
+        self.assertEqual(root["attributes"], {"keyword": "интернет"})
+        inner = [s for s in spans if s["name"] == "inner"]
+        self.assertEqual(len(inner), 2)
+        self.assertTrue(all(by_id[s["parent_id"]]["name"] == "_stage" for s in inner))
+        self.assertEqual({s["trace_id"] for s in spans}, {root["trace_id"]})
+        self.assertEqual(len(logged), 1)
+        self.assertRegex(logged[0], r"^TRACE search total_sec=\d+\.\d\d status=ok _stage=\d+\.\d\dx2 inner=")
+
+    def test_errors_mark_spans_and_propagate(self) -> None:
+        with self.assertRaises(ValueError):
+            with trace("download", export_path=self.trace_path):
+                _stage(fail=True)
+        statuses = {s["name"]: (s["status"], s["error"]) for s in self._spans()}
+        self.assertEqual(statuses["inner"], ("error", "ValueError: boom"))
+        self.assertEqual(statuses["download"], ("error", "ValueError: boom"))
+
+    def test_spans_outside_a_trace_record_nothing(self) -> None:
+        with span("orphan") as orphan:
+            self.assertIsNone(orphan)
+            self.assertIsNone(current_span())
+        self.assertEqual(_stage(), 7)
+        self.assertFalse(self.trace_path.exists())
+
+    def test_backend_threads_join_the_callers_trace(self) -> None:
+        composite = CompositeSearchBackend([_Backend()])
+        with trace("search", export_path=self.trace_path):
+            self.assertEqual(len(composite.run(SearchQuery(keyword="интернет")).rows), 1)
+        names = [s["name"] for s in self._spans()]
+        self.assertEqual(sorted(names), ["_stage", "inner", "search", "search_backend"])
+        self.assertEqual(len({s["trace_id"] for s in self._spans()}), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,34 @@
 from __future__ import annotations
 
 import csv
+import json
+import os
 import shutil
+import stat
 import unittest
 import uuid
 from pathlib import Path
+from unittest import mock
 
-from app.services.workspace_pack import create_workspace_pack
+from app.services import blob_store
+from app.services.blob_store import BLOB_DIR_NAME, materialize_blob, sha256_file, store_blob
+from app.services.workspace_pack import create_workspace_pack, prune_workspace_blobs, verify_workspace_pack
+
+
+_real_unlink = Path.unlink
+
+
+def _windows_unlink(self: Path, missing_ok: bool = False) -> None:
+    """Path.unlink as on Windows, which refuses to remove read-only files."""
+    if self.exists() and not os.stat(self).st_mode & stat.S_IWRITE:
+        raise PermissionError(f"read-only: {self}")
+    _real_unlink(self, missing_ok=missing_ok)
+
+
+def _make_writable(root: Path) -> None:
+    for path in root.rglob("*"):
+        if path.is_file():
+            os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
 
 
 class WorkspacePackTests(unittest.TestCase):
@@ -53,6 +75,197 @@ class WorkspacePackTests(unittest.TestCase):
         finally:
             shutil.rmtree(root, ignore_errors=True)
 
+    def test_attachments_are_stored_once_across_workspaces(self) -> None:
+        root = self._case_dir()
+        try:
+            output_dir = root / "out"
+            primary = root / "Offer.docx"
+            primary.write_text("doc", encoding="utf-8")
+            iso = root / "ISO 9001.pdf"
+            iso.write_bytes(b"%PDF iso" * 1000)
+
+            packs = [
+                create_workspace_pack(
+                    base_output_dir=output_dir,
+                    dossier_ref=f"TENDER-{n}",
+                    primary_document_path=primary,
+                    required_attachment_paths=[str(iso)],
+                )
+                for n in (1, 2)
+            ]
+
+            blobs = [p for p in (output_dir / BLOB_DIR_NAME).rglob("*") if p.is_file()]
+            self.assertEqual(len(blobs), 1)
+            for pack in packs:
+                manifest = json.loads(Path(pack["manifest_path"]).read_text(encoding="utf-8"))
+                attachment = manifest["attachments"][0]
+                self.assertEqual(attachment["sha256"], sha256_file(iso))
+                self.assertIn(attachment["link"], ("reflink", "hardlink", "copy"))
+                self.assertEqual(manifest["primary_sha256"], sha256_file(primary))
+                placed = Path(pack["workspace_dir"]) / attachment["filename"]
+                self.assertEqual(placed.read_bytes(), iso.read_bytes())
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_new_content_is_read_once_and_known_content_not_at_all(self) -> None:
+        root = self._case_dir()
+        try:
+            store_dir = root / BLOB_DIR_NAME
+            first = root / "ISO 9001.pdf"
+            first.write_bytes(b"%PDF iso" * 1000)
+            with mock.patch.object(blob_store, "sha256_file", side_effect=AssertionError("hashed before copy")):
+                sha256, blob = store_blob(store_dir, first)
+            self.assertEqual(sha256, sha256_file(first, use_cache=False))
+
+            with mock.patch.object(blob_store, "copy_with_sha256") as copy:
+                self.assertEqual(store_blob(store_dir, first), (sha256, blob))
+            copy.assert_not_called()
+
+            again = root / "ISO 9001 (copy).pdf"
+            again.write_bytes(first.read_bytes())
+            self.assertEqual(store_blob(store_dir, again), (sha256, blob))
+            self.assertEqual([p for p in store_dir.rglob("*") if p.is_file()], [blob])
+        finally:
+            _make_writable(root)
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_prune_removes_only_unreferenced_blobs(self) -> None:
+        root = self._case_dir()
+        try:
+            output_dir = root / "out"
+            primary = root / "Offer.docx"
+            primary.write_text("doc", encoding="utf-8")
+            annex = root / "Annex.pdf"
+            annex.write_bytes(b"first version")
+            iso = root / "ISO.pdf"
+            iso.write_bytes(b"iso")
+            create_workspace_pack(output_dir, "TENDER-1", primary, [str(annex)])
+            create_workspace_pack(output_dir, "TENDER-2", primary, [str(iso)])
+            old_sha = sha256_file(annex)
+            annex.write_bytes(b"second version")
+            create_workspace_pack(output_dir, "TENDER-1", primary, [str(annex)])
+            store_dir = output_dir / BLOB_DIR_NAME
+            stray_source = root / "stray.pdf"
+            stray_source.write_bytes(b"linked elsewhere")
+            _, stray = store_blob(store_dir, stray_source)
+            try:
+                os.link(stray, root / "kept-by-a-link.pdf")
+            except OSError:
+                self.skipTest("hardlinks are not supported here")
+
+            removed = prune_workspace_blobs(output_dir)
+
+            self.assertEqual(removed, [blob_store.blob_path(store_dir, old_sha)])
+            remaining = {p.name for p in store_dir.rglob("*") if p.is_file()}
+            self.assertEqual(remaining, {sha256_file(annex), sha256_file(iso), stray.name})
+            self.assertEqual(prune_workspace_blobs(output_dir), [])
+        finally:
+            _make_writable(root)
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_replacing_a_linked_workspace_file_keeps_the_blob_read_only(self) -> None:
+        root = self._case_dir()
+        try:
+            source = root / "Annex.pdf"
+            source.write_bytes(b"annex")
+            _, blob = store_blob(root / BLOB_DIR_NAME, source)
+            target = root / "01-attachment-annex.pdf"
+            try:
+                os.link(blob, target)
+            except OSError:
+                self.skipTest("hardlinks are not supported here")
+            other = root / "Other.pdf"
+            other.write_bytes(b"other")
+            _, other_blob = store_blob(root / BLOB_DIR_NAME, other)
+
+            with mock.patch.object(Path, "unlink", _windows_unlink):
+                materialize_blob(other_blob, target)
+            self.assertEqual(target.read_bytes(), b"other")
+            self.assertEqual(blob.read_bytes(), b"annex")
+            self.assertFalse(os.stat(blob).st_mode & stat.S_IWRITE)
+
+            # A read-only hardlink to something outside the store is left alone.
+            foreign = root / "foreign.pdf"
+            foreign.write_bytes(b"foreign")
+            os.chmod(foreign, stat.S_IREAD)
+            linked = root / "02-attachment-foreign.pdf"
+            os.link(foreign, linked)
+            with mock.patch.object(Path, "unlink", _windows_unlink), self.assertRaises(PermissionError):
+                materialize_blob(other_blob, linked)
+            self.assertFalse(os.stat(foreign).st_mode & stat.S_IWRITE)
+        finally:
+            _make_writable(root)
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_pack_is_regenerated_after_an_attachment_changes(self) -> None:
+        root = self._case_dir()
+        try:
+            output_dir = root / "out"
+            primary = root / "Offer.docx"
+            primary.write_text("doc", encoding="utf-8")
+            annex = root / "Annex.pdf"
+            annex.write_bytes(b"first version")
+            pack_args = dict(
+                base_output_dir=output_dir,
+                dossier_ref="TENDER-1",
+                primary_document_path=primary,
+                required_attachment_paths=[str(annex)],
+            )
+
+            with mock.patch.object(Path, "unlink", _windows_unlink):
+                first = create_workspace_pack(**pack_args)
+                old_sha = json.loads(Path(first["manifest_path"]).read_text(encoding="utf-8"))["attachments"][0]["sha256"]
+                annex.write_bytes(b"second version")
+                second = create_workspace_pack(**pack_args)
+
+            placed = Path(second["workspace_dir"]) / "01-attachment-annex.pdf"
+            self.assertEqual(placed.read_bytes(), b"second version")
+            old_blob = blob_store.blob_path(output_dir / BLOB_DIR_NAME, old_sha)
+            self.assertEqual(old_blob.read_bytes(), b"first version")
+            self.assertFalse(os.stat(old_blob).st_mode & stat.S_IWRITE)
+            self.assertTrue(verify_workspace_pack(second["workspace_dir"])["ok"])
+        finally:
+            _make_writable(root)
+            shutil.rmtree(root, ignore_errors=True)
+
+    def test_verify_workspace_pack_detects_changed_and_missing_files(self) -> None:
+        root = self._case_dir()
+        try:
+            primary = root / "Offer.docx"
+            primary.write_text("doc", encoding="utf-8")
+            annexes = []
+            for n in range(6):
+                annex = root / f"Annex {n}.pdf"
+                annex.write_bytes(bytes([n]) * 5000)
+                annexes.append(str(annex))
+            pack = create_workspace_pack(
+                base_output_dir=root / "out",
+                dossier_ref="TENDER-9",
+                primary_document_path=primary,
+                required_attachment_paths=annexes,
+            )
+            ws_dir = Path(pack["workspace_dir"])
+            with Path(pack["checklist_path"]).open("r", encoding="utf-8", newline="") as handle:
+                rows = list(csv.DictReader(handle))
+            self.assertEqual([row["size_bytes"] for row in rows[1:]], ["5000"] * 6)
+
+            report = verify_workspace_pack(ws_dir)
+            self.assertTrue(report["ok"])
+            self.assertEqual(report["checked"], 7)
+
+            tampered = ws_dir / "02-attachment-annex-1.pdf"
+            tampered.unlink()
+            tampered.write_bytes(b"x" * 5000)
+            (ws_dir / "03-attachment-annex-2.pdf").unlink()
+            report = verify_workspace_pack(ws_dir)
+            self.assertFalse(report["ok"])
+            self.assertEqual(
+                sorted((p["filename"], p["problem"]) for p in report["problems"]),
+                [("02-attachment-annex-1.pdf", "hash_mismatch"), ("03-attachment-annex-2.pdf", "missing")],
+            )
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
     def test_workspace_pack_blocks_missing_required_attachment(self) -> None:
         root = self._case_dir()
         try:
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+import shutil
+import unittest
+import uuid
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+from app.services.zip_stream import copy_zip_entry
+
+
+class ZipStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        root = Path(__file__).resolve().parents[2] / "downloads" / "test_zip_stream"
+        self.case_dir = root / str(uuid.uuid4())
+        self.case_dir.mkdir(parents=True, exist_ok=True)
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.case_dir, ignore_errors=True)
+
+    def test_entries_are_copied_without_recompression(self) -> None:
+        source = self.case_dir / "source.docx"
+        media = os.urandom(200_000) + b"\0" * 200_000
+        with zipfile.ZipFile(source, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("word/document.xml", "<w:document/>")
+            zf.writestr("word/media/image1.png", media)
+            zf.writestr(zipfile.ZipInfo("word/fonts/font1.odttf"), b"font-bytes")  # stored
+
+        target = self.case_dir / "target.docx"
+        with zipfile.ZipFile(source) as zin, zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as zout:
+            with mock.patch.object(zipfile, "_get_decompressor", wraps=zipfile._get_decompressor) as decompressor:
+                for item in zin.infolist():
+                    if item.filename == "word/document.xml":
+                        zout.writestr(item, "<w:document>patched</w:document>")
+                    else:
+                        copy_zip_entry(zin, zout, item)
+            decompressor.assert_not_called()
+
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(target) as out:
+            self.assertIsNone(out.testzip())
+            self.assertEqual(out.namelist(), src.namelist())
+            self.assertEqual(out.read("word/media/image1.png"), media)
+            self.assertEqual(out.read("word/document.xml"), b"<w:document>patched</w:document>")
+            self.assertEqual(out.read("word/fonts/font1.odttf"), b"font-bytes")
+            for name in ("word/media/image1.png", "word/fonts/font1.odttf"):
+                self.assertEqual(out.getinfo(name).compress_type, src.getinfo(name).compress_type)
+                self.assertEqual(out.getinfo(name).date_time, src.getinfo(name).date_time)
+                self.assertEqual(out.getinfo(name).compress_size, src.getinfo(name).compress_size)
+                self.assertEqual(out.getinfo(name).CRC, src.getinfo(name).CRC)
+
+    def test_entries_that_cannot_be_copied_raw_are_streamed(self) -> None:
+        source = self.case_dir / "source.zip"
+        with zipfile.ZipFile(source, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("part.bin", b"payload" * 1000)
+
+        target = self.case_dir / "target.zip"
+        with zipfile.ZipFile(source) as zin, zipfile.ZipFile(target, "w") as zout:
+            info = zin.getinfo("part.bin")
+            with mock.patch("app.services.zip_stream._can_copy_raw", return_value=False):
+                copy_zip_entry(zin, zout, info)
+
+        with zipfile.ZipFile(target) as out:
+            self.assertIsNone(out.testzip())
+            self.assertEqual(out.read("part.bin"), b"payload" * 1000)
+            self.assertEqual(out.getinfo("part.bin").compress_type, zipfile.ZIP_DEFLATED)
+
+
+if __name__ == "__main__":
+    unittest.main()